@@ -34,6 +34,10 @@ async def get_engine_status(request: Request):
     coordinator = getattr(request.app.state, 'coordinator', None)
 
     if coordinator:
+        try:
+            await coordinator.get_portfolio_snapshot()
+        except Exception as e:
+            logger.warning("portfolio_snapshot_failed", error=str(e))
         status = coordinator.get_status()
         return EngineStatusResponse(
             state=status.state.value,
@@ -238,25 +242,17 @@ async def get_trading_stats():
     async with get_session() as session:
         repo = PositionRepository(session)
 
-        open_count = await repo.count_open_positions()
-        total_pnl = await repo.get_total_pnl()
-        total_funding = await repo.get_total_funding()
-
-        closed = await repo.get_closed_positions(limit=1000)
-        total_positions = len(closed) + open_count
-
-        # Calculate win rate
-        profitable = sum(1 for p in closed if p.realized_pnl and p.realized_pnl > 0)
-        win_rate = (profitable / len(closed) * 100) if closed else 0
+        # Counts, win rate inputs and totals are all aggregated in SQL
+        snapshot = await repo.get_portfolio_snapshot()
 
         return StatsResponse(
-            total_positions=total_positions,
-            open_positions=open_count,
-            closed_positions=len(closed),
-            total_realized_pnl=float(total_pnl),
-            total_funding_collected=float(total_funding),
-            total_fees_paid=0,  # Would need to calculate
-            win_rate=win_rate,
+            total_positions=snapshot.open_positions + snapshot.closed_positions,
+            open_positions=snapshot.open_positions,
+            closed_positions=snapshot.closed_positions,
+            total_realized_pnl=float(snapshot.total_realized_pnl),
+            total_funding_collected=float(snapshot.total_funding_collected),
+            total_fees_paid=float(snapshot.total_fees_paid),
+            win_rate=snapshot.win_rate,
             average_hold_time_hours=None,
         )
 
@@ -309,7 +305,7 @@ async def get_funding_rates(request: Request):
                 predicted_pct = rate_pct
                 if rate.predicted_rate is not None and rate.predicted_rate != 0:
                     # Only use if it looks like a valid funding rate (small value)
-                    pred_val = float(rate.predicted_rate)
+                    pred_val = rate.predicted_rate_f
                     if abs(pred_val) < 1:  # Valid funding rates are < 1 (< 100%)
                         predicted_pct = pred_val * 100
 
@@ -355,7 +351,7 @@ async def get_opportunities(request: Request):
                     "short_exchange": opp.short_exchange,
                     "spread": float(opp.spread),
                     "daily_spread": float(opp.daily_spread),
-                    "expected_daily_profit_usd": float(opp.expected_daily_profit_usd),
+                    "expected_daily_profit_usd": float(opp.expected_daily_profit),
                     "long_rate": float(opp.long_rate),
                     "short_rate": float(opp.short_rate),
                     "seconds_to_funding": opp.seconds_to_funding,
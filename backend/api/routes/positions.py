@@ -132,7 +132,7 @@ async def open_position(request: Request, body: OpenPositionRequest):
 
     # Check risk limits
     can_open, reason = coordinator.risk_manager.can_open_position(
-        body.pair,
+        body.symbol,
         body.size_usd,
     )
     if not can_open:
@@ -144,34 +144,41 @@ async def open_position(request: Request, body: OpenPositionRequest):
     try:
         # Create a manual opportunity object
         from ...engine.detector import ArbitrageOpportunity
+        from datetime import datetime, timezone
         from decimal import Decimal
 
         # Get current rates for the pair
-        rates = coordinator.scanner.get_rates_for_symbol(body.pair)
+        rates = coordinator.scanner.get_rates_for_symbol(body.symbol)
         if body.long_exchange not in rates or body.short_exchange not in rates:
             raise HTTPException(
                 status_code=400,
-                detail=f"Funding rates not available for {body.pair} on specified exchanges"
+                detail=f"Funding rates not available for {body.symbol} on specified exchanges"
             )
 
         long_rate = rates[body.long_exchange]
         short_rate = rates[body.short_exchange]
 
+        now = datetime.now(timezone.utc)
+        daily_spread = short_rate.daily_rate - long_rate.daily_rate
+        next_funding = min(long_rate.next_funding_time, short_rate.next_funding_time)
+
         opportunity = ArbitrageOpportunity(
-            symbol=body.pair,
+            symbol=body.symbol,
             long_exchange=body.long_exchange,
             short_exchange=body.short_exchange,
+            long_interval_hours=long_rate.interval_hours,
+            short_interval_hours=short_rate.interval_hours,
             long_rate=long_rate.rate,
             short_rate=short_rate.rate,
+            long_daily_rate=long_rate.daily_rate,
+            short_daily_rate=short_rate.daily_rate,
+            daily_spread=daily_spread,
             spread=short_rate.rate - long_rate.rate,
-            daily_spread=(short_rate.daily_rate - long_rate.daily_rate),
-            long_interval_hours=long_rate.interval_hours,
-            short_interval_hours=short_rate.interval_hours,
-            expected_daily_profit_usd=float(short_rate.daily_rate - long_rate.daily_rate) * body.size_usd,
-            seconds_to_funding=min(
-                (long_rate.next_funding_time - long_rate.timestamp).total_seconds(),
-                (short_rate.next_funding_time - short_rate.timestamp).total_seconds(),
-            ),
+            expected_daily_profit=Decimal(str(body.size_usd)) * daily_spread,
+            annualized_apr=daily_spread * Decimal("365") * Decimal("100"),
+            next_funding_time=next_funding,
+            seconds_to_funding=(next_funding - now).total_seconds(),
+            detected_at=now,
         )
 
         # Execute via coordinator
@@ -183,7 +190,7 @@ async def open_position(request: Request, body: OpenPositionRequest):
             # Get the created position
             positions = await position_manager.get_open_positions()
             for pos in positions:
-                if pos.pair == body.pair:
+                if pos.pair == body.symbol:
                     return position_to_response(pos)
 
         raise HTTPException(
@@ -148,7 +148,7 @@ class OpportunityResponse(BaseModel):
     short_rate: float
     spread: float
     spread_percent: float
-    expected_profit_per_funding: float
+    daily_spread: float
     expected_daily_profit: float
     annualized_apr: float
     next_funding_time: datetime
@@ -43,6 +43,9 @@ class ServerWrapper:
             port=port,
             log_level="info",
             access_log=True,
+            # Broadcast frames are identical for every client; per-message
+            # deflate would compress the same bytes once per connection.
+            ws_per_message_deflate=False,
         )
 
         self._server = uvicorn.Server(server_config)
@@ -163,6 +166,7 @@ async def run_server(
         port=port,
         log_level="info",
         access_log=True,
+        ws_per_message_deflate=False,
     )
 
     server = uvicorn.Server(server_config)
@@ -198,4 +202,5 @@ def run_server_sync(
         host=host,
         port=port,
         log_level="info",
+        ws_per_message_deflate=False,
     )
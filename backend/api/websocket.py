@@ -7,7 +7,7 @@ Handles WebSocket connections and broadcasts events to all connected clients.
 import asyncio
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 
 from fastapi import WebSocket
 
@@ -18,6 +18,13 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+# Outbound frames buffered per client before it is considered too slow
+CLIENT_QUEUE_SIZE = 1024
+
+# Close code sent to clients that fall behind (1013 = try again later)
+SLOW_CLIENT_CLOSE_CODE = 1013
+
+
 class WebSocketManager:
     """
     Manages WebSocket connections and broadcasts.
@@ -27,10 +34,15 @@ class WebSocketManager:
     - Broadcast to all clients
     - Event filtering per client
     - Heartbeat for connection health
+
+    Each client has a bounded outbound queue drained by a single writer
+    task, so a broadcast only enqueues the serialized frame per client and
+    one slow socket cannot stall delivery to the others.
     """
 
     def __init__(self):
-        self._connections: Set[WebSocket] = set()
+        self._connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
         self._heartbeat_interval = 30  # seconds
         self._heartbeat_task: Optional[asyncio.Task] = None
 
@@ -47,7 +59,9 @@ class WebSocketManager:
             websocket: WebSocket connection to add
         """
         await websocket.accept()
-        self._connections.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._connections[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer_loop(websocket, queue))
         logger.info("websocket_connected", connections=self.connection_count)
 
         # Start heartbeat if not running
@@ -61,13 +75,58 @@ class WebSocketManager:
         Args:
             websocket: WebSocket connection to remove
         """
-        self._connections.discard(websocket)
-        logger.info("websocket_disconnected", connections=self.connection_count)
+        queue = self._connections.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        if queue is not None:
+            logger.info("websocket_disconnected", connections=self.connection_count)
+
+    async def _writer_loop(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Drain one client's outbound queue; a None frame closes the socket."""
+        try:
+            while True:
+                message = await queue.get()
+                if message is None:
+                    await websocket.close(code=SLOW_CLIENT_CLOSE_CODE)
+                    return
+                await websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("websocket_send_failed", error=str(e))
+        finally:
+            if self._writers.get(websocket) is asyncio.current_task():
+                self.disconnect(websocket)
+
+    def _enqueue(self, websocket: WebSocket, queue: asyncio.Queue, message: str) -> None:
+        """Queue a frame for a client, dropping the client if it has fallen behind."""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("websocket_client_too_slow", queued=queue.qsize())
+            # Discard the backlog and let the writer close the socket; the
+            # dashboard reconnects and receives a fresh initial state.
+            self._connections.pop(websocket, None)
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+    @staticmethod
+    def _encode(event_type: str, data: Dict[str, Any]) -> str:
+        """Serialize an event frame."""
+        return json.dumps({
+            "type": event_type,
+            "data": data,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
 
     async def broadcast(self, event_type: str, data: Dict[str, Any]) -> None:
         """
         Broadcast an event to all connected clients.
 
+        The frame is serialized once and queued for each client's writer.
+
         Args:
             event_type: Event type identifier
             data: Event data payload
@@ -75,45 +134,34 @@ class WebSocketManager:
         if not self._connections:
             return
 
-        message = json.dumps({
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
-
-        # Send to all connections, removing dead ones
-        dead_connections = set()
-
-        for connection in self._connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                dead_connections.add(connection)
+        message = self._encode(event_type, data)
 
-        # Remove dead connections
-        for conn in dead_connections:
-            self._connections.discard(conn)
+        for connection, queue in list(self._connections.items()):
+            self._enqueue(connection, queue, message)
 
     async def send_to(self, websocket: WebSocket, event_type: str, data: Dict[str, Any]) -> None:
         """
         Send an event to a specific client.
 
+        Frames for a connected client go through its outbound queue so they
+        stay ordered with broadcasts.
+
         Args:
             websocket: Target WebSocket connection
             event_type: Event type identifier
             data: Event data payload
         """
-        message = json.dumps({
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
+        message = self._encode(event_type, data)
+
+        queue = self._connections.get(websocket)
+        if queue is not None:
+            self._enqueue(websocket, queue, message)
+            return
 
         try:
             await websocket.send_text(message)
         except Exception as e:
             logger.warning("websocket_send_failed", error=str(e))
-            self._connections.discard(websocket)
 
     async def _heartbeat_loop(self) -> None:
         """Send periodic heartbeats to keep connections alive."""
@@ -125,7 +173,7 @@ class WebSocketManager:
         """
         Send current state to a newly connected client.
 
-        Sends ENGINE_STATUS, STATS, and FUNDING_RATE_UPDATE messages
+        Sends ENGINE_STATUS, STATS, and a single FUNDING_RATE_BATCH message
         so the client has immediate data without waiting for broadcasts.
         """
         # Access app state via the websocket object (no imports needed)
@@ -139,6 +187,7 @@ class WebSocketManager:
         # 1. Send engine status
         if coordinator:
             try:
+                await coordinator.get_portfolio_snapshot()
                 status = coordinator.get_status()
                 await self.send_to(websocket, "ENGINE_STATUS", {
                     "status": status.state.value,
@@ -156,15 +205,12 @@ class WebSocketManager:
         # 2. Send trading stats
         try:
             async with get_session() as session:
-                repo = PositionRepository(session)
-                open_count = await repo.count_open_positions()
-                total_pnl = await repo.get_total_pnl()
-                total_funding = await repo.get_total_funding()
+                snapshot = await PositionRepository(session).get_portfolio_snapshot()
 
                 await self.send_to(websocket, "STATS", {
-                    "open_positions": open_count,
-                    "total_realized_pnl": float(total_pnl),
-                    "total_funding_collected": float(total_funding),
+                    "open_positions": snapshot.open_positions,
+                    "total_realized_pnl": float(snapshot.total_realized_pnl),
+                    "total_funding_collected": float(snapshot.total_funding_collected),
                 })
         except Exception as e:
             logger.warning("initial_state_stats_failed", error=str(e))
@@ -173,18 +219,22 @@ class WebSocketManager:
         if coordinator and hasattr(coordinator, 'scanner') and coordinator.scanner:
             try:
                 rates = coordinator.scanner.get_rates()
-                for exchange, exchange_rates in rates.items():
-                    for symbol, rate in exchange_rates.items():
-                        await self.send_to(websocket, "FUNDING_RATE_UPDATE", {
-                            "exchange": exchange,
-                            "pair": rate.symbol,
-                            "rate": float(rate.rate),
-                            "predicted": float(rate.predicted_rate) if rate.predicted_rate else None,
-                            "next_funding_time": rate.next_funding_time.isoformat() if rate.next_funding_time else None,
-                            "interval_hours": rate.interval_hours,
-                            "mark_price": str(rate.mark_price) if rate.mark_price else None,
-                            "index_price": str(rate.index_price) if rate.index_price else None,
-                        })
+                updates = [
+                    {
+                        "exchange": exchange,
+                        "pair": rate.symbol,
+                        "rate": rate.rate_f,
+                        "predicted": rate.predicted_rate_f,
+                        "next_funding_time": rate.next_funding_time.isoformat() if rate.next_funding_time else None,
+                        "interval_hours": rate.interval_hours,
+                        "mark_price": str(rate.mark_price) if rate.mark_price else None,
+                        "index_price": str(rate.index_price) if rate.index_price else None,
+                    }
+                    for exchange, exchange_rates in rates.items()
+                    for rate in exchange_rates.values()
+                ]
+                if updates:
+                    await self.send_to(websocket, "FUNDING_RATE_BATCH", {"updates": updates})
             except Exception as e:
                 logger.warning("initial_state_funding_rates_failed", error=str(e))
 
@@ -207,6 +257,10 @@ class WebSocketManager:
             "funding_collected": funding_collected,
         })
 
+    async def send_position_update_batch(self, updates: List[Dict[str, Any]]) -> None:
+        """Send several position updates as one event."""
+        await self.broadcast("POSITION_UPDATE_BATCH", {"updates": updates})
+
     async def send_funding_rate_update(
         self,
         exchange: str,
@@ -230,6 +284,15 @@ class WebSocketManager:
             "index_price": index_price,
         })
 
+    async def send_funding_rate_batch(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Send a whole scan's funding rates as one event.
+
+        Each update has the same fields as FUNDING_RATE_UPDATE, with
+        next_funding_time already ISO formatted.
+        """
+        await self.broadcast("FUNDING_RATE_BATCH", {"updates": updates})
+
     async def send_price_update(
         self,
         exchange: str,
@@ -4,9 +4,11 @@ Pydantic configuration models for the trading system.
 All configuration is validated at startup to catch errors early.
 """
 
-from typing import Dict, List, Optional
 from decimal import Decimal
-from pydantic import BaseModel, ConfigDict, SecretStr, Field, field_validator
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+from pydantic import BaseModel, ConfigDict, PrivateAttr, SecretStr, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -21,10 +23,14 @@ class ExchangeConfig(BaseModel):
     rate_limit_buffer: float = Field(default=0.1, ge=0, le=1)  # 10% buffer on rate limits
 
 
+# Leverage used when an exchange has no leverage configuration
+DEFAULT_LEVERAGE = 5
+
+
 class LeverageConfig(BaseModel):
     """Leverage settings per symbol."""
 
-    default: int = Field(default=5, ge=1, le=125)
+    default: int = Field(default=DEFAULT_LEVERAGE, ge=1, le=125)
     overrides: Dict[str, int] = Field(default_factory=dict)  # symbol -> leverage
 
     def get_leverage(self, symbol: str) -> int:
@@ -73,6 +79,9 @@ class TradingConfig(BaseModel):
     simulation_mode: bool = Field(default=True)
     min_simulation_hours: int = Field(default=24, ge=0)
 
+    # Flattened (exchange, symbol) -> leverage lookup, built once after validation
+    _leverage_table: Dict[Tuple[str, str], int] = PrivateAttr(default_factory=dict)
+
     @field_validator("symbols")
     @classmethod
     def validate_symbols(cls, v: List[str]) -> List[str]:
@@ -82,6 +91,26 @@ class TradingConfig(BaseModel):
                 raise ValueError(f"Invalid symbol format: {symbol}. Expected format: BTC/USDT:USDT")
         return v
 
+    @model_validator(mode="after")
+    def build_leverage_table(self) -> "TradingConfig":
+        """Precompute (exchange, symbol) -> leverage for the monitored symbols."""
+        self._leverage_table = {
+            (exchange, symbol): cfg.get_leverage(symbol)
+            for exchange, cfg in self.leverage.items()
+            for symbol in self.symbols
+        }
+        return self
+
+    def get_leverage(self, exchange: str, symbol: str) -> int:
+        """Get leverage for an exchange/symbol, falling back to defaults."""
+        leverage = self._leverage_table.get((exchange, symbol))
+        if leverage is not None:
+            return leverage
+        cfg = self.leverage.get(exchange)
+        if cfg is not None:
+            return cfg.get_leverage(symbol)
+        return DEFAULT_LEVERAGE
+
     def calculate_threshold(self, position_size_usd: Decimal) -> Decimal:
         """
         Calculate dynamic daily spread threshold based on position size.
@@ -112,16 +141,27 @@ class DatabaseConfig(BaseModel):
     pool_size: int = Field(default=5, ge=1, le=20)
     max_overflow: int = Field(default=10, ge=0, le=50)
 
-    def get_connection_url(self) -> str:
-        """Generate SQLAlchemy connection URL."""
+    @cached_property
+    def connection_url(self) -> str:
+        """
+        SQLAlchemy connection URL, built once per config instance.
+
+        Credentials are percent-encoded so passwords containing
+        '@', ':' or '/' don't corrupt the URL.
+        """
         if self.driver == "sqlite":
             return f"sqlite+aiosqlite:///{self.sqlite_path}"
         elif self.driver == "postgresql":
-            password = self.password.get_secret_value()
-            return f"postgresql+asyncpg://{self.username}:{password}@{self.host}:{self.port}/{self.database}"
+            username = quote(self.username, safe="")
+            password = quote(self.password.get_secret_value(), safe="")
+            return f"postgresql+asyncpg://{username}:{password}@{self.host}:{self.port}/{self.database}"
         else:
             raise ValueError(f"Unsupported database driver: {self.driver}")
 
+    def get_connection_url(self) -> str:
+        """Generate SQLAlchemy connection URL."""
+        return self.connection_url
+
 
 class TelegramConfig(BaseModel):
     """Telegram alert configuration."""
@@ -8,7 +8,12 @@ from .connection import (
     DatabaseSessionManager,
 )
 from .models import Base, Position, Trade, FundingEvent, PositionStatus
-from .repository import PositionRepository, TradeRepository, FundingEventRepository
+from .repository import (
+    PortfolioSnapshot,
+    PositionRepository,
+    TradeRepository,
+    FundingEventRepository,
+)
 
 __all__ = [
     # Connection management
@@ -24,6 +29,7 @@ __all__ = [
     "FundingEvent",
     "PositionStatus",
     # Repositories
+    "PortfolioSnapshot",
     "PositionRepository",
     "TradeRepository",
     "FundingEventRepository",
@@ -61,6 +61,16 @@ class DatabaseSessionManager:
                 "pool_size": config.pool_size,
                 "max_overflow": config.max_overflow,
                 "pool_pre_ping": True,  # Enable connection health checks
+                "connect_args": {
+                    # Reuse prepared statements for the repeated trade/funding writes
+                    "prepared_statement_cache_size": 256,
+                    "statement_cache_size": 1024,
+                    "server_settings": {
+                        # Small OLTP queries never benefit from JIT compilation
+                        "jit": "off",
+                        "application_name": "fundingarb",
+                    },
+                },
             }
 
         self._engine = create_async_engine(
@@ -21,6 +21,7 @@ from sqlalchemy import (
     Boolean,
     Text,
     Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -74,6 +75,24 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _loaded(obj: Base, key: str) -> Optional[str]:
+    """
+    Get an already-loaded attribute for __repr__ without triggering a load.
+
+    Reads the instance dict directly, so expired or unloaded attributes
+    (and relationships) never emit SQL while an object is being logged.
+    Enums are rendered by name and ids are shortened to 8 characters.
+    """
+    value = obj.__dict__.get(key)
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.name
+    if key == "id":
+        return value[:8]
+    return value
+
+
 class Position(Base):
     """
     Represents a hedged arbitrage position across two exchanges.
@@ -147,13 +166,26 @@ class Position(Base):
     __table_args__ = (
         Index("ix_positions_pair_status", "pair", "status"),
         Index("ix_positions_entry_timestamp", "entry_timestamp"),
+        # Partial indexes matching the open/closed list queries' filter + order
+        Index(
+            "ix_positions_open_entry_timestamp",
+            "entry_timestamp",
+            postgresql_where=text("status = 'OPEN'"),
+            sqlite_where=text("status = 'OPEN'"),
+        ),
+        Index(
+            "ix_positions_closed_close_timestamp",
+            "close_timestamp",
+            postgresql_where=text("status IN ('CLOSED', 'LIQUIDATED')"),
+            sqlite_where=text("status IN ('CLOSED', 'LIQUIDATED')"),
+        ),
     )
 
     def __repr__(self) -> str:
         return (
-            f"<Position(id={self.id[:8]}, pair={self.pair}, "
-            f"long={self.long_exchange}, short={self.short_exchange}, "
-            f"status={self.status.value})>"
+            f"<Position(id={_loaded(self, 'id')}, pair={_loaded(self, 'pair')}, "
+            f"long={_loaded(self, 'long_exchange')}, short={_loaded(self, 'short_exchange')}, "
+            f"status={_loaded(self, 'status')})>"
         )
 
     @property
@@ -233,13 +265,19 @@ class Trade(Base):
     __table_args__ = (
         Index("ix_trades_exchange_order_id", "exchange", "order_id"),
         Index("ix_trades_created_at", "created_at"),
+        Index(
+            "ix_trades_pending_created_at",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
     )
 
     def __repr__(self) -> str:
         return (
-            f"<Trade(id={self.id[:8]}, exchange={self.exchange}, "
-            f"side={self.side.value}, action={self.action.value}, "
-            f"status={self.status.value})>"
+            f"<Trade(id={_loaded(self, 'id')}, exchange={_loaded(self, 'exchange')}, "
+            f"side={_loaded(self, 'side')}, action={_loaded(self, 'action')}, "
+            f"status={_loaded(self, 'status')})>"
         )
 
 
@@ -281,8 +319,8 @@ class FundingEvent(Base):
 
     def __repr__(self) -> str:
         return (
-            f"<FundingEvent(id={self.id[:8]}, exchange={self.exchange}, "
-            f"rate={self.funding_rate}, payment=${self.payment_usd})>"
+            f"<FundingEvent(id={_loaded(self, 'id')}, exchange={_loaded(self, 'exchange')}, "
+            f"side={_loaded(self, 'side')})>"
         )
 
 
@@ -304,4 +342,4 @@ class SystemState(Base):
     )
 
     def __repr__(self) -> str:
-        return f"<SystemState(key={self.key})>"
+        return f"<SystemState(key={_loaded(self, 'key')})>"
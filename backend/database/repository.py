@@ -3,15 +3,24 @@ Repository pattern for data access.
 
 Provides a clean interface for database operations,
 abstracting away SQLAlchemy details from the business logic.
+
+UPDATE/INSERT/DELETE statements run when executed and are committed at
+the session boundary; only create methods flush, to push pending ORM
+instances before statements that may reference them.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Set
 from uuid import UUID
 
-from sqlalchemy import select, update, delete, func, and_
+from sqlalchemy import select, insert, update, delete, func, and_, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.util import identity_key
 
 from .models import (
     Position,
@@ -22,7 +31,68 @@ from .models import (
     OrderSide,
     OrderAction,
     TradeStatus,
+    generate_uuid,
+    utc_now,
+)
+
+
+# Statements for the hot lookups, built once at import so every call reuses
+# the same construct (and its compiled-cache entry) with fresh bind values.
+# List queries use raiseload("*") so an unplanned relationship access fails
+# loudly instead of lazy-loading (MissingGreenlet / N+1) on AsyncSession.
+_SELECT_OPEN_POSITIONS = (
+    select(Position)
+    .options(raiseload("*"))
+    .where(Position.status == PositionStatus.OPEN)
+    .order_by(Position.entry_timestamp.desc())
+)
+_SELECT_OPEN_POSITION_FOR_PAIR = (
+    select(Position)
+    .options(raiseload("*"))
+    .where(Position.pair == bindparam("pair"))
+    .where(Position.status == PositionStatus.OPEN)
 )
+_SELECT_OPEN_PAIRS = select(Position.pair).where(Position.status == PositionStatus.OPEN)
+_COUNT_OPEN_POSITIONS = (
+    select(func.count(Position.id))
+    .where(Position.status == PositionStatus.OPEN)
+)
+_IS_CLOSED = Position.status.in_([PositionStatus.CLOSED, PositionStatus.LIQUIDATED])
+_SELECT_PORTFOLIO_SNAPSHOT = select(
+    func.count(Position.id).filter(Position.status == PositionStatus.OPEN),
+    func.count(Position.id).filter(_IS_CLOSED),
+    func.count(Position.id).filter(_IS_CLOSED, Position.realized_pnl > 0),
+    func.sum(Position.realized_pnl).filter(_IS_CLOSED),
+    func.sum(Position.funding_collected),
+    func.sum(Position.total_fees),
+)
+_SELECT_TRADE_BY_ORDER_ID = (
+    select(Trade)
+    .where(Trade.exchange == bindparam("exchange"))
+    .where(Trade.order_id == bindparam("order_id"))
+)
+# Funding event batches at least this large are written with COPY on PostgreSQL
+_FUNDING_EVENT_COPY_MIN_ROWS = 1000
+
+_SELECT_STATE_VALUE = select(SystemState.value).where(SystemState.key == bindparam("key"))
+
+
+@dataclass
+class PortfolioSnapshot:
+    """Aggregate position figures read in a single query."""
+    open_positions: int
+    total_realized_pnl: Decimal
+    total_funding_collected: Decimal
+    closed_positions: int = 0
+    profitable_positions: int = 0
+    total_fees_paid: Decimal = Decimal("0")
+
+    @property
+    def win_rate(self) -> float:
+        """Percentage of closed positions with positive realized P&L."""
+        if not self.closed_positions:
+            return 0.0
+        return self.profitable_positions / self.closed_positions * 100
 
 
 class PositionRepository:
@@ -32,27 +102,39 @@ class PositionRepository:
         self.session = session
 
     async def get_by_id(self, position_id: str) -> Optional[Position]:
-        """Get a position by ID."""
-        result = await self.session.execute(
-            select(Position).where(Position.id == position_id)
-        )
-        return result.scalar_one_or_none()
+        """
+        Get a position by ID.
+
+        Served from the session's identity map when the position is already
+        loaded; update() and close_position() keep those instances in sync.
+        """
+        return await self.session.get(Position, position_id)
 
     async def get_open_positions(self) -> List[Position]:
         """Get all open positions."""
-        result = await self.session.execute(
-            select(Position)
-            .where(Position.status == PositionStatus.OPEN)
-            .order_by(Position.entry_timestamp.desc())
-        )
+        result = await self.session.execute(_SELECT_OPEN_POSITIONS)
         return list(result.scalars().all())
 
+    async def get_open_pair_set(self) -> Set[str]:
+        """Get the pairs that have an open position, without loading Position objects."""
+        result = await self.session.execute(_SELECT_OPEN_PAIRS)
+        return set(result.scalars().all())
+
+    async def iter_open_position_batches(
+        self,
+        batch_size: int = 100,
+    ) -> AsyncIterator[List[Position]]:
+        """Stream open positions in batches instead of loading them all at once."""
+        result = await self.session.stream_scalars(
+            _SELECT_OPEN_POSITIONS.execution_options(yield_per=batch_size)
+        )
+        async for batch in result.partitions():
+            yield batch
+
     async def get_open_position_for_pair(self, pair: str) -> Optional[Position]:
         """Get open position for a specific pair (max 1 per pair)."""
         result = await self.session.execute(
-            select(Position)
-            .where(Position.pair == pair)
-            .where(Position.status == PositionStatus.OPEN)
+            _SELECT_OPEN_POSITION_FOR_PAIR, {"pair": pair}
         )
         return result.scalar_one_or_none()
 
@@ -64,6 +146,7 @@ class PositionRepository:
         """Get closed positions with pagination."""
         result = await self.session.execute(
             select(Position)
+            .options(raiseload("*"))
             .where(Position.status.in_([PositionStatus.CLOSED, PositionStatus.LIQUIDATED]))
             .order_by(Position.close_timestamp.desc())
             .limit(limit)
@@ -75,6 +158,7 @@ class PositionRepository:
         """Get all positions."""
         result = await self.session.execute(
             select(Position)
+            .options(raiseload("*"))
             .order_by(Position.entry_timestamp.desc())
             .limit(limit)
         )
@@ -83,8 +167,9 @@ class PositionRepository:
     async def create(self, position: Position) -> Position:
         """Create a new position."""
         self.session.add(position)
+        # Column defaults are all client-side, so the flush already leaves
+        # them on the instance; a refresh() would only re-SELECT the row.
         await self.session.flush()
-        await self.session.refresh(position)
         return position
 
     async def update(self, position_id: str, **kwargs) -> None:
@@ -94,7 +179,6 @@ class PositionRepository:
             .where(Position.id == position_id)
             .values(**kwargs)
         )
-        await self.session.flush()
 
     async def close_position(
         self,
@@ -103,41 +187,83 @@ class PositionRepository:
         realized_pnl: Decimal,
         long_close_price: Decimal,
         short_close_price: Decimal,
+        total_fees: Optional[Decimal] = None,
     ) -> None:
-        """Close a position with final P&L calculation."""
+        """
+        Close a position with final P&L calculation.
+
+        total_fees, when given, is written in the same UPDATE.
+        """
+        values = dict(
+            status=status,
+            close_timestamp=datetime.now(timezone.utc),
+            realized_pnl=realized_pnl,
+            long_close_price=long_close_price,
+            short_close_price=short_close_price,
+        )
+        if total_fees is not None:
+            values["total_fees"] = total_fees
+
         await self.session.execute(
             update(Position)
             .where(Position.id == position_id)
-            .values(
-                status=status,
-                close_timestamp=datetime.now(timezone.utc),
-                realized_pnl=realized_pnl,
-                long_close_price=long_close_price,
-                short_close_price=short_close_price,
-            )
+            .values(**values)
         )
-        await self.session.flush()
 
     async def add_funding(self, position_id: str, amount: Decimal) -> None:
-        """Add funding payment to position."""
-        position = await self.get_by_id(position_id)
-        if position:
-            new_funding = position.funding_collected + amount
-            await self.update(position_id, funding_collected=new_funding)
+        """Add funding payment to position (atomic increment)."""
+        await self.session.execute(
+            update(Position)
+            .where(Position.id == position_id)
+            .values(funding_collected=Position.funding_collected + amount)
+        )
+
+    async def add_funding_many(self, amounts: Dict[str, Decimal]) -> None:
+        """
+        Add funding payments to many positions in one executemany UPDATE.
+
+        Args:
+            amounts: Dict of position_id -> funding amount to add
+        """
+        if not amounts:
+            return
+
+        table = Position.__table__
+        await self.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("position_id"))
+            .values(funding_collected=table.c.funding_collected + bindparam("amount")),
+            [
+                {"position_id": position_id, "amount": amount}
+                for position_id, amount in amounts.items()
+            ],
+        )
+
+        # The Core executemany bypasses the identity map, so bring positions
+        # already loaded in this session up to date with one SELECT
+        loaded = [
+            position_id for position_id in amounts
+            if identity_key(Position, position_id) in self.session.identity_map
+        ]
+        if loaded:
+            await self.session.execute(
+                select(Position)
+                .options(raiseload("*"))
+                .where(Position.id.in_(loaded))
+                .execution_options(populate_existing=True)
+            )
 
     async def add_fees(self, position_id: str, fee: Decimal) -> None:
-        """Add fees to position."""
-        position = await self.get_by_id(position_id)
-        if position:
-            new_fees = position.total_fees + fee
-            await self.update(position_id, total_fees=new_fees)
+        """Add fees to position (atomic increment)."""
+        await self.session.execute(
+            update(Position)
+            .where(Position.id == position_id)
+            .values(total_fees=Position.total_fees + fee)
+        )
 
     async def count_open_positions(self) -> int:
         """Count open positions."""
-        result = await self.session.execute(
-            select(func.count(Position.id))
-            .where(Position.status == PositionStatus.OPEN)
-        )
+        result = await self.session.execute(_COUNT_OPEN_POSITIONS)
         return result.scalar() or 0
 
     async def get_total_pnl(self) -> Decimal:
@@ -155,6 +281,26 @@ class PositionRepository:
         )
         return result.scalar() or Decimal("0")
 
+    async def get_portfolio_snapshot(self) -> PortfolioSnapshot:
+        """Get position counts and P&L/funding/fee totals in one round-trip."""
+        result = await self.session.execute(_SELECT_PORTFOLIO_SNAPSHOT)
+        (
+            open_count,
+            closed_count,
+            profitable_count,
+            total_pnl,
+            total_funding,
+            total_fees,
+        ) = result.one()
+        return PortfolioSnapshot(
+            open_positions=open_count or 0,
+            total_realized_pnl=total_pnl or Decimal("0"),
+            total_funding_collected=total_funding or Decimal("0"),
+            closed_positions=closed_count or 0,
+            profitable_positions=profitable_count or 0,
+            total_fees_paid=total_fees or Decimal("0"),
+        )
+
 
 class TradeRepository:
     """Repository for Trade operations."""
@@ -164,17 +310,12 @@ class TradeRepository:
 
     async def get_by_id(self, trade_id: str) -> Optional[Trade]:
         """Get a trade by ID."""
-        result = await self.session.execute(
-            select(Trade).where(Trade.id == trade_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.session.get(Trade, trade_id)
 
     async def get_by_order_id(self, exchange: str, order_id: str) -> Optional[Trade]:
         """Get a trade by exchange order ID."""
         result = await self.session.execute(
-            select(Trade)
-            .where(Trade.exchange == exchange)
-            .where(Trade.order_id == order_id)
+            _SELECT_TRADE_BY_ORDER_ID, {"exchange": exchange, "order_id": order_id}
         )
         return result.scalar_one_or_none()
 
@@ -182,6 +323,7 @@ class TradeRepository:
         """Get all trades for a position."""
         result = await self.session.execute(
             select(Trade)
+            .options(raiseload("*"))
             .where(Trade.position_id == position_id)
             .order_by(Trade.created_at)
         )
@@ -191,6 +333,7 @@ class TradeRepository:
         """Get recent trades."""
         result = await self.session.execute(
             select(Trade)
+            .options(raiseload("*"))
             .order_by(Trade.created_at.desc())
             .limit(limit)
         )
@@ -200,9 +343,34 @@ class TradeRepository:
         """Create a new trade."""
         self.session.add(trade)
         await self.session.flush()
-        await self.session.refresh(trade)
         return trade
 
+    async def create_many(self, trades: List[Trade]) -> List[Trade]:
+        """
+        Create several trades with one executemany INSERT.
+
+        Trades are append-only, so rows bypass the unit of work; ids and
+        column defaults are assigned here to leave the returned trades populated.
+        """
+        if not trades:
+            return trades
+
+        columns = [attr.key for attr in Trade.__mapper__.column_attrs]
+        rows = []
+        for trade in trades:
+            if trade.id is None:
+                trade.id = generate_uuid()
+            if trade.fee is None:
+                trade.fee = Decimal("0")
+            if trade.status is None:
+                trade.status = TradeStatus.PENDING
+            if trade.created_at is None:
+                trade.created_at = utc_now()
+            rows.append({key: getattr(trade, key) for key in columns})
+
+        await self.session.execute(insert(Trade.__table__), rows)
+        return trades
+
     async def update(self, trade_id: str, **kwargs) -> None:
         """Update trade fields."""
         await self.session.execute(
@@ -210,7 +378,6 @@ class TradeRepository:
             .where(Trade.id == trade_id)
             .values(**kwargs)
         )
-        await self.session.flush()
 
     async def mark_filled(
         self,
@@ -233,7 +400,6 @@ class TradeRepository:
                 executed_at=datetime.now(timezone.utc),
             )
         )
-        await self.session.flush()
 
     async def mark_failed(self, trade_id: str, error_message: str) -> None:
         """Mark a trade as failed."""
@@ -245,7 +411,6 @@ class TradeRepository:
                 error_message=error_message,
             )
         )
-        await self.session.flush()
 
     async def get_pending_trades(self) -> List[Trade]:
         """Get all pending trades."""
@@ -265,15 +430,13 @@ class FundingEventRepository:
 
     async def get_by_id(self, event_id: str) -> Optional[FundingEvent]:
         """Get a funding event by ID."""
-        result = await self.session.execute(
-            select(FundingEvent).where(FundingEvent.id == event_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.session.get(FundingEvent, event_id)
 
     async def get_events_for_position(self, position_id: str) -> List[FundingEvent]:
         """Get all funding events for a position."""
         result = await self.session.execute(
             select(FundingEvent)
+            .options(raiseload("*"))
             .where(FundingEvent.position_id == position_id)
             .order_by(FundingEvent.timestamp)
         )
@@ -283,6 +446,7 @@ class FundingEventRepository:
         """Get recent funding events."""
         result = await self.session.execute(
             select(FundingEvent)
+            .options(raiseload("*"))
             .order_by(FundingEvent.timestamp.desc())
             .limit(limit)
         )
@@ -292,9 +456,55 @@ class FundingEventRepository:
         """Create a new funding event."""
         self.session.add(event)
         await self.session.flush()
-        await self.session.refresh(event)
         return event
 
+    async def create_many(self, events: List[FundingEvent]) -> List[FundingEvent]:
+        """
+        Create several funding events with one executemany INSERT.
+
+        Large batches on PostgreSQL go through asyncpg's COPY protocol instead.
+        Rows bypass the unit of work, so ids and timestamps are assigned here
+        to leave the returned events populated.
+        """
+        if not events:
+            return events
+
+        columns = [attr.key for attr in FundingEvent.__mapper__.column_attrs]
+        rows = []
+        for event in events:
+            if event.id is None:
+                event.id = generate_uuid()
+            if event.timestamp is None:
+                event.timestamp = utc_now()
+            rows.append({key: getattr(event, key) for key in columns})
+
+        if (
+            len(rows) >= _FUNDING_EVENT_COPY_MIN_ROWS
+            and self.session.get_bind().dialect.name == "postgresql"
+        ):
+            await self._copy_rows(rows)
+        else:
+            await self.session.execute(insert(FundingEvent.__table__), rows)
+        return events
+
+    async def _copy_rows(self, rows: List[dict]) -> None:
+        """Write funding event rows with COPY on the session's asyncpg connection."""
+        table = FundingEvent.__table__
+        columns = [column.name for column in table.columns]
+        records = [
+            tuple(
+                row[name].name if isinstance(row[name], OrderSide) else row[name]
+                for name in columns
+            )
+            for row in rows
+        ]
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name, records=records, columns=columns
+        )
+
     async def get_total_funding_for_position(self, position_id: str) -> Decimal:
         """Get total funding for a position."""
         result = await self.session.execute(
@@ -312,33 +522,33 @@ class SystemStateRepository:
 
     async def get(self, key: str) -> Optional[str]:
         """Get a state value by key."""
-        result = await self.session.execute(
-            select(SystemState.value).where(SystemState.key == key)
-        )
+        result = await self.session.execute(_SELECT_STATE_VALUE, {"key": key})
         return result.scalar_one_or_none()
 
     async def set(self, key: str, value: str) -> None:
-        """Set a state value."""
-        # Try to update first
-        result = await self.session.execute(
-            update(SystemState)
-            .where(SystemState.key == key)
-            .values(value=value, updated_at=datetime.now(timezone.utc))
+        """Set a state value (single INSERT ... ON CONFLICT DO UPDATE)."""
+        dialect = self.session.get_bind().dialect.name
+        dialect_insert = pg_insert if dialect == "postgresql" else sqlite_insert
+
+        stmt = dialect_insert(SystemState).values(
+            key=key,
+            value=value,
+            updated_at=datetime.now(timezone.utc),
         )
-
-        # If no rows updated, insert
-        if result.rowcount == 0:
-            state = SystemState(key=key, value=value)
-            self.session.add(state)
-
-        await self.session.flush()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SystemState.key],
+            set_={
+                "value": stmt.excluded.value,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.session.execute(stmt)
 
     async def delete(self, key: str) -> None:
         """Delete a state value."""
         await self.session.execute(
             delete(SystemState).where(SystemState.key == key)
         )
-        await self.session.flush()
 
     async def get_all(self) -> dict:
         """Get all state values as a dictionary."""
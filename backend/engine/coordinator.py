@@ -5,25 +5,66 @@ Orchestrates all engine components and manages the trading loop.
 """
 
 import asyncio
+import time
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional, Callable
+from typing import Awaitable, Dict, List, Optional, Callable, Set, Tuple
 
 from ..config.schema import TradingConfig
 from ..database.connection import get_session
+from ..database.models import Position, OrderSide as DbOrderSide
+from ..database.repository import PortfolioSnapshot, PositionRepository
 from ..exchanges.base import ExchangeAdapter
 from ..exchanges.types import FundingRate
 from ..utils.logging import get_logger
 from .scanner import FundingRateScanner
 from .detector import ArbitrageDetector, ArbitrageOpportunity
 from .executor import ExecutionEngine
-from .position_manager import PositionManager
+from .position_manager import FundingPayment, PositionManager
 from .risk_manager import RiskManager
 
 logger = get_logger(__name__)
 
+# How long a portfolio snapshot is reused before the DB is queried again
+STATUS_CACHE_TTL_MS = 500
+
+# Funding payment sweep cadence, and the back-off after a failed sweep
+FUNDING_CHECK_INTERVAL_SECONDS = 300
+FUNDING_ERROR_BACKOFF_SECONDS = 60
+
+# With no open positions, sweeps are skipped but the DB is re-read this often
+FUNDING_RESYNC_INTERVAL_SECONDS = 3600
+
+# A funding event is picked up by the first sweep within this window after it,
+# and sweeps are pulled forward to run this long after an open pair's funding
+FUNDING_PAYMENT_WINDOW_SECONDS = 300
+FUNDING_SETTLE_SECONDS = 30
+
+# How long stop() lets an in-flight funding sweep finish before cancelling it
+FUNDING_STOP_TIMEOUT_SECONDS = 10
+
+# How long stop() lets an in-flight opportunity (order fills included) finish
+OPPORTUNITY_STOP_TIMEOUT_SECONDS = 60
+
+# Pending alerts kept for the alert sender, and how long stop() waits to drain them
+ALERT_QUEUE_SIZE = 1024
+ALERT_DRAIN_TIMEOUT_SECONDS = 5
+
+# Funding payments smaller than this (USD) are not recorded
+MIN_FUNDING_PAYMENT_USD = Decimal("0.001")
+
+# Alert body sent when a position is opened
+POSITION_OPENED_ALERT = (
+    "Pair: {pair}\n"
+    "Long: {long_exchange} @ ${long_price}\n"
+    "Short: {short_exchange} @ ${short_price}\n"
+    "Size: ${size_usd:,.0f}\n"
+    "Spread: {spread_pct:.4f}%"
+)
+
 # WebSocket manager - imported lazily to avoid circular imports
 _ws_manager = None
 
@@ -96,6 +137,17 @@ class TradingCoordinator:
         self._error_message: Optional[str] = None
         self._last_scan_time: Optional[datetime] = None
         self._last_opportunity_time: Optional[datetime] = None
+        self._portfolio_snapshot: Optional[PortfolioSnapshot] = None
+
+        # Pairs with an open position, kept in step with opens/closes and
+        # reconciled on every funding sweep (None = load from DB)
+        self._open_pairs: Optional[Set[str]] = None
+        self._last_funding_sweep_at: float = 0.0
+        # Last funding time recorded per position and exchange, so a sweep
+        # pulled forward next to another never records the same event twice
+        self._funding_recorded: Dict[str, Dict[str, float]] = {}
+        self._portfolio_snapshot_at: float = 0.0
+        self._portfolio_snapshot_task: Optional[asyncio.Task] = None
 
         # Components
         self.scanner = FundingRateScanner(exchanges)
@@ -113,6 +165,22 @@ class TradingCoordinator:
 
         # Background tasks
         self._funding_task: Optional[asyncio.Task] = None
+        self._opportunity_task: Optional[asyncio.Task] = None
+        self._alert_task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+
+        # Latest rates awaiting opportunity processing; a newer snapshot
+        # replaces one that has not been consumed yet (None = shut down)
+        self._rates_queue: asyncio.Queue[Optional[Dict[str, Dict[str, FundingRate]]]] = (
+            asyncio.Queue(maxsize=1)
+        )
+
+        # Alerts are delivered by a background sender so trading paths never
+        # wait on Telegram/HTTP round-trips
+        self._alert_queue: asyncio.Queue[Tuple[str, str, str]] = asyncio.Queue(
+            maxsize=ALERT_QUEUE_SIZE
+        )
+        self._alerts_dropped = 0
 
         # Set alert callback on risk manager
         if alert_callback:
@@ -138,6 +206,11 @@ class TradingCoordinator:
         self._state = EngineState.STARTING
 
         try:
+            # Start the opportunity consumer before the scanner delivers rates
+            self._open_pairs = None
+            self._rates_queue = asyncio.Queue(maxsize=1)
+            self._opportunity_task = asyncio.create_task(self._opportunity_consumer())
+
             # Start funding rate scanner with async callback
             # The scanner will await our callback directly - no fire-and-forget
             await self.scanner.start(
@@ -146,6 +219,7 @@ class TradingCoordinator:
             )
 
             # Start funding payment tracker
+            self._stop_event.clear()
             self._funding_task = asyncio.create_task(self._funding_loop())
 
             self._state = EngineState.RUNNING
@@ -165,6 +239,9 @@ class TradingCoordinator:
 
         except Exception as e:
             logger.exception("engine_start_failed", error=str(e))
+            if self._opportunity_task:
+                self._opportunity_task.cancel()
+                self._opportunity_task = None
             self._state = EngineState.ERROR
             self._error_message = str(e)
             raise
@@ -177,16 +254,36 @@ class TradingCoordinator:
         logger.info("engine_stopping")
         self._state = EngineState.STOPPING
 
-        # Cancel background tasks
+        # Stop scanner so no new rates are queued
+        await self.scanner.stop()
+
+        # Let the opportunity consumer finish its current snapshot, then exit
+        if self._opportunity_task:
+            self._offer_rates(None)
+            try:
+                await asyncio.wait_for(self._opportunity_task, OPPORTUNITY_STOP_TIMEOUT_SECONDS)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+            self._opportunity_task = None
+
+        # Wake the funding loop so it exits between sweeps; only cancel it
+        # if a sweep is still running after the timeout
+        self._stop_event.set()
         if self._funding_task:
-            self._funding_task.cancel()
             try:
-                await self._funding_task
-            except asyncio.CancelledError:
+                await asyncio.wait_for(self._funding_task, FUNDING_STOP_TIMEOUT_SECONDS)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
                 pass
+            self._funding_task = None
 
-        # Stop scanner
-        await self.scanner.stop()
+        # A cancelled fill wait pulls its own order; cancel any entry order
+        # still tracked, and make sure any unwinding of a half-filled entry
+        # reaches the exchange
+        await self.executor.cancel_all_pending()
+        await self.executor.join_close_tasks()
+
+        # Deliver alerts still queued, then stop the sender
+        await self._stop_alert_sender()
 
         self._state = EngineState.STOPPED
         logger.info("engine_stopped")
@@ -200,158 +297,368 @@ class TradingCoordinator:
 
         while self._state == EngineState.RUNNING:
             try:
-                # Check every 5 minutes for funding payments
-                await asyncio.sleep(300)
+                # Sweep every few minutes, or just after an open pair's funding
+                if await self._wait_for_stop(self._next_funding_wakeup(time.time())):
+                    break
+
+                # Nothing to check while no position is open, apart from an
+                # occasional resync in case the in-memory view drifted
+                if (
+                    self._open_pairs is not None
+                    and not self._open_pairs
+                    and time.monotonic() - self._last_funding_sweep_at < FUNDING_RESYNC_INTERVAL_SECONDS
+                ):
+                    continue
+
+                # Pairs the opportunity consumer opens while this sweep awaits
+                # the network must survive the swap to the swept set below
+                pairs_before_sweep = set(self._open_pairs or ())
 
                 async with get_session() as session:
                     position_manager = PositionManager(session, self.exchanges)
-                    positions = await position_manager.get_open_positions()
-
-                    for position in positions:
-                        await self._check_funding_payment(position_manager, position)
-
-                    # Also check for liquidations
-                    await self._check_liquidations(position_manager, positions)
+                    open_pairs: Set[str] = set()
+                    open_ids: Set[str] = set()
+                    # One clock read per sweep; the window checks are float math
+                    sweep_now_ts = time.time()
+
+                    # Stream open positions so a large portfolio is never fully
+                    # materialized; collect payments for all of them, then write
+                    # them as one batch
+                    payments: List[Tuple[Position, FundingPayment]] = []
+                    async for positions in position_manager.iter_open_position_batches():
+                        open_pairs.update(p.pair for p in positions)
+                        open_ids.update(p.id for p in positions)
+                        payments.extend(await self._check_funding_payments(positions, sweep_now_ts))
+
+                        # Also check for liquidations
+                        await self._check_liquidations(position_manager, positions)
+
+                    self._open_pairs = open_pairs | (
+                        (self._open_pairs or set()) - pairs_before_sweep
+                    )
+                    self._last_funding_sweep_at = time.monotonic()
+                    # Forget funding marks of positions closed outside close_position
+                    for position_id in self._funding_recorded.keys() - open_ids:
+                        del self._funding_recorded[position_id]
+                    await self._record_funding_payments(position_manager, payments)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.exception("funding_loop_error", error=str(e))
-                await asyncio.sleep(60)
+                if await self._wait_for_stop(FUNDING_ERROR_BACKOFF_SECONDS):
+                    break
 
         logger.info("funding_loop_stopped")
 
-    async def _check_funding_payment(self, position_manager, position) -> None:
-        """Check and record funding payment for a position."""
+    def _next_funding_wakeup(self, now_ts: float) -> float:
+        """
+        Seconds until the next funding sweep.
+
+        The regular interval is the upper bound (liquidation checks ride on
+        the sweep). It is shortened to land FUNDING_SETTLE_SECONDS after the
+        next funding time of an open pair in the scanner's cache, and a leg
+        whose funding time has passed without rolling over is retried after
+        the settle delay until its payment window closes.
+        """
+        timeout = float(FUNDING_CHECK_INTERVAL_SECONDS)
+        if not self._open_pairs:
+            return timeout
+
+        for exchange_rates in self.scanner.get_rates().values():
+            for pair in self._open_pairs:
+                rate = exchange_rates.get(pair)
+                if rate is None or not rate.next_funding_time:
+                    continue
+                due_in = rate.next_funding_ts + FUNDING_SETTLE_SECONDS - now_ts
+                if due_in > 0:
+                    timeout = min(timeout, due_in)
+                elif now_ts - rate.next_funding_ts < FUNDING_PAYMENT_WINDOW_SECONDS:
+                    timeout = min(timeout, FUNDING_SETTLE_SECONDS)
+        return timeout
+
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """
+        Sleep until stop() is requested or the timeout elapses.
+
+        Returns:
+            True if the engine is stopping
+        """
         try:
-            # Get current funding rates for this position's pair
-            long_exchange = self.exchanges.get(position.long_exchange)
-            short_exchange = self.exchanges.get(position.short_exchange)
+            await asyncio.wait_for(self._stop_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
-            if not long_exchange or not short_exchange:
-                return
+    async def _check_funding_payments(
+        self,
+        positions: List[Position],
+        now_ts: float,
+    ) -> List[Tuple[Position, FundingPayment]]:
+        """
+        Check funding on several positions.
+
+        The rates for every (exchange, pair) leg are fetched up front and
+        concurrently, then each position is checked against them.
+
+        Args:
+            positions: Open positions to check
+            now_ts: Sweep time as a POSIX timestamp
+        """
+        rates = await self._fetch_leg_rates(positions)
+
+        payments: List[Tuple[Position, FundingPayment]] = []
+        for position in positions:
+            payments.extend(
+                (position, payment)
+                for payment in self._check_funding_payment(position, rates, now_ts)
+            )
+        return payments
+
+    async def _fetch_leg_rates(
+        self,
+        positions: List[Position],
+    ) -> Dict[Tuple[str, str], FundingRate]:
+        """
+        Fetch the current funding rate for each (exchange, pair) leg.
+
+        Pairs are grouped per exchange so each exchange gets one multi-symbol
+        request per sweep, and the exchanges are queried concurrently. An
+        exchange whose request fails is left out of the result.
+        """
+        pairs_by_exchange: Dict[str, Set[str]] = defaultdict(set)
+        for position in positions:
+            for exchange in (position.long_exchange, position.short_exchange):
+                if exchange in self.exchanges:
+                    pairs_by_exchange[exchange].add(position.pair)
+
+        results = await asyncio.gather(
+            *(
+                self.exchanges[exchange].get_funding_rates(sorted(pairs))
+                for exchange, pairs in pairs_by_exchange.items()
+            ),
+            return_exceptions=True,
+        )
+
+        rates: Dict[Tuple[str, str], FundingRate] = {}
+        for exchange, result in zip(pairs_by_exchange, results):
+            if isinstance(result, BaseException):
+                logger.debug("funding_check_error", exchange=exchange, error=str(result))
+                continue
+            for pair in pairs_by_exchange[exchange]:
+                rate = result.get(pair)
+                if rate is not None:
+                    rates[(exchange, pair)] = rate
+        return rates
+
+    def _check_funding_payment(
+        self,
+        position: Position,
+        rates: Dict[Tuple[str, str], FundingRate],
+        now_ts: float,
+    ) -> List[FundingPayment]:
+        """
+        Check whether funding was just paid on either leg of a position.
+
+        Args:
+            position: Open position to check
+            rates: Current funding rates keyed by (exchange, pair)
+            now_ts: Sweep time as a POSIX timestamp
+
+        Returns:
+            Funding payments to record (empty if none are due)
+        """
+        payments: List[FundingPayment] = []
+
+        try:
+            long_rate = rates.get((position.long_exchange, position.pair))
+            short_rate = rates.get((position.short_exchange, position.pair))
+
+            if not long_rate or not short_rate:
+                return payments
 
             # Check if we just passed a funding time
             # This is simplified - in production you'd track the exact funding time
-            from datetime import timedelta
+            # Check if next funding time is in the past (just paid)
+            # or if we're within a few seconds of it
+            recorded = self._funding_recorded.setdefault(position.id, {})
+            for rate, exch_name, size, entry_price, side in [
+                (long_rate, position.long_exchange, position.long_size,
+                 position.long_entry_price, DbOrderSide.LONG),
+                (short_rate, position.short_exchange, position.short_size,
+                 position.short_entry_price, DbOrderSide.SHORT),
+            ]:
+                # Funding is charged on notional: contracts x mark price,
+                # falling back to the entry price if no mark is reported
+                mark_price = rate.mark_price or entry_price
+                # A leg without size or price can never produce a payment
+                if size and mark_price and rate.next_funding_time:
+                    # Calculate time since last funding (assuming 8h intervals)
+                    interval_seconds = rate.interval_hours * 3600
+                    last_funding_ts = rate.next_funding_ts - interval_seconds
+
+                    # If last funding was within the window and not yet seen, record it
+                    if (
+                        now_ts - last_funding_ts < FUNDING_PAYMENT_WINDOW_SECONDS
+                        and last_funding_ts > recorded.get(exch_name, 0.0)
+                    ):
+                        recorded[exch_name] = last_funding_ts
+                        payment = rate.rate * size * mark_price
+                        # Long pays when rate is positive, short receives
+                        if side == DbOrderSide.LONG:
+                            payment = -payment
+
+                        if abs(payment) > MIN_FUNDING_PAYMENT_USD:  # Only record meaningful amounts
+                            payments.append(FundingPayment(
+                                position_id=position.id,
+                                pair=position.pair,
+                                exchange=exch_name,
+                                side=side,
+                                funding_rate=rate.rate,
+                                payment_usd=payment,
+                                position_size=size,
+                            ))
 
-            now = datetime.now(timezone.utc)
+        except Exception as e:
+            logger.error("funding_payment_check_failed", position_id=position.id, error=str(e))
 
-            # Try to get funding rate and check if payment is due
-            try:
-                long_rates = await long_exchange.get_funding_rates([position.pair])
-                short_rates = await short_exchange.get_funding_rates([position.pair])
-
-                long_rate = long_rates.get(position.pair)
-                short_rate = short_rates.get(position.pair)
-
-                if long_rate and short_rate:
-                    # Check if next funding time is in the past (just paid)
-                    # or if we're within a few seconds of it
-                    for rate, exch_name, size, side in [
-                        (long_rate, position.long_exchange, position.long_size, "long"),
-                        (short_rate, position.short_exchange, position.short_size, "short"),
-                    ]:
-                        if rate.next_funding_time:
-                            # Calculate time since last funding (assuming 8h intervals)
-                            interval_seconds = rate.interval_hours * 3600
-                            last_funding = rate.next_funding_time - timedelta(seconds=interval_seconds)
-
-                            # If last funding was within the last 5 minutes, record it
-                            if (now - last_funding).total_seconds() < 300:
-                                payment = float(rate.rate) * float(size or 0)
-                                # Long pays when rate is positive, short receives
-                                if side == "short":
-                                    payment = -payment  # Short receives when rate is positive
-
-                                if abs(payment) > 0.001:  # Only record meaningful amounts
-                                    await position_manager.record_funding_payment(
-                                        position_id=position.id,
-                                        exchange=exch_name,
-                                        rate=float(rate.rate),
-                                        payment_usd=payment,
-                                    )
-
-                                    # Notify callbacks
-                                    for callback in self._on_funding_received:
-                                        try:
-                                            await callback(position, exch_name, payment)
-                                        except Exception as e:
-                                            logger.error("funding_callback_error", error=str(e))
-
-                                    # Broadcast position update with new funding
-                                    await self._broadcast_position_update(
-                                        position_id=position.id,
-                                        status="OPEN",
-                                        unrealized_pnl=None,
-                                        funding_collected=float(position.funding_collected) + payment,
-                                    )
-
-                                    logger.info(
-                                        "funding_payment_recorded",
-                                        position_id=position.id,
-                                        exchange=exch_name,
-                                        payment=payment,
-                                    )
+        return payments
 
-            except Exception as e:
-                logger.debug("funding_check_error", position_id=position.id, error=str(e))
+    async def _record_funding_payments(
+        self,
+        position_manager: PositionManager,
+        payments: List[Tuple[Position, FundingPayment]],
+    ) -> None:
+        """Persist a sweep's funding payments in one batch, then notify listeners."""
+        if not payments:
+            return
 
-        except Exception as e:
-            logger.error("funding_payment_check_failed", error=str(e))
+        try:
+            await position_manager.record_funding_payments([payment for _, payment in payments])
+        except Exception:
+            # Drop the sweep's dedupe marks so the retry records these periods
+            for _, payment in payments:
+                self._funding_recorded.get(payment.position_id, {}).pop(payment.exchange, None)
+            raise
+
+        # New funding totals per position for the broadcasts; the positions
+        # were refreshed by the write, so they already include the payments
+        funding_collected: Dict[str, float] = {}
+
+        for position, payment in payments:
+            amount = float(payment.payment_usd)
+            funding_collected[position.id] = float(position.funding_collected)
+
+            # Notify callbacks
+            await self._dispatch_callbacks(
+                self._on_funding_received,
+                "funding_callback_error",
+                position, payment.exchange, amount,
+            )
+
+            logger.info(
+                "funding_payment_recorded",
+                position_id=position.id,
+                exchange=payment.exchange,
+                payment=amount,
+            )
+
+        # Broadcast each position's new funding total in one event
+        await self._safe_ws(lambda: get_ws_manager().send_position_update_batch([
+            {
+                "position_id": position_id,
+                "status": "OPEN",
+                "unrealized_pnl": None,
+                "funding_collected": collected,
+            }
+            for position_id, collected in funding_collected.items()
+        ]))
 
     async def _check_liquidations(self, position_manager, positions) -> None:
-        """Check for liquidations on open positions."""
+        """Check a batch of open positions for liquidations."""
+        try:
+            liquidated = await self.risk_manager.check_for_liquidations_bulk(positions)
+        except Exception as e:
+            logger.debug("liquidation_check_error", error=str(e))
+            return
+
         for position in positions:
-            try:
-                is_liquidated = await self.risk_manager.check_for_liquidation(
-                    position.pair,
-                    position.long_exchange,
-                    position.short_exchange,
-                )
-                if is_liquidated:
-                    logger.warning(
-                        "liquidation_detected",
-                        position_id=position.id,
-                        pair=position.pair,
-                    )
-                    await self._send_alert(
-                        "ERROR",
-                        "Liquidation Detected",
-                        f"Position {position.id} ({position.pair}) may have been liquidated!",
-                    )
-                    await self._broadcast_alert(
-                        severity="ERROR",
-                        title="Liquidation Detected",
-                        message=f"Position {position.pair} may have been liquidated!",
-                    )
-            except Exception as e:
-                logger.debug("liquidation_check_error", position_id=position.id, error=str(e))
+            if not liquidated.get(position.id):
+                continue
+            logger.warning(
+                "liquidation_detected",
+                position_id=position.id,
+                pair=position.pair,
+            )
+            await self._send_alert(
+                "ERROR",
+                "Liquidation Detected",
+                f"Position {position.id} ({position.pair}) may have been liquidated!",
+            )
+            await self._broadcast_alert(
+                severity="ERROR",
+                title="Liquidation Detected",
+                message=f"Position {position.pair} may have been liquidated!",
+            )
 
     async def _on_rates_update(self, rates: Dict[str, Dict[str, FundingRate]]) -> None:
         """
         Handle funding rate updates from scanner.
 
-        This is now async and called directly by the scanner's polling loop.
-        Sequential await is used instead of fire-and-forget create_task because:
-        - 5 symbols × 4 exchanges = 20 data points (small workload)
-        - 30 second poll interval gives ~29.5 seconds of headroom
-        - Sequential processing takes ~400ms total
-        - Explicit error handling vs silent task failures
+        Called directly by the scanner's polling loop. Rates are broadcast
+        inline (fast, ~40ms for 20 messages); opportunity processing is
+        handed to the single consumer task through a one-slot queue, so a
+        slow execution (order fills can take up to the fill timeout) never
+        stalls polling, and stale snapshots are dropped rather than piled up.
         """
         self._last_scan_time = datetime.now(timezone.utc)
 
-        # Broadcast funding rates via WebSocket (fast, ~40ms for 20 messages)
+        # Broadcast funding rates via WebSocket
         await self._broadcast_rates(rates)
 
-        # Process opportunities (includes DB query + detection + maybe execution)
-        await self._process_opportunities(rates)
+        # Queue for opportunity processing (DB query + detection + maybe execution)
+        self._offer_rates(rates)
+
+    def _offer_rates(self, rates: Optional[Dict[str, Dict[str, FundingRate]]]) -> None:
+        """Queue rates for the consumer, replacing any unconsumed snapshot."""
+        try:
+            self._rates_queue.put_nowait(rates)
+        except asyncio.QueueFull:
+            self._rates_queue.get_nowait()
+            self._rates_queue.put_nowait(rates)
+
+    async def _opportunity_consumer(self) -> None:
+        """Process queued rate snapshots one at a time until shut down."""
+        logger.info("opportunity_consumer_started")
+
+        while True:
+            rates = await self._rates_queue.get()
+            if rates is None:
+                break
+            await self._process_opportunities(rates)
+
+        logger.info("opportunity_consumer_stopped")
 
     async def _broadcast_rates(self, rates: Dict[str, Dict[str, FundingRate]]) -> None:
-        """Broadcast all funding rates via WebSocket."""
-        for exchange, exchange_rates in rates.items():
-            for symbol, rate in exchange_rates.items():
-                await self._broadcast_funding_rate(exchange, rate)
+        """Broadcast all funding rates via WebSocket as a single batch event."""
+        updates = [
+            {
+                "exchange": exchange,
+                "pair": rate.symbol,
+                "rate": rate.rate_f,
+                "predicted": rate.predicted_rate_f,
+                "next_funding_time": rate.next_funding_time.isoformat() if rate.next_funding_time else None,
+                "interval_hours": rate.interval_hours,
+                "mark_price": str(rate.mark_price) if rate.mark_price else None,
+                "index_price": str(rate.index_price) if rate.index_price else None,
+            }
+            for exchange, exchange_rates in rates.items()
+            for rate in exchange_rates.values()
+        ]
+        if not updates:
+            return
+
+        await self._safe_ws(lambda: get_ws_manager().send_funding_rate_batch(updates))
 
     async def _process_opportunities(
         self,
@@ -362,46 +669,48 @@ class TradingCoordinator:
             return
 
         try:
-            async with get_session() as session:
-                position_manager = PositionManager(session, self.exchanges)
+            # Load open pairs only when not yet known, in a short session so
+            # no connection is held while detecting or while entry orders fill
+            if self._open_pairs is None:
+                async with get_session() as session:
+                    self._open_pairs = await PositionManager(session, self.exchanges).get_open_pairs()
+
+            # Find best opportunity
+            opportunity = self.detector.find_best_opportunity(
+                rates,
+                self.config.max_position_per_pair_usd,
+                excluded_pairs=self._open_pairs,
+            )
 
-                # Get currently open pairs
-                open_positions = await position_manager.get_open_positions()
-                open_pairs = [p.pair for p in open_positions]
+            if not opportunity:
+                return
 
-                # Find best opportunity
-                opportunity = self.detector.find_best_opportunity(
-                    rates,
-                    self.config.max_position_per_pair_usd,
-                    excluded_pairs=open_pairs,
-                )
+            self._last_opportunity_time = datetime.now(timezone.utc)
 
-                if not opportunity:
-                    return
+            # Check if we can open this position
+            can_open, reason = self.risk_manager.can_open_position(
+                opportunity.symbol,
+                self.config.max_position_per_pair_usd,
+            )
 
-                self._last_opportunity_time = datetime.now(timezone.utc)
+            if not can_open:
+                logger.debug("cannot_open_position", reason=reason)
+                return
 
-                # Check if we can open this position
-                can_open, reason = self.risk_manager.can_open_position(
-                    opportunity.symbol,
-                    self.config.max_position_per_pair_usd,
+            # Check timing - only enter if we have enough time before funding
+            min_time = self.config.entry_buffer_minutes * 60  # Convert to seconds
+            if opportunity.seconds_to_funding < min_time:
+                logger.debug(
+                    "too_close_to_funding",
+                    seconds_remaining=opportunity.seconds_to_funding,
+                    min_required=min_time,
                 )
+                return
 
-                if not can_open:
-                    logger.debug("cannot_open_position", reason=reason)
-                    return
-
-                # Check timing - only enter if we have enough time before funding
-                min_time = self.config.entry_buffer_minutes * 60  # Convert to seconds
-                if opportunity.seconds_to_funding < min_time:
-                    logger.debug(
-                        "too_close_to_funding",
-                        seconds_remaining=opportunity.seconds_to_funding,
-                        min_required=min_time,
-                    )
-                    return
-
-                # Execute the opportunity
+            # Execute the opportunity in a write session; the session only
+            # checks out a connection once the fills are being recorded
+            async with get_session() as session:
+                position_manager = PositionManager(session, self.exchanges)
                 await self._execute_opportunity(position_manager, opportunity)
 
         except Exception as e:
@@ -432,6 +741,9 @@ class TradingCoordinator:
                 opportunity, result, size_usd
             )
 
+            if self._open_pairs is not None:
+                self._open_pairs.add(opportunity.symbol)
+
             logger.info(
                 "position_opened",
                 position_id=position.id,
@@ -439,11 +751,11 @@ class TradingCoordinator:
             )
 
             # Notify callbacks
-            for callback in self._on_position_opened:
-                try:
-                    await callback(position, opportunity)
-                except Exception as e:
-                    logger.error("position_opened_callback_error", error=str(e))
+            await self._dispatch_callbacks(
+                self._on_position_opened,
+                "position_opened_callback_error",
+                position, opportunity,
+            )
 
             # Broadcast via WebSocket
             await self._broadcast_position_update(
@@ -459,18 +771,22 @@ class TradingCoordinator:
                 long_exchange=opportunity.long_exchange,
                 short_exchange=opportunity.short_exchange,
                 spread=float(opportunity.spread),
-                expected_profit=float(opportunity.expected_daily_profit_usd),
+                expected_profit=float(opportunity.expected_daily_profit),
             )
 
             # Send alert
             await self._send_alert(
                 "INFO",
                 "Position Opened",
-                f"Pair: {opportunity.symbol}\n"
-                f"Long: {opportunity.long_exchange} @ ${result.long_order.average_price if result.long_order else 'N/A'}\n"
-                f"Short: {opportunity.short_exchange} @ ${result.short_order.average_price if result.short_order else 'N/A'}\n"
-                f"Size: ${size_usd:,.0f}\n"
-                f"Spread: {float(opportunity.spread) * 100:.4f}%",
+                POSITION_OPENED_ALERT.format(
+                    pair=opportunity.symbol,
+                    long_exchange=opportunity.long_exchange,
+                    long_price=result.long_order.average_price if result.long_order else "N/A",
+                    short_exchange=opportunity.short_exchange,
+                    short_price=result.short_order.average_price if result.short_order else "N/A",
+                    size_usd=size_usd,
+                    spread_pct=float(opportunity.spread) * 100,
+                ),
             )
 
             # Broadcast trade executed events
@@ -479,18 +795,18 @@ class TradingCoordinator:
                     position_id=position.id,
                     exchange=opportunity.long_exchange,
                     side="BUY",
-                    price=float(result.long_order.average_price) if result.long_order.average_price else 0,
-                    size=float(result.long_order.filled_size),
-                    fee=float(result.long_order.fee),
+                    price=result.long_order.average_price_f,
+                    size=result.long_order.filled_size_f,
+                    fee=result.long_order.fee_f,
                 )
             if result.short_order:
                 await self._broadcast_trade_executed(
                     position_id=position.id,
                     exchange=opportunity.short_exchange,
                     side="SELL",
-                    price=float(result.short_order.average_price) if result.short_order.average_price else 0,
-                    size=float(result.short_order.filled_size),
-                    fee=float(result.short_order.fee),
+                    price=result.short_order.average_price_f,
+                    size=result.short_order.filled_size_f,
+                    fee=result.short_order.fee_f,
                 )
         else:
             logger.warning(
@@ -540,14 +856,17 @@ class TradingCoordinator:
 
             if result.success:
                 closed_position = await position_manager.close_position(position_id, result)
+                if self._open_pairs is not None:
+                    self._open_pairs.discard(position.pair)
+                self._funding_recorded.pop(position_id, None)
                 logger.info("position_closed", position_id=position_id, reason=reason)
 
                 # Notify callbacks
-                for callback in self._on_position_closed:
-                    try:
-                        await callback(closed_position, reason)
-                    except Exception as e:
-                        logger.error("position_closed_callback_error", error=str(e))
+                await self._dispatch_callbacks(
+                    self._on_position_closed,
+                    "position_closed_callback_error",
+                    closed_position, reason,
+                )
 
                 # Broadcast via WebSocket
                 await self._broadcast_position_update(
@@ -563,18 +882,18 @@ class TradingCoordinator:
                         position_id=position_id,
                         exchange=position.long_exchange,
                         side="SELL",
-                        price=float(result.long_order.average_price) if result.long_order.average_price else 0,
-                        size=float(result.long_order.filled_size),
-                        fee=float(result.long_order.fee),
+                        price=result.long_order.average_price_f,
+                        size=result.long_order.filled_size_f,
+                        fee=result.long_order.fee_f,
                     )
                 if result.short_order:
                     await self._broadcast_trade_executed(
                         position_id=position_id,
                         exchange=position.short_exchange,
                         side="BUY",
-                        price=float(result.short_order.average_price) if result.short_order.average_price else 0,
-                        size=float(result.short_order.filled_size),
-                        fee=float(result.short_order.fee),
+                        price=result.short_order.average_price_f,
+                        size=result.short_order.filled_size_f,
+                        fee=result.short_order.fee_f,
                     )
 
                 # Send alert
@@ -604,8 +923,49 @@ class TradingCoordinator:
         """Deactivate the kill switch."""
         self.risk_manager.deactivate_kill_switch()
 
+    async def get_portfolio_snapshot(self) -> PortfolioSnapshot:
+        """
+        Get aggregate position figures, cached for STATUS_CACHE_TTL_MS.
+
+        Frequent status polling reuses the cached snapshot instead of
+        querying the database on every request, and callers arriving while
+        a refresh is in flight await that refresh rather than issuing their own.
+        """
+        now = time.monotonic()
+        if (
+            self._portfolio_snapshot is not None
+            and (now - self._portfolio_snapshot_at) * 1000 < STATUS_CACHE_TTL_MS
+        ):
+            return self._portfolio_snapshot
+
+        if self._portfolio_snapshot_task is None or self._portfolio_snapshot_task.done():
+            self._portfolio_snapshot_task = asyncio.create_task(
+                self._refresh_portfolio_snapshot()
+            )
+        task = self._portfolio_snapshot_task
+        try:
+            # Shield so one cancelled caller does not abort the shared query
+            return await asyncio.shield(task)
+        finally:
+            if task.done() and self._portfolio_snapshot_task is task:
+                self._portfolio_snapshot_task = None
+
+    async def _refresh_portfolio_snapshot(self) -> PortfolioSnapshot:
+        """Query a fresh portfolio snapshot and store it in the cache."""
+        async with get_session() as session:
+            snapshot = await PositionRepository(session).get_portfolio_snapshot()
+        self._portfolio_snapshot = snapshot
+        self._portfolio_snapshot_at = time.monotonic()
+        return snapshot
+
     def get_status(self) -> EngineStatus:
-        """Get current engine status."""
+        """
+        Get current engine status.
+
+        The open position count comes from the last portfolio snapshot;
+        await get_portfolio_snapshot() first for a fresh value.
+        """
+        snapshot = self._portfolio_snapshot
         return EngineStatus(
             state=self._state,
             simulation_mode=self.config.simulation_mode,
@@ -614,7 +974,7 @@ class TradingCoordinator:
                 if exch.is_connected
             ],
             monitored_symbols=list(self.scanner.monitored_symbols),
-            open_positions=0,  # Would need to query DB
+            open_positions=snapshot.open_positions if snapshot else 0,
             last_scan_time=self._last_scan_time,
             last_opportunity_time=self._last_opportunity_time,
             pending_orders=self.executor.pending_orders_count,
@@ -623,12 +983,70 @@ class TradingCoordinator:
         )
 
     async def _send_alert(self, severity: str, title: str, message: str) -> None:
-        """Send alert via callback."""
-        if self._alert_callback:
+        """Queue an alert for the background sender (dropped if the queue is full)."""
+        if not self._alert_callback:
+            return
+
+        if self._alert_task is None or self._alert_task.done():
+            self._alert_task = asyncio.create_task(self._alert_sender())
+
+        try:
+            self._alert_queue.put_nowait((severity, title, message))
+        except asyncio.QueueFull:
+            self._alerts_dropped += 1
+            logger.warning("alert_dropped", title=title, dropped=self._alerts_dropped)
+
+    async def _alert_sender(self) -> None:
+        """Deliver queued alerts through the alert callback, one at a time."""
+        while True:
+            severity, title, message = await self._alert_queue.get()
             try:
                 await self._alert_callback(severity, title, message)
             except Exception as e:
                 logger.error("alert_send_failed", error=str(e))
+            finally:
+                self._alert_queue.task_done()
+
+    async def _stop_alert_sender(self) -> None:
+        """Wait briefly for queued alerts to be delivered, then stop the sender."""
+        if self._alert_task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._alert_queue.join(), ALERT_DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("alert_drain_timeout", pending=self._alert_queue.qsize())
+
+        self._alert_task.cancel()
+        try:
+            await self._alert_task
+        except asyncio.CancelledError:
+            pass
+        self._alert_task = None
+
+    async def _dispatch_callbacks(
+        self,
+        callbacks: List[Callable],
+        error_event: str,
+        *args,
+    ) -> None:
+        """
+        Run event callbacks concurrently.
+
+        Each callback's errors are logged under error_event and do not affect
+        the others, so the caller waits for the slowest callback rather than
+        the sum of all of them.
+        """
+        if not callbacks:
+            return
+
+        async def run(callback: Callable) -> None:
+            try:
+                await callback(*args)
+            except Exception as e:
+                logger.error(error_event, error=str(e))
+
+        await asyncio.gather(*(run(callback) for callback in callbacks), return_exceptions=True)
 
     def on_position_opened(self, callback: Callable) -> None:
         """Register callback for position opened events."""
@@ -651,6 +1069,18 @@ class TradingCoordinator:
 
     # ==================== WebSocket Broadcast Methods ====================
 
+    async def _safe_ws(self, send: Callable[[], Awaitable]) -> None:
+        """
+        Run a WebSocket send; a failed broadcast never affects trading.
+
+        The send is passed as a zero-argument callable so resolving the
+        manager and building the payload happen inside the guard too.
+        """
+        try:
+            await send()
+        except Exception as e:
+            logger.debug("websocket_broadcast_failed", error=str(e))
+
     async def _broadcast_position_update(
         self,
         position_id: str,
@@ -659,16 +1089,12 @@ class TradingCoordinator:
         funding_collected: float,
     ) -> None:
         """Broadcast position update via WebSocket."""
-        try:
-            ws = get_ws_manager()
-            await ws.send_position_update(
-                position_id=position_id,
-                status=status,
-                unrealized_pnl=unrealized_pnl,
-                funding_collected=funding_collected,
-            )
-        except Exception as e:
-            logger.debug("websocket_broadcast_failed", error=str(e))
+        await self._safe_ws(lambda: get_ws_manager().send_position_update(
+            position_id=position_id,
+            status=status,
+            unrealized_pnl=unrealized_pnl,
+            funding_collected=funding_collected,
+        ))
 
     async def _broadcast_trade_executed(
         self,
@@ -680,18 +1106,14 @@ class TradingCoordinator:
         fee: float,
     ) -> None:
         """Broadcast trade executed via WebSocket."""
-        try:
-            ws = get_ws_manager()
-            await ws.send_trade_executed(
-                position_id=position_id,
-                exchange=exchange,
-                side=side,
-                price=price,
-                size=size,
-                fee=fee,
-            )
-        except Exception as e:
-            logger.debug("websocket_broadcast_failed", error=str(e))
+        await self._safe_ws(lambda: get_ws_manager().send_trade_executed(
+            position_id=position_id,
+            exchange=exchange,
+            side=side,
+            price=price,
+            size=size,
+            fee=fee,
+        ))
 
     async def _broadcast_opportunity(
         self,
@@ -702,59 +1124,30 @@ class TradingCoordinator:
         expected_profit: float,
     ) -> None:
         """Broadcast opportunity via WebSocket."""
-        try:
-            ws = get_ws_manager()
-            await ws.send_opportunity(
-                symbol=symbol,
-                long_exchange=long_exchange,
-                short_exchange=short_exchange,
-                spread=spread,
-                expected_profit=expected_profit,
-            )
-        except Exception as e:
-            logger.debug("websocket_broadcast_failed", error=str(e))
+        await self._safe_ws(lambda: get_ws_manager().send_opportunity(
+            symbol=symbol,
+            long_exchange=long_exchange,
+            short_exchange=short_exchange,
+            spread=spread,
+            expected_profit=expected_profit,
+        ))
 
     async def _broadcast_engine_status(self) -> None:
         """Broadcast current engine status via WebSocket."""
-        try:
-            ws = get_ws_manager()
-            await ws.send_engine_status(
-                status=self._state.value,
-                connected_exchanges=[
-                    name for name, exch in self.exchanges.items()
-                    if exch.is_connected
-                ],
-                last_scan=self._last_scan_time,
-                error=self._error_message,
-            )
-        except Exception as e:
-            logger.debug("websocket_broadcast_failed", error=str(e))
-
-    async def _broadcast_funding_rate(self, exchange: str, rate: FundingRate) -> None:
-        """Broadcast funding rate update via WebSocket."""
-        try:
-            ws = get_ws_manager()
-            await ws.send_funding_rate_update(
-                exchange=exchange,
-                pair=rate.symbol,
-                rate=float(rate.rate),
-                predicted=float(rate.predicted_rate) if rate.predicted_rate else None,
-                next_funding_time=rate.next_funding_time,
-                interval_hours=rate.interval_hours,
-                mark_price=str(rate.mark_price) if rate.mark_price else None,
-                index_price=str(rate.index_price) if rate.index_price else None,
-            )
-        except Exception as e:
-            logger.debug("websocket_broadcast_failed", error=str(e))
+        await self._safe_ws(lambda: get_ws_manager().send_engine_status(
+            status=self._state.value,
+            connected_exchanges=[
+                name for name, exch in self.exchanges.items()
+                if exch.is_connected
+            ],
+            last_scan=self._last_scan_time,
+            error=self._error_message,
+        ))
 
     async def _broadcast_alert(self, severity: str, title: str, message: str) -> None:
         """Broadcast alert via WebSocket."""
-        try:
-            ws = get_ws_manager()
-            await ws.send_alert(
-                severity=severity,
-                title=title,
-                message=message,
-            )
-        except Exception as e:
-            logger.debug("websocket_broadcast_failed", error=str(e))
+        await self._safe_ws(lambda: get_ws_manager().send_alert(
+            severity=severity,
+            title=title,
+            message=message,
+        ))
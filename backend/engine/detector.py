@@ -8,7 +8,7 @@ arbitrage opportunities.
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Collection, Dict, List, Optional, Tuple
 
 from ..config.schema import TradingConfig
 from ..exchanges.types import FundingRate, FeeTier
@@ -16,8 +16,20 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Taker fee assumed for exchanges without a known fee tier (0.04%)
+DEFAULT_TAKER_FEE = Decimal("0.0004")
 
-@dataclass
+# Entry and exit fees are amortized over this expected holding period
+FEE_AMORTIZATION_DAYS = Decimal("7")
+
+DAYS_PER_YEAR = Decimal("365")
+
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+_TEN_THOUSAND = Decimal("10000")
+
+
+@dataclass(slots=True)
 class ArbitrageOpportunity:
     """
     Represents an arbitrage opportunity.
@@ -67,12 +79,12 @@ class ArbitrageOpportunity:
     @property
     def spread_percent(self) -> Decimal:
         """Daily spread as percentage."""
-        return self.daily_spread * Decimal("100")
+        return self.daily_spread * _HUNDRED
 
     @property
     def raw_spread_percent(self) -> Decimal:
         """Raw (non-normalized) spread as percentage."""
-        return self.spread * Decimal("100")
+        return self.spread * _HUNDRED
 
     @property
     def is_urgent(self) -> bool:
@@ -115,7 +127,7 @@ class ArbitrageDetector:
         self.fee_tiers = fee_tiers or {}
 
         # Cache for optimization
-        self._last_opportunities: List[ArbitrageOpportunity] = []
+        self._last_opportunities: Tuple[ArbitrageOpportunity, ...] = ()
 
     def calculate_threshold(self, position_size_usd: Decimal) -> Decimal:
         """
@@ -134,7 +146,35 @@ class ArbitrageDetector:
         """
         base = self.config.min_daily_spread_base
         per_10k = self.config.min_daily_spread_per_10k
-        return base + (per_10k * (position_size_usd / Decimal("10000")))
+        return base + (per_10k * (position_size_usd / _TEN_THOUSAND))
+
+    @property
+    def fee_tiers(self) -> Dict[str, FeeTier]:
+        """Fee tiers per exchange; assigning new tiers resets the fee cache."""
+        return self._fee_tiers
+
+    @fee_tiers.setter
+    def fee_tiers(self, fee_tiers: Dict[str, FeeTier]) -> None:
+        self._fee_tiers = fee_tiers
+        self._pair_fee_rates: Dict[Tuple[str, str], Decimal] = {}
+
+    def _pair_fee_rate(self, long_exchange: str, short_exchange: str) -> Decimal:
+        """Round-trip fee rate for an exchange pair, computed once per pair."""
+        key = (long_exchange, short_exchange)
+        rate = self._pair_fee_rates.get(key)
+        if rate is None:
+            rate = _ZERO
+            for exchange in key:
+                if exchange in self._fee_tiers:
+                    fee_rate = self._fee_tiers[exchange].taker_fee
+                else:
+                    # Default conservative fee estimate
+                    fee_rate = DEFAULT_TAKER_FEE
+
+                # Opening and closing = 2 trades per leg
+                rate += fee_rate * 2
+            self._pair_fee_rates[key] = rate
+        return rate
 
     def calculate_fees(
         self,
@@ -153,19 +193,7 @@ class ArbitrageDetector:
         Returns:
             Total fees in USD
         """
-        total_fees = Decimal("0")
-
-        for exchange in [long_exchange, short_exchange]:
-            if exchange in self.fee_tiers:
-                fee_rate = self.fee_tiers[exchange].taker_fee
-            else:
-                # Default conservative fee estimate
-                fee_rate = Decimal("0.0004")  # 0.04%
-
-            # Opening and closing = 2 trades per leg
-            total_fees += position_size_usd * fee_rate * 2
-
-        return total_fees
+        return position_size_usd * self._pair_fee_rate(long_exchange, short_exchange)
 
     def find_opportunities(
         self,
@@ -189,34 +217,32 @@ class ArbitrageDetector:
         """
         threshold = self.calculate_threshold(position_size_usd)
         opportunities: List[ArbitrageOpportunity] = []
-
-        # Get all unique symbols across exchanges
-        all_symbols = set()
-        for exchange_rates in rates.values():
-            all_symbols.update(exchange_rates.keys())
+        now = datetime.now(timezone.utc)
+
+        # Single pass over the snapshot: per symbol, keep the lowest daily
+        # rate (long leg), the highest (short leg) and how many exchanges
+        # quote it. Ties keep the first exchange for the long leg and the
+        # last for the short leg.
+        extremes: Dict[str, List] = {}
+        for exchange, exchange_rates in rates.items():
+            for symbol, rate in exchange_rates.items():
+                daily = rate.daily_rate
+                entry = extremes.get(symbol)
+                if entry is None:
+                    extremes[symbol] = [exchange, rate, exchange, rate, 1]
+                    continue
+                if daily < entry[1].daily_rate:
+                    entry[0], entry[1] = exchange, rate
+                if daily >= entry[3].daily_rate:
+                    entry[2], entry[3] = exchange, rate
+                entry[4] += 1
 
         # Check each symbol for arbitrage
-        for symbol in all_symbols:
-            # Get rates for this symbol across all exchanges
-            symbol_rates: Dict[str, FundingRate] = {}
-            for exchange, exchange_rates in rates.items():
-                if symbol in exchange_rates:
-                    symbol_rates[exchange] = exchange_rates[symbol]
-
+        for symbol, (long_exchange, long_rate_obj, short_exchange, short_rate_obj, quotes) in extremes.items():
             # Need at least 2 exchanges
-            if len(symbol_rates) < 2:
+            if quotes < 2:
                 continue
 
-            # Find the best long (lowest DAILY rate) and short (highest DAILY rate)
-            # Using daily_rate ensures correct comparison across different intervals
-            sorted_rates = sorted(
-                symbol_rates.items(),
-                key=lambda x: x[1].daily_rate,  # Sort by daily normalized rate
-            )
-
-            long_exchange, long_rate_obj = sorted_rates[0]  # Lowest daily rate
-            short_exchange, short_rate_obj = sorted_rates[-1]  # Highest daily rate
-
             # Calculate daily normalized rates
             long_daily_rate = long_rate_obj.daily_rate
             short_daily_rate = short_rate_obj.daily_rate
@@ -235,7 +261,7 @@ class ArbitrageDetector:
                 long_rate_obj.next_funding_time,
                 short_rate_obj.next_funding_time,
             )
-            seconds_to_funding = (next_funding - datetime.now(timezone.utc)).total_seconds()
+            seconds_to_funding = (next_funding - now).total_seconds()
 
             if seconds_to_funding < min_seconds_to_funding:
                 continue
@@ -249,7 +275,7 @@ class ArbitrageDetector:
 
             # For display, we can show profit after amortized fees
             # Assuming average holding period of 7 days for fee amortization
-            daily_fee_amortized = fees / Decimal("7")
+            daily_fee_amortized = fees / FEE_AMORTIZATION_DAYS
             net_daily_profit = expected_daily_profit - daily_fee_amortized
 
             # Skip if not profitable after amortized fees
@@ -257,7 +283,7 @@ class ArbitrageDetector:
                 continue
 
             # Calculate APR from daily profit
-            annualized = (net_daily_profit / position_size_usd) * Decimal("365") * Decimal("100")
+            annualized = (net_daily_profit / position_size_usd) * DAYS_PER_YEAR * _HUNDRED
 
             opportunities.append(ArbitrageOpportunity(
                 symbol=symbol,
@@ -275,20 +301,20 @@ class ArbitrageDetector:
                 annualized_apr=annualized,
                 next_funding_time=next_funding,
                 seconds_to_funding=seconds_to_funding,
-                detected_at=datetime.now(timezone.utc),
+                detected_at=now,
             ))
 
         # Sort by daily spread (highest first) - greedy approach
         opportunities.sort(key=lambda x: x.daily_spread, reverse=True)
 
-        self._last_opportunities = opportunities
+        self._last_opportunities = tuple(opportunities)
         return opportunities
 
     def find_best_opportunity(
         self,
         rates: Dict[str, Dict[str, FundingRate]],
         position_size_usd: Decimal,
-        excluded_pairs: Optional[List[str]] = None,
+        excluded_pairs: Optional[Collection[str]] = None,
     ) -> Optional[ArbitrageOpportunity]:
         """
         Find the single best arbitrage opportunity.
@@ -301,12 +327,14 @@ class ArbitrageDetector:
         Returns:
             Best opportunity or None
         """
+        # find_opportunities keeps the full ranked list for last_opportunities;
+        # the best is the first ranked one not excluded, found without a copy
         opportunities = self.find_opportunities(rates, position_size_usd)
 
-        if excluded_pairs:
-            opportunities = [o for o in opportunities if o.symbol not in excluded_pairs]
+        if not excluded_pairs:
+            return opportunities[0] if opportunities else None
 
-        return opportunities[0] if opportunities else None
+        return next((o for o in opportunities if o.symbol not in excluded_pairs), None)
 
     def evaluate_existing_position(
         self,
@@ -335,7 +363,7 @@ class ArbitrageDetector:
         short_rate = rates.get(short_exchange, {}).get(symbol)
 
         if not long_rate or not short_rate:
-            return False, Decimal("0"), "Missing rate data"
+            return False, _ZERO, "Missing rate data"
 
         # Use daily normalized spread for comparison
         current_daily_spread = short_rate.daily_rate - long_rate.daily_rate
@@ -353,6 +381,6 @@ class ArbitrageDetector:
         return True, current_daily_spread, "Within negative tolerance"
 
     @property
-    def last_opportunities(self) -> List[ArbitrageOpportunity]:
-        """Get last detected opportunities."""
-        return self._last_opportunities.copy()
+    def last_opportunities(self) -> Tuple[ArbitrageOpportunity, ...]:
+        """Get last detected opportunities (immutable, so shared without copying)."""
+        return self._last_opportunities
@@ -8,15 +8,18 @@ leg ordering and failure recovery.
 import asyncio
 import time
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple, Union
 
 from ..config.schema import TradingConfig
 from ..exchanges.base import ExchangeAdapter, CircuitBreakerOpenError
 from ..exchanges.types import (
     Order,
+    OrderBook,
     OrderResult,
     OrderSide,
+    OrderStatus,
     OrderType,
 )
 from ..utils.logging import get_logger
@@ -24,6 +27,38 @@ from .detector import ArbitrageOpportunity
 
 logger = get_logger(__name__)
 
+# Order status polling backoff (seconds) when no update stream is available
+ORDER_POLL_INITIAL_DELAY = 0.05
+ORDER_POLL_MAX_DELAY = 0.5
+
+# Entry pricing: crosses the spread when this share of the top-N book
+# volume sits on our own side, otherwise rests at the mid price
+ENTRY_BOOK_LEVELS = 5
+ENTRY_CROSS_IMBALANCE = 0.7
+
+# The second leg's book is fetched while the first leg rests; it is reused
+# only if it arrived within this many seconds of the first leg's fill
+ENTRY_BOOK_MAX_AGE_SECONDS = 1.0
+
+# Upper bound on each leg's close order during position exit (seconds)
+EXIT_LEG_TIMEOUT_SECONDS = 15
+
+
+def _elapsed_ms(start_ns: int) -> int:
+    """Milliseconds elapsed on the monotonic clock since start_ns."""
+    return (time.monotonic_ns() - start_ns) // 1_000_000
+
+
+def _leg_result(
+    failure_event: str,
+    outcome: Union[OrderResult, BaseException],
+) -> Optional[OrderResult]:
+    """Unwrap a gathered leg outcome, logging it if the leg raised."""
+    if isinstance(outcome, BaseException):
+        logger.error(failure_event, error=str(outcome) or type(outcome).__name__)
+        return None
+    return outcome
+
 
 @dataclass
 class ExecutionResult:
@@ -63,6 +98,12 @@ class ExecutionEngine:
         # Track pending orders
         self._pending_orders: Dict[str, OrderResult] = {}
 
+        # Emergency closes still in flight
+        self._close_tasks: Set[asyncio.Task] = set()
+
+        # Last leverage successfully applied per (exchange, symbol)
+        self._leverage_cache: Dict[Tuple[str, str], int] = {}
+
     async def execute_entry(
         self,
         opportunity: ArbitrageOpportunity,
@@ -85,7 +126,7 @@ class ExecutionEngine:
         Returns:
             ExecutionResult with order details
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         logger.info(
             "executing_entry",
@@ -104,17 +145,20 @@ class ExecutionEngine:
                 opportunity.short_exchange,
             )
 
-            # Get orderbooks to determine execution order and prices
-            long_book = await self.exchanges[opportunity.long_exchange].get_orderbook(
-                opportunity.symbol
-            )
-            short_book = await self.exchanges[opportunity.short_exchange].get_orderbook(
-                opportunity.symbol
+            # Get orderbooks to determine execution order and prices.
+            # Both books are fetched concurrently so they reflect the same moment.
+            long_book, short_book = await asyncio.gather(
+                self.exchanges[opportunity.long_exchange].get_orderbook(
+                    opportunity.symbol
+                ),
+                self.exchanges[opportunity.short_exchange].get_orderbook(
+                    opportunity.symbol
+                ),
             )
 
             # Determine which exchange has lower liquidity (execute first)
-            long_depth = long_book.get_depth("ask", 5)  # We buy, so look at asks
-            short_depth = short_book.get_depth("bid", 5)  # We sell, so look at bids
+            long_depth = long_book.get_depth("ask", ENTRY_BOOK_LEVELS)  # We buy, so look at asks
+            short_depth = short_book.get_depth("bid", ENTRY_BOOK_LEVELS)  # We sell, so look at bids
 
             if long_depth <= short_depth:
                 # Long exchange has lower liquidity - execute long first
@@ -151,11 +195,13 @@ class ExecutionEngine:
                     long_order=None,
                     short_order=None,
                     error_message="Orderbook missing price data (empty bids or asks)",
-                    execution_time_ms=int((time.time() - start_time) * 1000),
+                    execution_time_ms=_elapsed_ms(start_ns),
                 )
 
+            # Legs are sized at the mid price so both carry the same notional.
+            # The second leg is sized after its orderbook refresh.
             first_size = size_usd / first_price
-            second_size = size_usd / second_price
+            first_limit = self._limit_price(first_book, first_side)
 
             # Execute first leg
             logger.info(
@@ -163,18 +209,28 @@ class ExecutionEngine:
                 exchange=first_exchange,
                 side=first_side.value,
                 size=float(first_size),
-                price=float(first_price),
+                price=float(first_limit),
             )
 
-            first_result = await self._execute_with_timeout(
-                first_exchange,
-                opportunity.symbol,
-                first_side,
-                first_size,
-                first_price,
+            # Refresh the second leg's book while the first leg is filling
+            second_book_task = asyncio.create_task(
+                self._fetch_orderbook_timed(second_exchange, opportunity.symbol)
             )
 
+            try:
+                first_result = await self._execute_with_timeout(
+                    first_exchange,
+                    opportunity.symbol,
+                    first_side,
+                    first_size,
+                    first_limit,
+                )
+            except BaseException:
+                self._discard_task(second_book_task)
+                raise
+
             if not first_result or not first_result.is_filled:
+                self._discard_task(second_book_task)
                 logger.warning(
                     "first_leg_failed",
                     exchange=first_exchange,
@@ -185,21 +241,24 @@ class ExecutionEngine:
                     long_order=None,
                     short_order=None,
                     error_message="First leg failed to fill",
-                    execution_time_ms=int((time.time() - start_time) * 1000),
+                    execution_time_ms=_elapsed_ms(start_ns),
                 )
 
             logger.info(
                 "first_leg_filled",
                 exchange=first_exchange,
-                filled_price=float(first_result.average_price or first_price),
-                filled_size=float(first_result.filled_size),
+                filled_price=first_result.average_price_f or float(first_limit),
+                filled_size=first_result.filled_size_f,
             )
 
-            # Execute second leg
-            # Refresh orderbook for better price
-            second_book = await self.exchanges[second_exchange].get_orderbook(
-                opportunity.symbol
-            )
+            # Execute second leg at the refreshed orderbook price. A first leg
+            # that rested before filling leaves the speculative book stale, so
+            # the hedge is then priced off a book fetched after the fill.
+            fetched_at, second_book = await second_book_task
+            if time.monotonic() - fetched_at > ENTRY_BOOK_MAX_AGE_SECONDS:
+                second_book = await self.exchanges[second_exchange].get_orderbook(
+                    opportunity.symbol
+                )
             second_price = second_book.mid_price
 
             if second_price is None:
@@ -208,8 +267,8 @@ class ExecutionEngine:
                     exchange=second_exchange,
                     symbol=opportunity.symbol,
                 )
-                # Close first leg since we can't proceed
-                await self._emergency_close(
+                # Unwind first leg in the background since we can't proceed
+                self._schedule_emergency_close(
                     first_exchange,
                     opportunity.symbol,
                     first_side,
@@ -219,18 +278,19 @@ class ExecutionEngine:
                     success=False,
                     long_order=first_result if first_side == OrderSide.BUY else None,
                     short_order=first_result if first_side == OrderSide.SELL else None,
-                    error_message="Second leg orderbook missing price data, first leg closed",
-                    execution_time_ms=int((time.time() - start_time) * 1000),
+                    error_message="Second leg orderbook missing price data, closing first leg",
+                    execution_time_ms=_elapsed_ms(start_ns),
                 )
 
             second_size = size_usd / second_price
+            second_limit = self._limit_price(second_book, second_side)
 
             logger.info(
                 "executing_second_leg",
                 exchange=second_exchange,
                 side=second_side.value,
                 size=float(second_size),
-                price=float(second_price),
+                price=float(second_limit),
             )
 
             second_result = await self._execute_with_timeout(
@@ -238,7 +298,7 @@ class ExecutionEngine:
                 opportunity.symbol,
                 second_side,
                 second_size,
-                second_price,
+                second_limit,
             )
 
             if not second_result or not second_result.is_filled:
@@ -249,7 +309,7 @@ class ExecutionEngine:
                     second_exchange=second_exchange,
                 )
 
-                await self._emergency_close(
+                self._schedule_emergency_close(
                     first_exchange,
                     opportunity.symbol,
                     first_side,
@@ -260,15 +320,15 @@ class ExecutionEngine:
                     success=False,
                     long_order=first_result if first_side == OrderSide.BUY else None,
                     short_order=first_result if first_side == OrderSide.SELL else None,
-                    error_message="Second leg failed, first leg closed",
-                    execution_time_ms=int((time.time() - start_time) * 1000),
+                    error_message="Second leg failed, closing first leg",
+                    execution_time_ms=_elapsed_ms(start_ns),
                 )
 
             logger.info(
                 "second_leg_filled",
                 exchange=second_exchange,
-                filled_price=float(second_result.average_price or second_price),
-                filled_size=float(second_result.filled_size),
+                filled_price=second_result.average_price_f or float(second_limit),
+                filled_size=second_result.filled_size_f,
             )
 
             # Determine which result is long and which is short
@@ -283,7 +343,7 @@ class ExecutionEngine:
                 success=True,
                 long_order=long_order,
                 short_order=short_order,
-                execution_time_ms=int((time.time() - start_time) * 1000),
+                execution_time_ms=_elapsed_ms(start_ns),
             )
 
         except CircuitBreakerOpenError as e:
@@ -293,7 +353,7 @@ class ExecutionEngine:
                 long_order=None,
                 short_order=None,
                 error_message=f"Circuit breaker open: {e}",
-                execution_time_ms=int((time.time() - start_time) * 1000),
+                execution_time_ms=_elapsed_ms(start_ns),
             )
         except Exception as e:
             logger.exception("execution_error", error=str(e))
@@ -302,7 +362,7 @@ class ExecutionEngine:
                 long_order=None,
                 short_order=None,
                 error_message=str(e),
-                execution_time_ms=int((time.time() - start_time) * 1000),
+                execution_time_ms=_elapsed_ms(start_ns),
             )
 
     async def execute_exit(
@@ -328,7 +388,7 @@ class ExecutionEngine:
         Returns:
             ExecutionResult with close order details
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         logger.info(
             "executing_exit",
@@ -340,34 +400,24 @@ class ExecutionEngine:
         )
 
         try:
-            # Close both legs simultaneously (fire and forget)
-            long_task = asyncio.create_task(
-                self._close_position(long_exchange, symbol, OrderSide.SELL, long_size)
-            )
-            short_task = asyncio.create_task(
-                self._close_position(short_exchange, symbol, OrderSide.BUY, short_size)
-            )
-
-            long_result, short_result = await asyncio.gather(
-                long_task, short_task, return_exceptions=True
+            # Close both legs simultaneously; a stuck exchange only fails its own leg
+            long_outcome, short_outcome = await asyncio.gather(
+                self._close_leg(long_exchange, symbol, OrderSide.SELL, long_size),
+                self._close_leg(short_exchange, symbol, OrderSide.BUY, short_size),
+                return_exceptions=True,
             )
 
-            # Handle any exceptions
-            if isinstance(long_result, Exception):
-                logger.error("long_close_failed", error=str(long_result))
-                long_result = None
-            if isinstance(short_result, Exception):
-                logger.error("short_close_failed", error=str(short_result))
-                short_result = None
+            long_result = _leg_result("long_close_failed", long_outcome)
+            short_result = _leg_result("short_close_failed", short_outcome)
 
             success = bool(long_result and short_result)
 
             return ExecutionResult(
                 success=success,
-                long_order=long_result if not isinstance(long_result, Exception) else None,
-                short_order=short_result if not isinstance(short_result, Exception) else None,
+                long_order=long_result,
+                short_order=short_result,
                 error_message=None if success else "One or both close orders failed",
-                execution_time_ms=int((time.time() - start_time) * 1000),
+                execution_time_ms=_elapsed_ms(start_ns),
             )
 
         except Exception as e:
@@ -377,7 +427,64 @@ class ExecutionEngine:
                 long_order=None,
                 short_order=None,
                 error_message=str(e),
-                execution_time_ms=int((time.time() - start_time) * 1000),
+                execution_time_ms=_elapsed_ms(start_ns),
+            )
+
+    async def _close_leg(
+        self,
+        exchange: str,
+        symbol: str,
+        side: OrderSide,
+        size: Decimal,
+    ) -> OrderResult:
+        """
+        Close one exit leg, bounded by EXIT_LEG_TIMEOUT_SECONDS.
+
+        A close that times out may still have reached the exchange, so the
+        leg is then reconciled against the exchange position. If the leg is
+        flat, it is reported as closed at the current mid price (the real fill
+        is unknown) instead of failing and leaving the stored position open.
+
+        Raises:
+            asyncio.TimeoutError: If the leg is still open on the exchange
+        """
+        try:
+            return await asyncio.wait_for(
+                self._close_position(exchange, symbol, side, size),
+                EXIT_LEG_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            adapter = self.exchanges[exchange]
+            position = await asyncio.wait_for(
+                adapter.get_position(symbol), EXIT_LEG_TIMEOUT_SECONDS
+            )
+            if position is not None and position.size > 0:
+                raise
+
+            book = await asyncio.wait_for(
+                adapter.get_orderbook(symbol), EXIT_LEG_TIMEOUT_SECONDS
+            )
+            logger.warning(
+                "exit_leg_closed_after_timeout",
+                exchange=exchange,
+                symbol=symbol,
+                estimated_price=float(book.mid_price) if book.mid_price else None,
+            )
+            return OrderResult(
+                order_id="",
+                client_order_id=None,
+                exchange=exchange,
+                symbol=symbol,
+                side=side,
+                order_type=OrderType.MARKET,
+                status=OrderStatus.FILLED,
+                size=size,
+                filled_size=size,
+                price=None,
+                average_price=book.mid_price,
+                fee=Decimal("0"),
+                fee_currency="USDT",
+                timestamp=datetime.now(timezone.utc),
             )
 
     async def _execute_with_timeout(
@@ -419,34 +526,118 @@ class ExecutionEngine:
         if result.is_filled:
             return result
 
-        # Wait for fill with timeout
-        timeout = self.config.order_fill_timeout_seconds
-        start = time.time()
-
-        while time.time() - start < timeout:
-            await asyncio.sleep(0.5)
+        # Track the resting order so shutdown can cancel it
+        order_id = result.order_id
+        self._pending_orders[order_id] = result
+        try:
+            return await self._await_fill(adapter, exchange, symbol, order_id)
+        except asyncio.CancelledError:
+            # An abandoned fill wait must not leave the order resting; the
+            # cancel is shielded so it reaches the exchange regardless
+            if self._pending_orders.pop(order_id, None) is not None:
+                await asyncio.shield(self._cancel_pending(result))
+            raise
+        finally:
+            self._pending_orders.pop(order_id, None)
+
+    async def _await_fill(
+        self,
+        adapter: ExchangeAdapter,
+        exchange: str,
+        symbol: str,
+        order_id: str,
+    ) -> Optional[OrderResult]:
+        """
+        Wait for a resting limit order to fill, cancelling it on timeout.
 
-            # Check order status
-            result = await adapter.get_order(result.order_id, symbol)
+        Returns:
+            OrderResult if filled, None if cancelled or failed
+        """
+        # Wait for fill with timeout, pushed by the adapter when it can stream
+        timeout = self.config.order_fill_timeout_seconds
+        updates = await adapter.subscribe_order_updates(order_id, symbol)
 
-            if result.is_filled:
-                return result
+        try:
+            if updates is not None:
+                final = await self._wait_for_order_update(updates, timeout)
+            else:
+                final = await self._poll_order(adapter, order_id, symbol, timeout)
+        finally:
+            if updates is not None:
+                await adapter.unsubscribe_order_updates(order_id)
 
-            if not result.is_open:
-                # Order was cancelled or rejected
-                return None
+        if final is not None:
+            # Filled, or cancelled/rejected by the exchange
+            return final if final.is_filled else None
 
         # Timeout - cancel order
         logger.warning(
             "order_timeout_cancelling",
             exchange=exchange,
-            order_id=result.order_id,
+            order_id=order_id,
             timeout=timeout,
         )
 
-        await adapter.cancel_order(result.order_id, symbol)
+        await adapter.cancel_order(order_id, symbol)
         return None
 
+    async def _wait_for_order_update(
+        self,
+        updates: "asyncio.Queue[OrderResult]",
+        timeout: float,
+    ) -> Optional[OrderResult]:
+        """
+        Wait on an order update stream until the order leaves the open state.
+
+        Returns:
+            The terminal OrderResult, or None if the timeout elapsed first
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            try:
+                update = await asyncio.wait_for(updates.get(), remaining)
+            except asyncio.TimeoutError:
+                return None
+
+            if update.is_filled or not update.is_open:
+                return update
+
+    async def _poll_order(
+        self,
+        adapter: ExchangeAdapter,
+        order_id: str,
+        symbol: str,
+        timeout: float,
+    ) -> Optional[OrderResult]:
+        """
+        Poll order status until the order leaves the open state.
+
+        Returns:
+            The terminal OrderResult, or None if the timeout elapsed first
+        """
+        deadline = time.monotonic() + timeout
+        delay = ORDER_POLL_INITIAL_DELAY
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            # Back off from a short first poll so quick fills are seen early
+            # without hammering the exchange for long-lived orders
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, ORDER_POLL_MAX_DELAY)
+
+            result = await adapter.get_order(order_id, symbol)
+
+            if result.is_filled or not result.is_open:
+                return result
+
     async def _close_position(
         self,
         exchange: str,
@@ -478,6 +669,60 @@ class ExecutionEngine:
 
         return await adapter.place_order(order)
 
+    async def cancel_all_pending(self) -> int:
+        """
+        Cancel every limit order still waiting for a fill.
+
+        Returns:
+            Number of orders successfully cancelled
+        """
+        pending = list(self._pending_orders.values())
+        if not pending:
+            return 0
+
+        # Untrack first so a fill wait cancelled alongside does not cancel again
+        self._pending_orders.clear()
+        results = await asyncio.gather(*(self._cancel_pending(order) for order in pending))
+        return sum(1 for cancelled in results if cancelled)
+
+    async def _cancel_pending(self, order: OrderResult) -> bool:
+        """Cancel a resting order, logging rather than raising a failure."""
+        try:
+            return await self.exchanges[order.exchange].cancel_order(
+                order.order_id, order.symbol
+            )
+        except Exception as e:
+            logger.error(
+                "pending_order_cancel_failed",
+                exchange=order.exchange,
+                order_id=order.order_id,
+                error=str(e),
+            )
+            return False
+
+    def _schedule_emergency_close(
+        self,
+        exchange: str,
+        symbol: str,
+        side: OrderSide,
+        size: Decimal,
+    ) -> None:
+        """
+        Start an emergency close without waiting for it to complete.
+
+        The failed entry is reported to the caller straight away while the
+        reduce-only market order is sent; join_close_tasks() waits for any
+        closes still in flight.
+        """
+        task = asyncio.create_task(self._emergency_close(exchange, symbol, side, size))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    async def join_close_tasks(self) -> None:
+        """Wait for all scheduled emergency closes to finish."""
+        if self._close_tasks:
+            await asyncio.gather(*self._close_tasks, return_exceptions=True)
+
     async def _emergency_close(
         self,
         exchange: str,
@@ -517,30 +762,90 @@ class ExecutionEngine:
                 error=str(e),
             )
 
+    @staticmethod
+    def _limit_price(book: OrderBook, side: OrderSide) -> Decimal:
+        """
+        Choose the limit price for an entry leg.
+
+        Rests at the mid price unless the top of the book leans towards our
+        own side (bids crowding when we buy, asks when we sell). The price
+        then tends to move away from a resting order, so the leg takes the
+        opposite touch and fills straight away. Entry fees are already
+        costed at taker rates.
+
+        Args:
+            book: Orderbook with both sides populated
+            side: Side of the order to place
+
+        Returns:
+            Limit price for the order
+        """
+        bid_share = book.imbalance(ENTRY_BOOK_LEVELS)
+        if bid_share is not None:
+            if side == OrderSide.BUY and bid_share >= ENTRY_CROSS_IMBALANCE:
+                return book.best_ask
+            if side == OrderSide.SELL and 1 - bid_share >= ENTRY_CROSS_IMBALANCE:
+                return book.best_bid
+        return book.mid_price
+
+    async def _fetch_orderbook_timed(
+        self,
+        exchange: str,
+        symbol: str,
+    ) -> Tuple[float, OrderBook]:
+        """Fetch an orderbook along with the monotonic time it arrived."""
+        book = await self.exchanges[exchange].get_orderbook(symbol)
+        return time.monotonic(), book
+
+    @staticmethod
+    def _discard_task(task: asyncio.Task) -> None:
+        """Cancel a speculative task, consuming any result it already has."""
+        if task.done():
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+
     async def _set_leverage(
         self,
         symbol: str,
         long_exchange: str,
         short_exchange: str,
     ) -> None:
-        """Set leverage on both exchanges before trading."""
-        for exchange in [long_exchange, short_exchange]:
-            # Get leverage setting for this exchange/symbol
-            leverage_config = self.config.leverage.get(exchange)
-            if leverage_config:
-                leverage = leverage_config.get_leverage(symbol)
-            else:
-                leverage = 5  # Default leverage
+        """
+        Set leverage on both exchanges concurrently before trading.
 
-            try:
-                await self.exchanges[exchange].set_leverage(symbol, leverage)
-            except Exception as e:
+        Exchanges already known to be at the configured leverage for the
+        symbol are skipped.
+        """
+        pending = []
+        for exchange in (long_exchange, short_exchange):
+            leverage = self.config.get_leverage(exchange, symbol)
+            if self._leverage_cache.get((exchange, symbol)) != leverage:
+                pending.append((exchange, leverage))
+
+        if not pending:
+            return
+
+        results = await asyncio.gather(
+            *(
+                self.exchanges[exchange].set_leverage(symbol, leverage)
+                for exchange, leverage in pending
+            ),
+            return_exceptions=True,
+        )
+
+        for (exchange, leverage), result in zip(pending, results):
+            if isinstance(result, Exception):
+                self._leverage_cache.pop((exchange, symbol), None)
                 logger.warning(
                     "set_leverage_failed",
                     exchange=exchange,
                     symbol=symbol,
-                    error=str(e),
+                    error=str(result),
                 )
+            else:
+                self._leverage_cache[(exchange, symbol)] = leverage
 
     @property
     def pending_orders_count(self) -> int:
@@ -5,12 +5,16 @@ Handles position creation, tracking, funding payment recording,
 and closing with P&L calculation.
 """
 
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Set, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config.schema import DEFAULT_LEVERAGE
 from ..database.models import (
     Position,
     Trade,
@@ -20,16 +24,47 @@ from ..database.models import (
     OrderAction,
     OrderType as DbOrderType,
     TradeStatus,
+    generate_uuid,
 )
 from ..database.repository import PositionRepository, TradeRepository, FundingEventRepository
 from ..exchanges.base import ExchangeAdapter
-from ..exchanges.types import OrderResult
+from ..exchanges.types import ExchangePosition, OrderResult, OrderType
 from ..utils.logging import get_logger
 from .detector import ArbitrageOpportunity
 from .executor import ExecutionResult
 
 logger = get_logger(__name__)
 
+# Concurrent get_position calls per exchange during reconciliation
+RECONCILE_CONCURRENCY_PER_EXCHANGE = 5
+
+# Exchange order type -> stored trade order type
+_ORDER_TYPE_MAP = {
+    OrderType.LIMIT: DbOrderType.LIMIT,
+    OrderType.MARKET: DbOrderType.MARKET,
+}
+
+
+def _leverage_or_default(
+    exchange_position: Union[ExchangePosition, None, BaseException],
+) -> int:
+    """Leverage of a fetched exchange position, or the configured default if unavailable."""
+    if exchange_position and not isinstance(exchange_position, BaseException):
+        return exchange_position.leverage
+    return DEFAULT_LEVERAGE
+
+
+@dataclass
+class FundingPayment:
+    """A funding payment observed for one leg of a position."""
+    position_id: str
+    pair: str
+    exchange: str
+    side: OrderSide
+    funding_rate: Decimal
+    payment_usd: Decimal
+    position_size: Decimal
+
 
 class PositionManager:
     """
@@ -83,27 +118,14 @@ class PositionManager:
         if not execution.success or not execution.long_order or not execution.short_order:
             raise ValueError("Cannot create position from failed execution")
 
-        # Get leverage from exchanges (or use defaults)
-        long_leverage = 5
-        short_leverage = 5
-
-        try:
-            long_pos = await self.exchanges[opportunity.long_exchange].get_position(
-                opportunity.symbol
-            )
-            if long_pos:
-                long_leverage = long_pos.leverage
-        except Exception:
-            pass
-
-        try:
-            short_pos = await self.exchanges[opportunity.short_exchange].get_position(
-                opportunity.symbol
-            )
-            if short_pos:
-                short_leverage = short_pos.leverage
-        except Exception:
-            pass
+        # Get leverage from exchanges (or use defaults), both legs at once
+        long_pos, short_pos = await asyncio.gather(
+            self.exchanges[opportunity.long_exchange].get_position(opportunity.symbol),
+            self.exchanges[opportunity.short_exchange].get_position(opportunity.symbol),
+            return_exceptions=True,
+        )
+        long_leverage = _leverage_or_default(long_pos)
+        short_leverage = _leverage_or_default(short_pos)
 
         # Calculate total fees
         total_fees = (
@@ -111,8 +133,10 @@ class PositionManager:
             execution.short_order.fee
         )
 
-        # Create position record
+        # Create position record; the id is assigned up front so the opening
+        # trades can reference it and be inserted in the same flush
         position = Position(
+            id=generate_uuid(),
             pair=opportunity.symbol,
             long_exchange=opportunity.long_exchange,
             short_exchange=opportunity.short_exchange,
@@ -128,24 +152,25 @@ class PositionManager:
             status=PositionStatus.OPEN,
         )
 
-        position = await self.position_repo.create(position)
-
-        # Record trades
-        await self._record_trade(
-            position.id,
-            execution.long_order,
-            opportunity.long_exchange,
-            OrderSide.LONG,
-            OrderAction.OPEN,
-        )
+        trades = [
+            self._build_trade(
+                position.id,
+                execution.long_order,
+                opportunity.long_exchange,
+                OrderSide.LONG,
+                OrderAction.OPEN,
+            ),
+            self._build_trade(
+                position.id,
+                execution.short_order,
+                opportunity.short_exchange,
+                OrderSide.SHORT,
+                OrderAction.OPEN,
+            ),
+        ]
 
-        await self._record_trade(
-            position.id,
-            execution.short_order,
-            opportunity.short_exchange,
-            OrderSide.SHORT,
-            OrderAction.OPEN,
-        )
+        position = await self.position_repo.create(position)
+        await self.trade_repo.create_many(trades)
 
         await self.session.commit()
 
@@ -185,30 +210,34 @@ class PositionManager:
         long_close_price = Decimal("0")
         short_close_price = Decimal("0")
         close_fees = Decimal("0")
+        trades = []
 
         if execution.long_order:
             long_close_price = execution.long_order.average_price or execution.long_order.price or Decimal("0")
             close_fees += execution.long_order.fee
 
-            await self._record_trade(
+            trades.append(self._build_trade(
                 position_id,
                 execution.long_order,
                 position.long_exchange,
                 OrderSide.LONG,
                 OrderAction.CLOSE,
-            )
+            ))
 
         if execution.short_order:
             short_close_price = execution.short_order.average_price or execution.short_order.price or Decimal("0")
             close_fees += execution.short_order.fee
 
-            await self._record_trade(
+            trades.append(self._build_trade(
                 position_id,
                 execution.short_order,
                 position.short_exchange,
                 OrderSide.SHORT,
                 OrderAction.CLOSE,
-            )
+            ))
+
+        if trades:
+            await self.trade_repo.create_many(trades)
 
         # Calculate P&L
         long_pnl = Decimal("0")
@@ -230,8 +259,8 @@ class PositionManager:
             realized_pnl=realized_pnl,
             long_close_price=long_close_price,
             short_close_price=short_close_price,
+            total_fees=total_fees,
         )
-        await self.position_repo.update(position_id, total_fees=total_fees)
 
         await self.session.commit()
 
@@ -242,7 +271,8 @@ class PositionManager:
             funding_collected=float(position.funding_collected),
         )
 
-        return await self.position_repo.get_by_id(position_id)
+        # The loaded instance was kept in sync by the UPDATE
+        return position
 
     async def mark_liquidated(
         self,
@@ -296,7 +326,8 @@ class PositionManager:
             realized_pnl=float(realized_pnl),
         )
 
-        return await self.position_repo.get_by_id(position_id)
+        # The loaded instance was kept in sync by the UPDATE
+        return position
 
     async def record_funding_payment(
         self,
@@ -352,10 +383,72 @@ class PositionManager:
 
         return event
 
+    async def record_funding_payments(
+        self,
+        payments: List[FundingPayment],
+    ) -> List[FundingEvent]:
+        """
+        Record a batch of funding payments in one transaction.
+
+        Inserts all FundingEvents with one executemany and applies the per-position
+        totals with one executemany UPDATE, then commits once.
+
+        Args:
+            payments: Funding payments collected during a sweep
+
+        Returns:
+            Created FundingEvents
+        """
+        if not payments:
+            return []
+
+        events = [
+            FundingEvent(
+                position_id=payment.position_id,
+                exchange=payment.exchange,
+                pair=payment.pair,
+                side=payment.side,
+                funding_rate=payment.funding_rate,
+                payment_usd=payment.payment_usd,
+                position_size=payment.position_size,
+            )
+            for payment in payments
+        ]
+        events = await self.funding_repo.create_many(events)
+
+        totals: Dict[str, Decimal] = {}
+        for payment in payments:
+            totals[payment.position_id] = (
+                totals.get(payment.position_id, Decimal("0")) + payment.payment_usd
+            )
+        await self.position_repo.add_funding_many(totals)
+
+        await self.session.commit()
+
+        logger.info(
+            "funding_batch_recorded",
+            events=len(events),
+            positions=len(totals),
+        )
+
+        return events
+
     async def get_open_positions(self) -> List[Position]:
         """Get all open positions."""
         return await self.position_repo.get_open_positions()
 
+    async def get_open_pairs(self) -> Set[str]:
+        """Get the pairs that currently have an open position."""
+        return await self.position_repo.get_open_pair_set()
+
+    async def iter_open_position_batches(
+        self,
+        batch_size: int = 100,
+    ) -> AsyncIterator[List[Position]]:
+        """Stream open positions in batches of up to batch_size."""
+        async for batch in self.position_repo.iter_open_position_batches(batch_size):
+            yield batch
+
     async def get_position(self, position_id: str) -> Optional[Position]:
         """Get a position by ID."""
         return await self.position_repo.get_by_id(position_id)
@@ -371,36 +464,37 @@ class PositionManager:
         Returns:
             List of issues found (empty if all OK)
         """
-        issues = []
         open_positions = await self.get_open_positions()
 
-        for position in open_positions:
-            # Check long leg
-            try:
-                long_exchange_pos = await self.exchanges[position.long_exchange].get_position(
-                    position.pair
-                )
-                if not long_exchange_pos or long_exchange_pos.size == 0:
-                    issues.append(
-                        f"Position {position.id}: Long leg missing on {position.long_exchange}"
-                    )
-            except Exception as e:
-                issues.append(
-                    f"Position {position.id}: Error checking long leg - {e}"
-                )
+        # Check every leg concurrently, bounded per exchange for rate limits
+        semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(RECONCILE_CONCURRENCY_PER_EXCHANGE)
+        )
+        legs = [
+            (position, label, exchange)
+            for position in open_positions
+            for label, exchange in (
+                ("Long", position.long_exchange),
+                ("Short", position.short_exchange),
+            )
+        ]
+        results = await asyncio.gather(
+            *(
+                self._fetch_leg(semaphores[exchange], exchange, position.pair)
+                for position, _, exchange in legs
+            ),
+            return_exceptions=True,
+        )
 
-            # Check short leg
-            try:
-                short_exchange_pos = await self.exchanges[position.short_exchange].get_position(
-                    position.pair
+        issues = []
+        for (position, label, exchange), result in zip(legs, results):
+            if isinstance(result, Exception):
+                issues.append(
+                    f"Position {position.id}: Error checking {label.lower()} leg - {result}"
                 )
-                if not short_exchange_pos or short_exchange_pos.size == 0:
-                    issues.append(
-                        f"Position {position.id}: Short leg missing on {position.short_exchange}"
-                    )
-            except Exception as e:
+            elif not result or result.size == 0:
                 issues.append(
-                    f"Position {position.id}: Error checking short leg - {e}"
+                    f"Position {position.id}: {label} leg missing on {exchange}"
                 )
 
         if issues:
@@ -410,7 +504,17 @@ class PositionManager:
 
         return issues
 
-    async def _record_trade(
+    async def _fetch_leg(
+        self,
+        semaphore: asyncio.Semaphore,
+        exchange: str,
+        pair: str,
+    ) -> Optional[ExchangePosition]:
+        """Fetch one leg's exchange position under the exchange's semaphore."""
+        async with semaphore:
+            return await self.exchanges[exchange].get_position(pair)
+
+    def _build_trade(
         self,
         position_id: str,
         order_result: OrderResult,
@@ -418,14 +522,14 @@ class PositionManager:
         side: OrderSide,
         action: OrderAction,
     ) -> Trade:
-        """Record a trade execution."""
-        trade = Trade(
+        """Build the Trade record for an order execution (not yet persisted)."""
+        return Trade(
             position_id=position_id,
             exchange=exchange,
             pair=order_result.symbol,
             side=side,
             action=action,
-            order_type=DbOrderType.LIMIT if order_result.order_type.value == "LIMIT" else DbOrderType.MARKET,
+            order_type=_ORDER_TYPE_MAP[order_result.order_type],
             price=order_result.average_price or order_result.price,
             size=order_result.filled_size,
             fee=order_result.fee,
@@ -433,5 +537,3 @@ class PositionManager:
             status=TradeStatus.FILLED if order_result.is_filled else TradeStatus.FAILED,
             executed_at=order_result.timestamp,
         )
-
-        return await self.trade_repo.create(trade)
@@ -5,13 +5,20 @@ Handles position limits, kill switch, liquidation detection,
 and other risk controls.
 """
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Set
 
 from ..config.schema import TradingConfig
 from ..exchanges.base import ExchangeAdapter
-from ..exchanges.types import ExchangePosition, PositionSide
+from ..exchanges.types import (
+    ExchangePosition,
+    Order,
+    OrderSide,
+    OrderType,
+    PositionSide,
+)
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -192,61 +199,75 @@ class RiskManager:
         self._kill_switch_activated_at = None
 
     async def _cancel_all_orders(self) -> int:
-        """Cancel all pending orders on all exchanges."""
-        total_cancelled = 0
+        """Cancel all pending orders on all exchanges concurrently."""
+        names = list(self.exchanges)
+        results = await asyncio.gather(
+            *(self.exchanges[name].cancel_all_orders() for name in names),
+            return_exceptions=True,
+        )
 
-        for name, exchange in self.exchanges.items():
-            try:
-                count = await exchange.cancel_all_orders()
-                total_cancelled += count
-                logger.info("orders_cancelled", exchange=name, count=count)
-            except Exception as e:
-                logger.error("cancel_orders_failed", exchange=name, error=str(e))
+        total_cancelled = 0
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error("cancel_orders_failed", exchange=name, error=str(result))
+            else:
+                total_cancelled += result
+                logger.info("orders_cancelled", exchange=name, count=result)
 
         return total_cancelled
 
     async def _close_all_positions(self) -> List[str]:
-        """Close all positions on all exchanges."""
-        closed = []
+        """Close all positions on all exchanges concurrently."""
+        names = list(self.exchanges)
+        fetched = await asyncio.gather(
+            *(self.exchanges[name].get_positions() for name in names),
+            return_exceptions=True,
+        )
 
-        for name, exchange in self.exchanges.items():
-            try:
-                positions = await exchange.get_positions()
-                for pos in positions:
-                    if pos.size > 0:
-                        try:
-                            # Determine close side
-                            from ..exchanges.types import Order, OrderSide, OrderType
-                            close_side = OrderSide.SELL if pos.side == PositionSide.LONG else OrderSide.BUY
-
-                            order = Order(
-                                symbol=pos.symbol,
-                                side=close_side,
-                                order_type=OrderType.MARKET,
-                                size=pos.size,
-                                reduce_only=True,
-                            )
-
-                            await exchange.place_order(order)
-                            closed.append(f"{name}:{pos.symbol}")
-                            logger.info(
-                                "position_force_closed",
-                                exchange=name,
-                                symbol=pos.symbol,
-                                side=pos.side.value,
-                            )
-                        except Exception as e:
-                            logger.error(
-                                "force_close_failed",
-                                exchange=name,
-                                symbol=pos.symbol,
-                                error=str(e),
-                            )
-            except Exception as e:
-                logger.error("get_positions_failed", exchange=name, error=str(e))
+        to_close = []
+        for name, positions in zip(names, fetched):
+            if isinstance(positions, Exception):
+                logger.error("get_positions_failed", exchange=name, error=str(positions))
+                continue
+            to_close.extend((name, pos) for pos in positions if pos.size > 0)
+
+        results = await asyncio.gather(
+            *(self._force_close(name, pos) for name, pos in to_close),
+            return_exceptions=True,
+        )
+
+        closed = []
+        for (name, pos), result in zip(to_close, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "force_close_failed",
+                    exchange=name,
+                    symbol=pos.symbol,
+                    error=str(result),
+                )
+            else:
+                closed.append(f"{name}:{pos.symbol}")
+                logger.info(
+                    "position_force_closed",
+                    exchange=name,
+                    symbol=pos.symbol,
+                    side=pos.side.value,
+                )
 
         return closed
 
+    async def _force_close(self, exchange: str, pos: ExchangePosition) -> None:
+        """Close an exchange position with a reduce-only market order."""
+        close_side = OrderSide.SELL if pos.side == PositionSide.LONG else OrderSide.BUY
+        order = Order(
+            symbol=pos.symbol,
+            side=close_side,
+            order_type=OrderType.MARKET,
+            size=pos.size,
+            reduce_only=True,
+        )
+        await self.exchanges[exchange].place_order(order)
+
     # ==================== Liquidation Detection ====================
 
     async def check_for_liquidations(self) -> List[Dict]:
@@ -261,39 +282,89 @@ class RiskManager:
         """
         liquidations = []
 
-        for name, exchange in self.exchanges.items():
-            try:
-                current_positions = await exchange.get_positions()
-                current_map = {p.symbol: p for p in current_positions}
-
-                last_map = self._last_positions.get(name, {})
-
-                # Check for positions that disappeared
-                for symbol, last_pos in last_map.items():
-                    if symbol not in current_map or current_map[symbol].size == 0:
-                        # Position is gone - could be liquidation or manual close
-                        if last_pos.liquidation_price:
-                            # Check if mark price was near liquidation
-                            liquidations.append({
-                                "exchange": name,
-                                "symbol": symbol,
-                                "side": last_pos.side.value,
-                                "size": float(last_pos.size),
-                                "entry_price": float(last_pos.entry_price),
-                                "liquidation_price": float(last_pos.liquidation_price),
-                            })
-
-                # Update last known positions
-                self._last_positions[name] = current_map
+        # Poll every exchange at once; detection lag is bounded by the slowest
+        names = list(self.exchanges)
+        results = await asyncio.gather(
+            *(self.exchanges[name].get_positions() for name in names),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                logger.error("liquidation_check_failed", exchange=name, error=str(e))
+        for name, current_positions in zip(names, results):
+            if isinstance(current_positions, Exception):
+                logger.error(
+                    "liquidation_check_failed", exchange=name, error=str(current_positions)
+                )
+                continue
+
+            current_map = {p.symbol: p for p in current_positions}
+
+            last_map = self._last_positions.get(name, {})
+
+            # Check for positions that disappeared
+            for symbol, last_pos in last_map.items():
+                if symbol not in current_map or current_map[symbol].size == 0:
+                    # Position is gone - could be liquidation or manual close
+                    if last_pos.liquidation_price:
+                        # Check if mark price was near liquidation
+                        liquidations.append({
+                            "exchange": name,
+                            "symbol": symbol,
+                            "side": last_pos.side.value,
+                            "size": float(last_pos.size),
+                            "entry_price": float(last_pos.entry_price),
+                            "liquidation_price": float(last_pos.liquidation_price),
+                        })
+
+            # Update last known positions
+            self._last_positions[name] = current_map
 
         if liquidations:
             logger.warning("liquidations_detected", count=len(liquidations))
 
         return liquidations
 
+    async def check_for_liquidations_bulk(self, positions: Sequence) -> Dict[str, bool]:
+        """
+        Check a batch of local positions for a vanished leg.
+
+        Each exchange involved is queried for its positions once, and the
+        exchanges are queried concurrently. A position is flagged when either
+        leg has no open position for its pair on that exchange. Exchanges
+        that fail to answer are skipped rather than reported as liquidated.
+
+        Args:
+            positions: Local positions (with id, pair, long_exchange, short_exchange)
+
+        Returns:
+            Dict of position id -> whether a leg appears to be liquidated
+        """
+        names = sorted({
+            exchange
+            for position in positions
+            for exchange in (position.long_exchange, position.short_exchange)
+            if exchange in self.exchanges
+        })
+
+        results = await asyncio.gather(
+            *(self.exchanges[name].get_positions() for name in names),
+            return_exceptions=True,
+        )
+
+        open_symbols: Dict[str, Set[str]] = {}
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error("liquidation_check_failed", exchange=name, error=str(result))
+                continue
+            open_symbols[name] = {p.symbol for p in result if p.size > 0}
+
+        return {
+            position.id: any(
+                exchange in open_symbols and position.pair not in open_symbols[exchange]
+                for exchange in (position.long_exchange, position.short_exchange)
+            )
+            for position in positions
+        }
+
     async def handle_liquidation(
         self,
         position_id: str,
@@ -325,8 +396,6 @@ class RiskManager:
 
         # Close surviving leg immediately with market order
         try:
-            from ..exchanges.types import Order, OrderSide, OrderType
-
             close_side = OrderSide.SELL if surviving_side == "LONG" else OrderSide.BUY
 
             order = Order(
@@ -6,11 +6,15 @@ and implement the required methods.
 """
 
 import asyncio
+import ssl
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Callable, Dict, List, Optional, Any
 
+import aiohttp
+import certifi
+
 from ..utils.logging import get_logger
 from .types import (
     FundingRate,
@@ -61,6 +65,11 @@ class ExchangeAdapter(ABC):
     CIRCUIT_BREAKER_THRESHOLD = 5
     CIRCUIT_BREAKER_RESET_TIME = 60  # seconds
 
+    # HTTP connection reuse: keep idle connections open across the scanner's
+    # poll interval so orders don't pay a fresh TCP/TLS handshake
+    HTTP_KEEPALIVE_SECONDS = 75
+    HTTP_DNS_CACHE_SECONDS = 600
+
     def __init__(
         self,
         api_key: str,
@@ -85,6 +94,7 @@ class ExchangeAdapter(ABC):
         # Connection state
         self._connected = False
         self._client: Any = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
 
         # Circuit breaker state
         self._consecutive_failures = 0
@@ -136,6 +146,28 @@ class ExchangeAdapter(ABC):
         """
         pass
 
+    def _open_http_session(self) -> aiohttp.ClientSession:
+        """
+        Create the HTTP session shared by all requests of this adapter.
+
+        Passed to the ccxt client as its session, which leaves closing it to
+        _close_http_session().
+        """
+        connector = aiohttp.TCPConnector(
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+            keepalive_timeout=self.HTTP_KEEPALIVE_SECONDS,
+            ttl_dns_cache=self.HTTP_DNS_CACHE_SECONDS,
+            enable_cleanup_closed=True,
+        )
+        self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
+
+    async def _close_http_session(self) -> None:
+        """Close the HTTP session opened by _open_http_session()."""
+        if self._http_session:
+            await self._http_session.close()
+            self._http_session = None
+
     # ==================== Market Data ====================
 
     @abstractmethod
@@ -247,6 +279,37 @@ class ExchangeAdapter(ABC):
         """
         pass
 
+    async def subscribe_order_updates(
+        self, order_id: str, symbol: str
+    ) -> Optional["asyncio.Queue[OrderResult]"]:
+        """
+        Subscribe to push updates for a single order.
+
+        Adapters with a private order stream return a queue that receives
+        an OrderResult for every status change of the order, including any
+        change that happened between placement and subscription. The default
+        implementation has no stream and returns None, so callers fall back
+        to polling get_order().
+
+        Args:
+            order_id: Exchange order ID
+            symbol: Trading pair symbol
+
+        Returns:
+            Queue of order updates, or None if streaming is unavailable
+        """
+        return None
+
+    async def unsubscribe_order_updates(self, order_id: str) -> None:
+        """
+        Stop delivering updates for an order subscribed via
+        subscribe_order_updates().
+
+        Args:
+            order_id: Exchange order ID
+        """
+        pass
+
     # ==================== Position Management ====================
 
     @abstractmethod
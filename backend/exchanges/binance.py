@@ -61,6 +61,7 @@ class BinanceAdapter(ExchangeAdapter):
                 "secret": self.api_secret,
                 "sandbox": True,
                 "options": options,
+                "session": self._open_http_session(),
                 "enableRateLimit": True,
                 "rateLimit": 50,  # ms between requests
             })
@@ -69,12 +70,19 @@ class BinanceAdapter(ExchangeAdapter):
                 "apiKey": self.api_key,
                 "secret": self.api_secret,
                 "options": options,
+                "session": self._open_http_session(),
                 "enableRateLimit": True,
                 "rateLimit": 50,
             })
 
-        # Load markets
-        await self._client.load_markets()
+        # Load markets (also opens the first connection to the API host)
+        try:
+            await self._client.load_markets()
+        except Exception:
+            # Don't leak the HTTP session when a connect attempt fails
+            self._client = None
+            await self._close_http_session()
+            raise
 
         self._connected = True
         logger.info(
@@ -88,6 +96,7 @@ class BinanceAdapter(ExchangeAdapter):
         if self._client:
             await self._client.close()
             self._client = None
+        await self._close_http_session()
 
         self._connected = False
         logger.info("binance_disconnected")
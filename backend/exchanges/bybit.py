@@ -59,6 +59,7 @@ class BybitAdapter(ExchangeAdapter):
                 "secret": self.api_secret,
                 "sandbox": True,
                 "options": options,
+                "session": self._open_http_session(),
                 "enableRateLimit": True,
                 "rateLimit": 100,  # ms between requests
             })
@@ -67,12 +68,19 @@ class BybitAdapter(ExchangeAdapter):
                 "apiKey": self.api_key,
                 "secret": self.api_secret,
                 "options": options,
+                "session": self._open_http_session(),
                 "enableRateLimit": True,
                 "rateLimit": 100,
             })
 
-        # Load markets
-        await self._client.load_markets()
+        # Load markets (also opens the first connection to the API host)
+        try:
+            await self._client.load_markets()
+        except Exception:
+            # Don't leak the HTTP session when a connect attempt fails
+            self._client = None
+            await self._close_http_session()
+            raise
 
         self._connected = True
         logger.info(
@@ -86,6 +94,7 @@ class BybitAdapter(ExchangeAdapter):
         if self._client:
             await self._client.close()
             self._client = None
+        await self._close_http_session()
 
         self._connected = False
         logger.info("bybit_disconnected")
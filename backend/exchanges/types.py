@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import cached_property
 from typing import List, Optional, Tuple
 
 
@@ -62,17 +63,33 @@ class FundingRate:
     mark_price: Optional[Decimal] = None  # Mark price used for funding
     index_price: Optional[Decimal] = None  # Index price (spot reference)
 
+    # Float views for broadcasts; the Decimals stay authoritative for math
+    @cached_property
+    def rate_f(self) -> float:
+        """Rate as a float, converted once per snapshot."""
+        return float(self.rate)
+
+    @cached_property
+    def predicted_rate_f(self) -> Optional[float]:
+        """Predicted rate as a float, converted once per snapshot."""
+        return float(self.predicted_rate) if self.predicted_rate is not None else None
+
+    @cached_property
+    def next_funding_ts(self) -> float:
+        """Next funding time as a POSIX timestamp."""
+        return self.next_funding_time.timestamp()
+
     @property
     def rate_percent(self) -> Decimal:
         """Rate as a percentage."""
         return self.rate * Decimal("100")
 
-    @property
+    @cached_property
     def periods_per_day(self) -> Decimal:
         """Number of funding periods per day based on interval."""
         return Decimal(24) / Decimal(self.interval_hours)
 
-    @property
+    @cached_property
     def daily_rate(self) -> Decimal:
         """Rate normalized to daily basis (sum of all funding events per day)."""
         return self.rate * self.periods_per_day
@@ -102,6 +119,7 @@ class OrderBook:
 
     Bids are sorted descending (best bid first).
     Asks are sorted ascending (best ask first).
+    Levels are not expected to change after construction.
     """
     exchange: str
     symbol: str
@@ -119,18 +137,22 @@ class OrderBook:
         """Best ask price."""
         return self.asks[0].price if self.asks else None
 
-    @property
+    @cached_property
     def mid_price(self) -> Optional[Decimal]:
-        """Mid-market price."""
-        if self.best_bid and self.best_ask:
-            return (self.best_bid + self.best_ask) / 2
+        """Mid-market price, computed once per snapshot."""
+        best_bid = self.best_bid
+        best_ask = self.best_ask
+        if best_bid and best_ask:
+            return (best_bid + best_ask) / 2
         return None
 
-    @property
+    @cached_property
     def spread(self) -> Optional[Decimal]:
-        """Bid-ask spread."""
-        if self.best_bid and self.best_ask:
-            return self.best_ask - self.best_bid
+        """Bid-ask spread, computed once per snapshot."""
+        best_bid = self.best_bid
+        best_ask = self.best_ask
+        if best_bid and best_ask:
+            return best_ask - best_bid
         return None
 
     @property
@@ -145,6 +167,19 @@ class OrderBook:
         book = self.bids if side == "bid" else self.asks
         return sum(level.size for level in book[:levels])
 
+    def imbalance(self, levels: int = 5) -> Optional[float]:
+        """
+        Bid share of the total size at the top N levels.
+
+        1.0 means all resting size is on the bid, 0.0 all on the ask.
+        None if both sides are empty.
+        """
+        bid_depth = self.get_depth("bid", levels)
+        total = bid_depth + self.get_depth("ask", levels)
+        if not total:
+            return None
+        return float(bid_depth / total)
+
 
 @dataclass
 class Order:
@@ -185,6 +220,21 @@ class OrderResult:
     timestamp: datetime
     raw: dict = field(default_factory=dict)  # Raw exchange response
 
+    @cached_property
+    def average_price_f(self) -> float:
+        """Average fill price as a float (0 when unfilled)."""
+        return float(self.average_price) if self.average_price else 0.0
+
+    @cached_property
+    def filled_size_f(self) -> float:
+        """Filled size as a float."""
+        return float(self.filled_size)
+
+    @cached_property
+    def fee_f(self) -> float:
+        """Fee as a float."""
+        return float(self.fee)
+
     @property
     def is_filled(self) -> bool:
         return self.status == OrderStatus.FILLED
@@ -5,14 +5,29 @@ Provides consistent JSON logging for production and
 colored console output for development.
 """
 
+import json
 import logging
 import sys
-from typing import Optional
+from typing import Any, Callable, Optional
 
+import orjson
 import structlog
 from structlog.types import Processor
 
 
+def _orjson_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Render a log event with orjson, falling back to stdlib json.
+
+    Logging must never raise into the caller, so events orjson rejects
+    (e.g. integers wider than 64 bits) are rendered the slow way instead.
+    """
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(obj, default=default).encode("utf-8")
+
+
 def setup_logging(
     level: str = "INFO",
     json_output: bool = False,
@@ -50,16 +65,18 @@ def setup_logging(
     ]
 
     if json_output:
-        # Production: JSON output
+        # Production: JSON output (orjson renders straight to bytes)
         processors: list[Processor] = shared_processors + [
             structlog.processors.dict_tracebacks,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ]
+        logger_factory = structlog.BytesLoggerFactory()
     else:
         # Development: Colored console output
         processors = shared_processors + [
             structlog.dev.ConsoleRenderer(colors=True),
         ]
+        logger_factory = structlog.PrintLoggerFactory()
 
     structlog.configure(
         processors=processors,
@@ -67,7 +84,7 @@ def setup_logging(
             getattr(logging, level.upper())
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
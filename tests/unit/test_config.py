@@ -56,6 +56,24 @@ class TestTradingConfig:
         threshold = config.calculate_threshold(Decimal("0"))
         assert float(threshold) == pytest.approx(0.0003)
 
+    def test_get_leverage_uses_overrides_and_defaults(self):
+        """Test flattened leverage lookup per exchange and symbol."""
+        from backend.config.schema import LeverageConfig
+        config = TradingConfig(
+            symbols=["BTC/USDT:USDT", "ETH/USDT:USDT"],
+            leverage={
+                "binance": LeverageConfig(default=5, overrides={"BTC/USDT:USDT": 3}),
+                "bybit": LeverageConfig(default=10),
+            },
+        )
+        assert config.get_leverage("binance", "BTC/USDT:USDT") == 3
+        assert config.get_leverage("binance", "ETH/USDT:USDT") == 5
+        assert config.get_leverage("bybit", "BTC/USDT:USDT") == 10
+        # Symbol outside the monitored list still honours the exchange config
+        assert config.get_leverage("bybit", "SOL/USDT:USDT") == 10
+        # Unconfigured exchange falls back to the global default
+        assert config.get_leverage("okx", "BTC/USDT:USDT") == 5
+
 
 class TestConfig:
     """Tests for main Config class."""
@@ -97,6 +115,40 @@ class TestConfig:
         assert config.simulation_mode is True
 
 
+class TestDatabaseConfig:
+    """Tests for DatabaseConfig."""
+
+    def test_sqlite_connection_url(self):
+        """Test SQLite connection URL generation."""
+        config = DatabaseConfig(driver="sqlite", sqlite_path="data/test.db")
+        assert config.get_connection_url() == "sqlite+aiosqlite:///data/test.db"
+
+    def test_postgresql_connection_url_encodes_password(self):
+        """Test that special characters in credentials are percent-encoded."""
+        config = DatabaseConfig(
+            driver="postgresql",
+            host="db",
+            port=5432,
+            database="fundingarb",
+            username="trader",
+            password="p@ss:w/rd",
+        )
+        assert config.get_connection_url() == (
+            "postgresql+asyncpg://trader:p%40ss%3Aw%2Frd@db:5432/fundingarb"
+        )
+
+    def test_connection_url_is_cached(self):
+        """Test that the connection URL is computed once per instance."""
+        config = DatabaseConfig(driver="sqlite", sqlite_path="data/test.db")
+        assert config.get_connection_url() is config.get_connection_url()
+
+    def test_unsupported_driver(self):
+        """Test that unknown drivers are rejected."""
+        config = DatabaseConfig(driver="mysql")
+        with pytest.raises(ValueError):
+            config.get_connection_url()
+
+
 class TestConfigLoader:
     """Tests for configuration loading."""
 
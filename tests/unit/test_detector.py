@@ -87,6 +87,38 @@ class TestArbitrageDetector:
         assert opp.long_interval_hours == 8
         assert opp.short_interval_hours == 8
 
+    def test_find_opportunities_picks_extreme_legs(self, detector):
+        """Test that the lowest and highest daily rates across three exchanges form the legs."""
+        now = datetime.now(timezone.utc)
+        next_funding = now + timedelta(minutes=15)
+
+        def make_rate(exchange: str, rate: str, interval_hours: int = 8) -> FundingRate:
+            return FundingRate(
+                exchange=exchange,
+                symbol="BTC/USDT:USDT",
+                rate=Decimal(rate),
+                predicted_rate=None,
+                next_funding_time=next_funding,
+                timestamp=now,
+                interval_hours=interval_hours,
+            )
+
+        rates = {
+            "binance": {"BTC/USDT:USDT": make_rate("binance", "0.0010")},
+            # 0.0005 per hour is the highest daily rate despite the small raw value
+            "dydx": {"BTC/USDT:USDT": make_rate("dydx", "0.0005", interval_hours=1)},
+            "bybit": {"BTC/USDT:USDT": make_rate("bybit", "-0.0010")},
+        }
+
+        opportunities = detector.find_opportunities(rates, Decimal("10000"))
+
+        assert len(opportunities) == 1
+        opp = opportunities[0]
+        assert opp.long_exchange == "bybit"
+        assert opp.short_exchange == "dydx"
+        # 0.0005 * 24 - (-0.0010 * 3) = 0.015
+        assert float(opp.daily_spread) == pytest.approx(0.015)
+
     def test_find_opportunities_insufficient_spread(self, detector):
         """Test that insufficient spread is not detected."""
         now = datetime.now(timezone.utc)
@@ -272,6 +304,25 @@ class TestArbitrageDetector:
         # Default fee 0.04% * 2 trades * 2 legs = 0.16%
         assert float(fees) == pytest.approx(16.0)
 
+    def test_calculate_fees_uses_reassigned_tiers(self, detector):
+        """Test that assigning new fee tiers invalidates cached pair fee rates."""
+        from backend.exchanges.types import FeeTier
+
+        assert float(detector.calculate_fees(Decimal("10000"), "binance", "bybit")) == pytest.approx(16.0)
+
+        detector.fee_tiers = {
+            "binance": FeeTier(
+                exchange="binance",
+                tier="VIP1",
+                maker_fee=Decimal("0.0001"),
+                taker_fee=Decimal("0.0002"),
+                timestamp=datetime.now(timezone.utc),
+            ),
+        }
+
+        # binance 0.02% * 2 + bybit default 0.04% * 2 = 0.12%
+        assert float(detector.calculate_fees(Decimal("10000"), "binance", "bybit")) == pytest.approx(12.0)
+
 
 class TestArbitrageOpportunitySchema:
     """Tests to ensure ArbitrageOpportunity schema is correct."""
@@ -307,6 +358,10 @@ class TestArbitrageOpportunitySchema:
             f"Extra: {actual_fields - self.EXPECTED_OPPORTUNITY_FIELDS}"
         )
 
+    def test_opportunity_uses_slots(self):
+        """Verify ArbitrageOpportunity stores its fields in slots, not a __dict__."""
+        assert set(ArbitrageOpportunity.__slots__) == self.EXPECTED_OPPORTUNITY_FIELDS
+
     def test_opportunity_has_interval_fields(self):
         """Ensure ArbitrageOpportunity has interval fields for both exchanges."""
         from dataclasses import fields
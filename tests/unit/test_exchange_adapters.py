@@ -0,0 +1,33 @@
+"""
+Unit tests for exchange adapter connection handling.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.exchanges.binance import BinanceAdapter
+from backend.exchanges.bybit import BybitAdapter
+
+
+class TestAdapterConnect:
+    """Tests for adapter connect/disconnect."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("adapter_cls, client_name", [
+        (BinanceAdapter, "binanceusdm"),
+        (BybitAdapter, "bybit"),
+    ])
+    async def test_failed_connect_closes_http_session(self, adapter_cls, client_name):
+        """Test that a failed market load does not leak the HTTP session."""
+        adapter = adapter_cls(api_key="key", api_secret="secret")
+        client = MagicMock()
+        client.load_markets = AsyncMock(side_effect=Exception("exchange down"))
+
+        with patch(f"backend.exchanges.{adapter.name}.ccxt.{client_name}", return_value=client):
+            with pytest.raises(Exception, match="exchange down"):
+                await adapter.connect()
+
+        assert adapter._http_session is None
+        assert adapter._client is None
+        assert not adapter.is_connected
@@ -2,6 +2,8 @@
 Unit tests for execution engine module.
 """
 
+import asyncio
+from dataclasses import replace
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -126,6 +128,8 @@ class TestExecutionEngine:
         binance.get_order = AsyncMock(return_value=mock_order_result)
         binance.cancel_order = AsyncMock()
         binance.set_leverage = AsyncMock()
+        binance.subscribe_order_updates = AsyncMock(return_value=None)
+        binance.unsubscribe_order_updates = AsyncMock()
 
         bybit = MagicMock()
         bybit.name = "bybit"
@@ -161,6 +165,8 @@ class TestExecutionEngine:
         bybit.get_order = AsyncMock()
         bybit.cancel_order = AsyncMock()
         bybit.set_leverage = AsyncMock()
+        bybit.subscribe_order_updates = AsyncMock(return_value=None)
+        bybit.unsubscribe_order_updates = AsyncMock()
 
         return {"binance": binance, "bybit": bybit}
 
@@ -210,6 +216,45 @@ class TestExecutionEngine:
 
         assert executor.pending_orders_count == 2
 
+    def test_orderbook_mid_price_and_spread_cached(self, mock_orderbook):
+        """Test that orderbook prices are derived once per snapshot."""
+        assert mock_orderbook.mid_price == Decimal("50005")
+        assert mock_orderbook.spread == Decimal("10")
+        assert mock_orderbook.mid_price is mock_orderbook.mid_price
+
+        empty = OrderBook(
+            exchange="binance",
+            symbol="BTC/USDT:USDT",
+            bids=[],
+            asks=mock_orderbook.asks,
+            timestamp=datetime.now(timezone.utc),
+        )
+        assert empty.mid_price is None
+        assert empty.spread is None
+
+    def test_limit_price_rests_at_mid_unless_book_leans_our_way(self, mock_orderbook):
+        """Test entry pricing against orderbook imbalance."""
+        # Balanced book (3.0 bid vs 3.0 ask): both sides rest at mid
+        assert mock_orderbook.imbalance() == pytest.approx(0.5)
+        assert ExecutionEngine._limit_price(mock_orderbook, OrderSide.BUY) == Decimal("50005")
+        assert ExecutionEngine._limit_price(mock_orderbook, OrderSide.SELL) == Decimal("50005")
+
+        bid_heavy = replace(
+            mock_orderbook,
+            bids=[OrderBookLevel(price=Decimal("50000"), size=Decimal("8.0"))],
+        )
+        # Buyers crowding the bid: a buy takes the ask, a sell still rests
+        assert bid_heavy.imbalance() == pytest.approx(8 / 11)
+        assert ExecutionEngine._limit_price(bid_heavy, OrderSide.BUY) == Decimal("50010")
+        assert ExecutionEngine._limit_price(bid_heavy, OrderSide.SELL) == Decimal("50005")
+
+        ask_heavy = replace(
+            mock_orderbook,
+            asks=[OrderBookLevel(price=Decimal("50010"), size=Decimal("8.0"))],
+        )
+        assert ExecutionEngine._limit_price(ask_heavy, OrderSide.SELL) == Decimal("50000")
+        assert ExecutionEngine._limit_price(ask_heavy, OrderSide.BUY) == Decimal("50005")
+
     @pytest.mark.asyncio
     async def test_execute_entry_success(self, executor, opportunity, mock_exchanges):
         """Test successful entry execution."""
@@ -305,6 +350,87 @@ class TestExecutionEngine:
         assert result.success is False
         assert "Second leg failed" in result.error_message
 
+        # The first leg is unwound in the background
+        await executor.join_close_tasks()
+        close_order = mock_exchanges["bybit"].place_order.call_args[0][0]
+        assert close_order.order_type == OrderType.MARKET
+        assert close_order.side == OrderSide.SELL
+        assert close_order.reduce_only is True
+        assert executor._close_tasks == set()
+
+    @pytest.mark.asyncio
+    async def test_execute_entry_fetches_orderbooks_concurrently(
+        self, executor, opportunity, mock_exchanges
+    ):
+        """Test that both orderbooks are requested before either returns."""
+        both_requested = asyncio.Event()
+        requested = []
+
+        def fetch_after_both(book):
+            async def fetch(symbol):
+                requested.append(symbol)
+                if len(requested) == 2:
+                    both_requested.set()
+                await asyncio.wait_for(both_requested.wait(), timeout=1)
+                return book
+            return fetch
+
+        for adapter in mock_exchanges.values():
+            book = adapter.get_orderbook.return_value
+            adapter.get_orderbook = AsyncMock(side_effect=fetch_after_both(book))
+
+        result = await executor.execute_entry(opportunity, Decimal("10000"))
+
+        assert result.success is True
+
+    @pytest.mark.asyncio
+    async def test_second_leg_orderbook_refreshed_while_first_leg_fills(
+        self, executor, opportunity, mock_exchanges
+    ):
+        """Test that the second leg's book refresh overlaps the first leg order."""
+        # bybit (long) has lower liquidity so it fills first; binance is second
+        refreshed = asyncio.Event()
+        binance_book = mock_exchanges["binance"].get_orderbook.return_value
+        bybit_fill = mock_exchanges["bybit"].place_order.return_value
+
+        async def binance_book_fetch(symbol):
+            if mock_exchanges["binance"].get_orderbook.await_count > 1:
+                refreshed.set()
+            return binance_book
+
+        async def bybit_place(order):
+            await asyncio.wait_for(refreshed.wait(), timeout=1)
+            return bybit_fill
+
+        mock_exchanges["binance"].get_orderbook = AsyncMock(side_effect=binance_book_fetch)
+        mock_exchanges["bybit"].place_order = AsyncMock(side_effect=bybit_place)
+
+        result = await executor.execute_entry(opportunity, Decimal("10000"))
+
+        assert result.success is True
+        assert mock_exchanges["binance"].get_orderbook.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_second_leg_orderbook_refetched_after_delayed_fill(
+        self, executor, opportunity, mock_exchanges
+    ):
+        """Test that a book fetched long before the first leg fills is not reused."""
+        # bybit (long) has lower liquidity so it fills first; binance is second
+        bybit_fill = mock_exchanges["bybit"].place_order.return_value
+
+        async def bybit_place_slow_fill(order):
+            await asyncio.sleep(0.05)
+            return bybit_fill
+
+        mock_exchanges["bybit"].place_order = AsyncMock(side_effect=bybit_place_slow_fill)
+
+        with patch("backend.engine.executor.ENTRY_BOOK_MAX_AGE_SECONDS", 0.01):
+            result = await executor.execute_entry(opportunity, Decimal("10000"))
+
+        assert result.success is True
+        # Initial book, speculative refresh, and the refetch after the fill
+        assert mock_exchanges["binance"].get_orderbook.await_count == 3
+
     @pytest.mark.asyncio
     async def test_execute_entry_circuit_breaker(self, executor, opportunity, mock_exchanges):
         """Test entry when circuit breaker is open."""
@@ -379,6 +505,55 @@ class TestExecutionEngine:
         assert result.long_order is None
         assert result.short_order is None
 
+    @pytest.mark.asyncio
+    async def test_execute_exit_stuck_leg_times_out(self, executor, mock_exchanges):
+        """Test that a hanging close on one exchange doesn't block the other leg."""
+        async def hang(order):
+            await asyncio.sleep(10)
+
+        mock_exchanges["bybit"].place_order = AsyncMock(side_effect=hang)
+        # The short leg is still open, so the close really did not go through
+        mock_exchanges["bybit"].get_position = AsyncMock(return_value=MagicMock(size=Decimal("0.2")))
+
+        with patch("backend.engine.executor.EXIT_LEG_TIMEOUT_SECONDS", 0.01):
+            result = await executor.execute_exit(
+                symbol="BTC/USDT:USDT",
+                long_exchange="binance",
+                short_exchange="bybit",
+                long_size=Decimal("0.2"),
+                short_size=Decimal("0.2"),
+            )
+
+        assert result.success is False
+        assert result.long_order is not None
+        assert result.short_order is None
+
+    @pytest.mark.asyncio
+    async def test_execute_exit_timed_out_leg_reconciled_when_flat(
+        self, executor, mock_exchanges
+    ):
+        """Test that a timed-out close whose leg is flat on the exchange counts as closed."""
+        async def hang(order):
+            await asyncio.sleep(10)
+
+        mock_exchanges["bybit"].place_order = AsyncMock(side_effect=hang)
+        mock_exchanges["bybit"].get_position = AsyncMock(return_value=None)
+
+        with patch("backend.engine.executor.EXIT_LEG_TIMEOUT_SECONDS", 0.01):
+            result = await executor.execute_exit(
+                symbol="BTC/USDT:USDT",
+                long_exchange="binance",
+                short_exchange="bybit",
+                long_size=Decimal("0.2"),
+                short_size=Decimal("0.2"),
+            )
+
+        assert result.success is True
+        assert result.short_order.exchange == "bybit"
+        assert result.short_order.filled_size == Decimal("0.2")
+        # Priced at the bybit book's mid as the fill is unknown
+        assert result.short_order.average_price == Decimal("50005")
+
     @pytest.mark.asyncio
     async def test_set_leverage_error_handled(self, executor, opportunity, mock_exchanges):
         """Test that leverage setting errors are handled gracefully."""
@@ -390,6 +565,35 @@ class TestExecutionEngine:
         # Execution should continue despite leverage error
         assert result.success is True
 
+    @pytest.mark.asyncio
+    async def test_set_leverage_failure_does_not_skip_other_exchange(
+        self, executor, mock_exchanges
+    ):
+        """Test that one failing leverage call still lets the other complete."""
+        mock_exchanges["bybit"].set_leverage.side_effect = Exception("Leverage error")
+
+        await executor._set_leverage("BTC/USDT:USDT", "bybit", "binance")
+
+        mock_exchanges["bybit"].set_leverage.assert_awaited_once_with("BTC/USDT:USDT", 5)
+        mock_exchanges["binance"].set_leverage.assert_awaited_once_with("BTC/USDT:USDT", 5)
+
+    @pytest.mark.asyncio
+    async def test_set_leverage_skips_unchanged_leverage(self, executor, mock_exchanges):
+        """Test that leverage is only sent again after a failure."""
+        mock_exchanges["bybit"].set_leverage.side_effect = Exception("Leverage error")
+        await executor._set_leverage("BTC/USDT:USDT", "bybit", "binance")
+
+        mock_exchanges["bybit"].set_leverage.side_effect = None
+        await executor._set_leverage("BTC/USDT:USDT", "bybit", "binance")
+        await executor._set_leverage("BTC/USDT:USDT", "bybit", "binance")
+
+        assert mock_exchanges["binance"].set_leverage.await_count == 1
+        assert mock_exchanges["bybit"].set_leverage.await_count == 2
+        assert executor._leverage_cache == {
+            ("binance", "BTC/USDT:USDT"): 5,
+            ("bybit", "BTC/USDT:USDT"): 5,
+        }
+
     @pytest.mark.asyncio
     async def test_execute_with_timeout_immediate_fill(self, executor, mock_exchanges):
         """Test order that fills immediately."""
@@ -422,6 +626,137 @@ class TestExecutionEngine:
         assert result is not None
         assert result.is_filled
 
+    @pytest.mark.asyncio
+    async def test_execute_with_timeout_uses_order_update_stream(
+        self, executor, mock_exchanges, mock_order_result
+    ):
+        """Test that a streamed fill is used instead of polling get_order."""
+        open_result = replace(
+            mock_order_result,
+            status=OrderStatus.OPEN,
+            filled_size=Decimal("0"),
+            average_price=None,
+        )
+        updates = asyncio.Queue()
+        updates.put_nowait(open_result)
+        updates.put_nowait(mock_order_result)
+        adapter = mock_exchanges["binance"]
+        adapter.place_order.return_value = open_result
+        adapter.subscribe_order_updates.return_value = updates
+
+        result = await executor._execute_with_timeout(
+            "binance",
+            "BTC/USDT:USDT",
+            OrderSide.BUY,
+            Decimal("0.2"),
+            Decimal("50005"),
+        )
+
+        assert result is mock_order_result
+        adapter.get_order.assert_not_awaited()
+        adapter.cancel_order.assert_not_awaited()
+        adapter.unsubscribe_order_updates.assert_awaited_once_with("order-123")
+
+    @pytest.mark.asyncio
+    async def test_execute_with_timeout_cancels_when_stream_is_silent(
+        self, executor, mock_exchanges, mock_order_result
+    ):
+        """Test that an order with no streamed fill is cancelled at the timeout."""
+        executor.config.order_fill_timeout_seconds = 0
+        adapter = mock_exchanges["binance"]
+        adapter.place_order.return_value = replace(
+            mock_order_result, status=OrderStatus.OPEN
+        )
+        adapter.subscribe_order_updates.return_value = asyncio.Queue()
+
+        result = await executor._execute_with_timeout(
+            "binance",
+            "BTC/USDT:USDT",
+            OrderSide.BUY,
+            Decimal("0.2"),
+            Decimal("50005"),
+        )
+
+        assert result is None
+        adapter.cancel_order.assert_awaited_once_with("order-123", "BTC/USDT:USDT")
+
+    @pytest.mark.asyncio
+    async def test_poll_order_backs_off_exponentially(
+        self, executor, mock_exchanges, mock_order_result
+    ):
+        """Test that polling starts fast and doubles up to the cap."""
+        open_result = replace(mock_order_result, status=OrderStatus.OPEN)
+        adapter = mock_exchanges["binance"]
+        adapter.get_order.side_effect = [open_result] * 5 + [mock_order_result]
+
+        with patch("backend.engine.executor.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await executor._poll_order(
+                adapter, "order-123", "BTC/USDT:USDT", timeout=30
+            )
+
+        assert result is mock_order_result
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert delays == pytest.approx([0.05, 0.1, 0.2, 0.4, 0.5, 0.5])
+
+    @pytest.mark.asyncio
+    async def test_resting_order_tracked_and_cancelled_on_shutdown(
+        self, executor, mock_exchanges, mock_order_result
+    ):
+        """Test that a resting limit order is pending until cancel_all_pending."""
+        open_result = replace(mock_order_result, status=OrderStatus.OPEN)
+        adapter = mock_exchanges["binance"]
+        adapter.place_order.return_value = open_result
+        adapter.subscribe_order_updates.return_value = asyncio.Queue()
+        adapter.cancel_order.return_value = True
+
+        task = asyncio.create_task(executor._execute_with_timeout(
+            "binance",
+            "BTC/USDT:USDT",
+            OrderSide.BUY,
+            Decimal("0.2"),
+            Decimal("50005"),
+        ))
+        await asyncio.sleep(0)
+        assert executor.pending_orders_count == 1
+
+        assert await executor.cancel_all_pending() == 1
+        adapter.cancel_order.assert_awaited_once_with("order-123", "BTC/USDT:USDT")
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Already cancelled by the shutdown sweep, so not cancelled again
+        adapter.cancel_order.assert_awaited_once()
+        assert executor.pending_orders_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_fill_wait_cancels_resting_order(
+        self, executor, mock_exchanges, mock_order_result
+    ):
+        """Test that cancelling a fill wait pulls its order from the exchange."""
+        open_result = replace(mock_order_result, status=OrderStatus.OPEN)
+        adapter = mock_exchanges["binance"]
+        adapter.place_order.return_value = open_result
+        adapter.subscribe_order_updates.return_value = asyncio.Queue()
+        adapter.cancel_order.return_value = True
+
+        task = asyncio.create_task(executor._execute_with_timeout(
+            "binance",
+            "BTC/USDT:USDT",
+            OrderSide.BUY,
+            Decimal("0.2"),
+            Decimal("50005"),
+        ))
+        await asyncio.sleep(0)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        adapter.cancel_order.assert_awaited_once_with("order-123", "BTC/USDT:USDT")
+        assert executor.pending_orders_count == 0
+        assert await executor.cancel_all_pending() == 0
+
     @pytest.mark.asyncio
     async def test_close_position_market_order(self, executor, mock_exchanges):
         """Test closing position with market order."""
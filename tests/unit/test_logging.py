@@ -0,0 +1,43 @@
+"""
+Unit tests for logging configuration.
+"""
+
+import json
+from enum import Enum
+
+import pytest
+import structlog
+
+from backend.utils.logging import setup_logging
+
+
+class Venue(Enum):
+    """Enum used as a dict key in log events."""
+    BINANCE = "binance"
+
+
+class TestJSONLogging:
+    """Tests for the production JSON log renderer."""
+
+    @pytest.fixture
+    def render(self):
+        """Configure JSON output and return its renderer."""
+        setup_logging(json_output=True)
+        yield structlog.get_config()["processors"][-1]
+        structlog.reset_defaults()
+
+    def test_renders_non_str_keys(self, render):
+        """Test that int- and enum-keyed dicts are rendered instead of raising."""
+        line = render(None, "info", {
+            "event": "leverage_set",
+            "by_exchange": {1: 5},
+            "by_venue": {Venue.BINANCE: 3},
+        })
+
+        assert json.loads(line)["by_exchange"] == {"1": 5}
+
+    def test_renders_wide_ints(self, render):
+        """Test that integers wider than 64 bits fall back to stdlib json."""
+        line = render(None, "info", {"event": "big", "value": 2 ** 70})
+
+        assert json.loads(line)["value"] == 2 ** 70
@@ -0,0 +1,209 @@
+"""
+Unit tests for position manager module.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+
+from backend.config.schema import DEFAULT_LEVERAGE
+from backend.database.models import OrderType as DbOrderType, Position, PositionStatus
+from backend.engine.executor import ExecutionResult
+from backend.engine.position_manager import PositionManager
+from backend.exchanges.types import (
+    ExchangePosition,
+    OrderResult,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    PositionSide,
+)
+
+
+def make_exchange_position(exchange: str, side: PositionSide, size: str) -> ExchangePosition:
+    """Build an exchange-side position for the test pair."""
+    return ExchangePosition(
+        exchange=exchange,
+        symbol="BTC/USDT:USDT",
+        side=side,
+        size=Decimal(size),
+        entry_price=Decimal("50000"),
+        mark_price=Decimal("50000"),
+        liquidation_price=None,
+        unrealized_pnl=Decimal("0"),
+        leverage=3,
+        margin_type="cross",
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+def make_order_result(exchange: str, side: OrderSide) -> OrderResult:
+    """Build a filled entry order for the test pair."""
+    return OrderResult(
+        order_id=f"{exchange}-order",
+        client_order_id=None,
+        exchange=exchange,
+        symbol="BTC/USDT:USDT",
+        side=side,
+        order_type=OrderType.LIMIT,
+        status=OrderStatus.FILLED,
+        size=Decimal("0.2"),
+        filled_size=Decimal("0.2"),
+        price=Decimal("50000"),
+        average_price=Decimal("50000"),
+        fee=Decimal("4.00"),
+        fee_currency="USDT",
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+class TestPositionManager:
+    """Tests for PositionManager."""
+
+    @pytest.fixture
+    def mock_exchanges(self):
+        """Create mock exchange adapters holding both legs of the position."""
+        bybit = MagicMock()
+        bybit.get_position = AsyncMock(
+            return_value=make_exchange_position("bybit", PositionSide.LONG, "0.2")
+        )
+        binance = MagicMock()
+        binance.get_position = AsyncMock(
+            return_value=make_exchange_position("binance", PositionSide.SHORT, "0.2")
+        )
+        return {"bybit": bybit, "binance": binance}
+
+    @pytest_asyncio.fixture
+    async def manager(self, async_session, mock_exchanges, sample_position):
+        """Create a position manager with one open position stored."""
+        async_session.add(Position(**sample_position))
+        await async_session.commit()
+        return PositionManager(async_session, mock_exchanges)
+
+    @pytest.mark.asyncio
+    async def test_reconcile_ok(self, manager, mock_exchanges):
+        """Test that matching exchange legs report no issues."""
+        issues = await manager.reconcile_with_exchanges()
+
+        assert issues == []
+        mock_exchanges["bybit"].get_position.assert_awaited_once_with("BTC/USDT:USDT")
+        mock_exchanges["binance"].get_position.assert_awaited_once_with("BTC/USDT:USDT")
+
+    @pytest.mark.asyncio
+    async def test_reconcile_reports_missing_and_failed_legs(self, manager, mock_exchanges):
+        """Test that a missing leg and a failed lookup are both reported."""
+        mock_exchanges["bybit"].get_position.return_value = None
+        mock_exchanges["binance"].get_position.side_effect = Exception("timeout")
+
+        issues = await manager.reconcile_with_exchanges()
+
+        assert issues == [
+            "Position test-pos-001: Long leg missing on bybit",
+            "Position test-pos-001: Error checking short leg - timeout",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reconcile_checks_legs_concurrently(self, manager, mock_exchanges):
+        """Test that both legs are requested before either lookup returns."""
+        both_requested = asyncio.Event()
+        requested = []
+
+        def lookup_after_both(position):
+            async def lookup(pair):
+                requested.append(pair)
+                if len(requested) == 2:
+                    both_requested.set()
+                await asyncio.wait_for(both_requested.wait(), timeout=1)
+                return position
+            return lookup
+
+        for adapter in mock_exchanges.values():
+            position = adapter.get_position.return_value
+            adapter.get_position = AsyncMock(side_effect=lookup_after_both(position))
+
+        assert await manager.reconcile_with_exchanges() == []
+
+    @pytest.mark.asyncio
+    async def test_record_funding_payments_updates_loaded_position(self, manager):
+        """Test that a position loaded in the session reflects recorded funding."""
+        from backend.database.models import OrderSide as DbOrderSide
+        from backend.engine.position_manager import FundingPayment
+
+        position = await manager.position_repo.get_by_id("test-pos-001")
+        await manager.record_funding_payments([
+            FundingPayment(
+                position_id="test-pos-001",
+                pair="BTC/USDT:USDT",
+                exchange="binance",
+                side=DbOrderSide.SHORT,
+                funding_rate=Decimal("0.0001"),
+                payment_usd=Decimal("1.00"),
+                position_size=Decimal("0.2"),
+            ),
+        ])
+
+        assert position.funding_collected == Decimal("1.00")
+
+    @pytest.mark.asyncio
+    async def test_create_position_reads_leverage_from_both_legs(
+        self, async_session, mock_exchanges
+    ):
+        """Test leverage lookup per leg, falling back to the default on error."""
+        mock_exchanges["binance"].get_position.side_effect = Exception("timeout")
+        manager = PositionManager(async_session, mock_exchanges)
+        opportunity = MagicMock(
+            symbol="BTC/USDT:USDT",
+            long_exchange="bybit",
+            short_exchange="binance",
+            spread=Decimal("0.0004"),
+        )
+        execution = ExecutionResult(
+            success=True,
+            long_order=make_order_result("bybit", OrderSide.BUY),
+            short_order=make_order_result("binance", OrderSide.SELL),
+        )
+
+        position = await manager.create_position(opportunity, execution, Decimal("10000"))
+
+        assert position.leverage_long == 3
+        assert position.leverage_short == DEFAULT_LEVERAGE
+
+    @pytest.mark.asyncio
+    async def test_create_and_close_position_records_trades(self, async_session, mock_exchanges):
+        """Test that opening and closing trades are stored with the position."""
+        manager = PositionManager(async_session, mock_exchanges)
+        opportunity = MagicMock(
+            symbol="BTC/USDT:USDT",
+            long_exchange="bybit",
+            short_exchange="binance",
+            spread=Decimal("0.0004"),
+        )
+        entry = ExecutionResult(
+            success=True,
+            long_order=make_order_result("bybit", OrderSide.BUY),
+            short_order=make_order_result("binance", OrderSide.SELL),
+        )
+
+        position = await manager.create_position(opportunity, entry, Decimal("10000"))
+        assert len(await manager.trade_repo.get_trades_for_position(position.id)) == 2
+        # The engine closes positions from a later session that loads the row
+        async_session.expunge_all()
+
+        exit_ = ExecutionResult(
+            success=True,
+            long_order=make_order_result("bybit", OrderSide.SELL),
+            short_order=make_order_result("binance", OrderSide.BUY),
+        )
+        closed = await manager.close_position(position.id, exit_)
+
+        trades = await manager.trade_repo.get_trades_for_position(position.id)
+        assert len(trades) == 4
+        assert {trade.order_type for trade in trades} == {DbOrderType.LIMIT}
+        assert closed.status == PositionStatus.CLOSED
+        assert closed.total_fees == Decimal("16.00")
+        # Flat prices: P&L is just the entry and exit fees
+        assert closed.realized_pnl == Decimal("-16.00")
@@ -9,7 +9,12 @@ import pytest
 import pytest_asyncio
 
 from backend.database.models import Position, Trade, FundingEvent, PositionStatus, OrderSide, OrderAction, OrderType, TradeStatus
-from backend.database.repository import PositionRepository, TradeRepository, FundingEventRepository
+from backend.database.repository import (
+    PositionRepository,
+    TradeRepository,
+    FundingEventRepository,
+    SystemStateRepository,
+)
 
 
 class TestPositionRepository:
@@ -44,12 +49,26 @@ class TestPositionRepository:
         assert retrieved is not None
         assert retrieved.id == sample_position["id"]
 
+    @pytest.mark.asyncio
+    async def test_get_by_id_uses_identity_map(self, position_repo, position):
+        """Test that a loaded position is returned without a new instance."""
+        retrieved = await position_repo.get_by_id(position.id)
+        assert retrieved is position
+
     @pytest.mark.asyncio
     async def test_get_by_id_not_found(self, position_repo):
         """Test getting non-existent position."""
         retrieved = await position_repo.get_by_id("nonexistent-id")
         assert retrieved is None
 
+    @pytest.mark.asyncio
+    async def test_repr_does_not_load_expired_attributes(self, async_session, position):
+        """Test that repr of an expired position does not emit SQL."""
+        async_session.expire(position)
+        assert repr(position) == (
+            "<Position(id=None, pair=None, long=None, short=None, status=None)>"
+        )
+
     @pytest.mark.asyncio
     async def test_get_open_positions(self, async_session, position_repo):
         """Test getting open positions."""
@@ -80,6 +99,52 @@ class TestPositionRepository:
         assert len(open_positions) == 1
         assert open_positions[0].id == "open-pos-1"
 
+    @pytest.mark.asyncio
+    async def test_get_open_pair_set(self, async_session, position_repo):
+        """Test projecting open positions down to their pairs."""
+        for i, status in enumerate([PositionStatus.OPEN, PositionStatus.OPEN, PositionStatus.CLOSED]):
+            async_session.add(Position(
+                id=f"pairs-{i}",
+                pair=f"PAIR{i}/USDT:USDT",
+                long_exchange="bybit",
+                short_exchange="binance",
+                size_usd=Decimal("10000"),
+                status=status,
+            ))
+        await async_session.commit()
+
+        assert await position_repo.get_open_pair_set() == {"PAIR0/USDT:USDT", "PAIR1/USDT:USDT"}
+
+    @pytest.mark.asyncio
+    async def test_iter_open_position_batches(self, async_session, position_repo):
+        """Test streaming open positions in fixed-size batches."""
+        for i in range(5):
+            async_session.add(Position(
+                id=f"stream-{i}",
+                pair=f"PAIR{i}/USDT:USDT",
+                long_exchange="bybit",
+                short_exchange="binance",
+                size_usd=Decimal("10000"),
+                status=PositionStatus.OPEN if i < 4 else PositionStatus.CLOSED,
+            ))
+        await async_session.commit()
+
+        batches = [
+            batch async for batch in position_repo.iter_open_position_batches(batch_size=3)
+        ]
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert {p.id for batch in batches for p in batch} == {f"stream-{i}" for i in range(4)}
+
+    @pytest.mark.asyncio
+    async def test_open_positions_raise_on_lazy_relationship(self, async_session, position_repo, position):
+        """Test that list queries refuse to lazy-load relationships."""
+        from sqlalchemy.exc import InvalidRequestError
+
+        async_session.expunge_all()
+        open_positions = await position_repo.get_open_positions()
+        with pytest.raises(InvalidRequestError):
+            open_positions[0].trades
+
     @pytest.mark.asyncio
     async def test_get_closed_positions(self, async_session, position_repo):
         """Test getting closed positions with pagination."""
@@ -125,6 +190,58 @@ class TestPositionRepository:
         assert float(updated.funding_collected) == 50.00
         assert updated.status == PositionStatus.CLOSED
 
+    @pytest.mark.asyncio
+    async def test_add_funding_and_fees_increment(self, async_session, position_repo, position):
+        """Test that funding and fees are incremented in place."""
+        position_id = position.id
+        await position_repo.add_funding(position_id, Decimal("12.50"))
+        await position_repo.add_funding(position_id, Decimal("2.50"))
+        await position_repo.add_fees(position_id, Decimal("1.25"))
+        await async_session.commit()
+
+        updated = await position_repo.get_by_id(position_id)
+        assert updated.funding_collected == Decimal("15.00")
+        assert updated.total_fees == Decimal("11.25")
+
+    @pytest.mark.asyncio
+    async def test_add_funding_many(self, async_session, position_repo):
+        """Test batched funding increments across positions."""
+        for i in range(2):
+            async_session.add(Position(
+                id=f"batch-{i}",
+                pair="BTC/USDT:USDT",
+                long_exchange="bybit",
+                short_exchange="binance",
+                size_usd=Decimal("10000"),
+                status=PositionStatus.OPEN,
+                funding_collected=Decimal("1.00"),
+            ))
+        await async_session.commit()
+
+        await position_repo.add_funding_many({
+            "batch-0": Decimal("2.00"),
+            "batch-1": Decimal("-0.50"),
+        })
+        await async_session.commit()
+        async_session.expire_all()
+
+        first = await position_repo.get_by_id("batch-0")
+        second = await position_repo.get_by_id("batch-1")
+        assert first.funding_collected == Decimal("3.00")
+        assert second.funding_collected == Decimal("0.50")
+
+    @pytest.mark.asyncio
+    async def test_add_funding_many_refreshes_loaded_position(self, position_repo, position):
+        """Test that a position loaded in the same session sees the new funding total."""
+        position_id = position.id
+        before = position.funding_collected
+
+        await position_repo.add_funding_many({position_id: Decimal("2.00")})
+
+        updated = await position_repo.get_by_id(position_id)
+        assert updated is position
+        assert updated.funding_collected == before + Decimal("2.00")
+
     @pytest.mark.asyncio
     async def test_count_open_positions(self, async_session, position_repo):
         """Test counting open positions."""
@@ -172,6 +289,61 @@ class TestPositionRepository:
         total = await position_repo.get_total_pnl()
         assert float(total) == 50.00
 
+    @pytest.mark.asyncio
+    async def test_get_portfolio_snapshot(self, async_session, position_repo):
+        """Test that counts and totals are aggregated in one snapshot."""
+        async_session.add_all([
+            Position(
+                id="snap-open",
+                pair="BTC/USDT:USDT",
+                long_exchange="bybit",
+                short_exchange="binance",
+                size_usd=Decimal("10000"),
+                status=PositionStatus.OPEN,
+                funding_collected=Decimal("4.00"),
+            ),
+            Position(
+                id="snap-closed",
+                pair="ETH/USDT:USDT",
+                long_exchange="bybit",
+                short_exchange="binance",
+                size_usd=Decimal("5000"),
+                status=PositionStatus.CLOSED,
+                realized_pnl=Decimal("25.00"),
+                funding_collected=Decimal("6.00"),
+                total_fees=Decimal("2.50"),
+            ),
+            Position(
+                id="snap-liquidated",
+                pair="SOL/USDT:USDT",
+                long_exchange="bybit",
+                short_exchange="binance",
+                size_usd=Decimal("5000"),
+                status=PositionStatus.LIQUIDATED,
+                realized_pnl=Decimal("-5.00"),
+                total_fees=Decimal("1.00"),
+            ),
+        ])
+        await async_session.commit()
+
+        snapshot = await position_repo.get_portfolio_snapshot()
+        assert snapshot.open_positions == 1
+        assert snapshot.closed_positions == 2
+        assert snapshot.profitable_positions == 1
+        assert snapshot.win_rate == 50.0
+        assert snapshot.total_realized_pnl == Decimal("20.00")
+        assert snapshot.total_funding_collected == Decimal("10.00")
+        assert snapshot.total_fees_paid == Decimal("3.50")
+
+    @pytest.mark.asyncio
+    async def test_get_portfolio_snapshot_empty(self, position_repo):
+        """Test snapshot defaults when there are no positions."""
+        snapshot = await position_repo.get_portfolio_snapshot()
+        assert snapshot.open_positions == 0
+        assert snapshot.total_realized_pnl == Decimal("0")
+        assert snapshot.total_funding_collected == Decimal("0")
+        assert snapshot.win_rate == 0.0
+
 
 class TestTradeRepository:
     """Tests for TradeRepository."""
@@ -225,6 +397,31 @@ class TestTradeRepository:
         trades = await repo.get_trades_for_position("pos-001")
         assert len(trades) == 3
 
+    @pytest.mark.asyncio
+    async def test_create_many(self, async_session):
+        """Test inserting a batch of trades with defaults filled in."""
+        repo = TradeRepository(async_session)
+
+        trades = await repo.create_many([
+            Trade(
+                position_id="pos-001",
+                exchange=exchange,
+                pair="BTC/USDT:USDT",
+                side=side,
+                action=OrderAction.OPEN,
+                order_type=OrderType.LIMIT,
+                size=Decimal("0.1"),
+            )
+            for exchange, side in [("binance", OrderSide.SHORT), ("bybit", OrderSide.LONG)]
+        ])
+        await async_session.commit()
+
+        assert all(trade.id and trade.created_at for trade in trades)
+        stored = await repo.get_trades_for_position("pos-001")
+        assert {trade.id for trade in stored} == {trade.id for trade in trades}
+        assert all(trade.status == TradeStatus.PENDING for trade in stored)
+        assert all(trade.fee == Decimal("0") for trade in stored)
+
 
 class TestFundingEventRepository:
     """Tests for FundingEventRepository."""
@@ -249,6 +446,64 @@ class TestFundingEventRepository:
         assert created.id == "funding-001"
         assert float(created.payment_usd) == 10.00
 
+    @pytest.mark.asyncio
+    async def test_create_many(self, async_session):
+        """Test inserting a batch of funding events."""
+        repo = FundingEventRepository(async_session)
+
+        events = await repo.create_many([
+            FundingEvent(
+                position_id="pos-001",
+                exchange=exchange,
+                pair="BTC/USDT:USDT",
+                side=side,
+                funding_rate=Decimal("0.0001"),
+                payment_usd=Decimal("10.00"),
+                position_size=Decimal("0.5"),
+            )
+            for exchange, side in [("binance", OrderSide.SHORT), ("bybit", OrderSide.LONG)]
+        ])
+        await async_session.commit()
+
+        assert all(event.id and event.timestamp for event in events)
+        stored = await repo.get_events_for_position("pos-001")
+        assert {event.id for event in stored} == {event.id for event in events}
+
+    @pytest.mark.asyncio
+    async def test_create_many_uses_copy_on_postgresql(self):
+        """Test that large PostgreSQL batches are written with COPY."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        raw_connection = MagicMock()
+        raw_connection.driver_connection.copy_records_to_table = AsyncMock()
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        session.connection = AsyncMock(return_value=connection)
+        session.execute = AsyncMock()
+
+        repo = FundingEventRepository(session)
+        event = FundingEvent(
+            position_id="pos-001",
+            exchange="binance",
+            pair="BTC/USDT:USDT",
+            side=OrderSide.SHORT,
+            funding_rate=Decimal("0.0001"),
+            payment_usd=Decimal("10.00"),
+            position_size=Decimal("0.5"),
+        )
+
+        with patch("backend.database.repository._FUNDING_EVENT_COPY_MIN_ROWS", 1):
+            await repo.create_many([event])
+
+        session.execute.assert_not_called()
+        copy = raw_connection.driver_connection.copy_records_to_table
+        copy.assert_awaited_once()
+        assert copy.call_args.args == ("funding_events",)
+        record = copy.call_args.kwargs["records"][0]
+        assert record[copy.call_args.kwargs["columns"].index("side")] == "SHORT"
+
     @pytest.mark.asyncio
     async def test_get_events_for_position(self, async_session):
         """Test getting funding events for a position."""
@@ -271,3 +526,21 @@ class TestFundingEventRepository:
 
         events = await repo.get_events_for_position("pos-001")
         assert len(events) == 5
+
+
+class TestSystemStateRepository:
+    """Tests for SystemStateRepository."""
+
+    @pytest.mark.asyncio
+    async def test_set_inserts_then_updates(self, async_session):
+        """Test that set() upserts a key."""
+        repo = SystemStateRepository(async_session)
+
+        await repo.set("engine_state", "RUNNING")
+        assert await repo.get("engine_state") == "RUNNING"
+
+        await repo.set("engine_state", "STOPPED")
+        await async_session.commit()
+
+        assert await repo.get("engine_state") == "STOPPED"
+        assert await repo.get_all() == {"engine_state": "STOPPED"}
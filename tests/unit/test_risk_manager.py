@@ -209,6 +209,36 @@ class TestRiskManager:
 
         assert risk_manager._kill_switch_active is True
 
+    @pytest.mark.asyncio
+    async def test_kill_switch_fan_out_isolates_exchange_failures(
+        self, risk_manager, mock_exchanges
+    ):
+        """Test that one failing exchange doesn't stop cancels or closes on another."""
+        mock_exchanges["bybit"].cancel_all_orders.side_effect = Exception("API error")
+        mock_exchanges["binance"].get_positions.side_effect = Exception("API error")
+        mock_exchanges["bybit"].get_positions.return_value = [
+            ExchangePosition(
+                exchange="bybit",
+                symbol="ETH/USDT:USDT",
+                side=PositionSide.SHORT,
+                size=Decimal("2"),
+                entry_price=Decimal("3000"),
+                mark_price=Decimal("3000"),
+                liquidation_price=None,
+                unrealized_pnl=Decimal("0"),
+                leverage=5,
+                margin_type="cross",
+                timestamp=datetime.now(timezone.utc),
+            ),
+        ]
+
+        assert await risk_manager._cancel_all_orders() == 5
+        assert await risk_manager._close_all_positions() == ["bybit:ETH/USDT:USDT"]
+
+        order = mock_exchanges["bybit"].place_order.call_args[0][0]
+        assert order.side == OrderSide.BUY
+        assert order.reduce_only is True
+
     # ==================== Risk Checks ====================
 
     def test_can_open_position_success(self, risk_manager):
@@ -341,6 +371,96 @@ class TestRiskManager:
 
         assert liquidations == []
 
+    @pytest.mark.asyncio
+    async def test_check_for_liquidations_detects_vanished_position(
+        self, risk_manager, mock_exchanges
+    ):
+        """Test a vanished position is reported while another exchange fails."""
+        last_pos = ExchangePosition(
+            exchange="bybit",
+            symbol="BTC/USDT:USDT",
+            side=PositionSide.LONG,
+            size=Decimal("0.1"),
+            entry_price=Decimal("50000"),
+            mark_price=Decimal("45100"),
+            liquidation_price=Decimal("45000"),
+            unrealized_pnl=Decimal("-490"),
+            leverage=10,
+            margin_type="cross",
+            timestamp=datetime.now(timezone.utc),
+        )
+        binance_last = {"ETH/USDT:USDT": MagicMock()}
+        risk_manager._last_positions = {
+            "bybit": {"BTC/USDT:USDT": last_pos},
+            "binance": binance_last,
+        }
+        mock_exchanges["binance"].get_positions.side_effect = Exception("API error")
+        mock_exchanges["bybit"].get_positions.return_value = []
+
+        liquidations = await risk_manager.check_for_liquidations()
+
+        assert [(l["exchange"], l["symbol"]) for l in liquidations] == [
+            ("bybit", "BTC/USDT:USDT"),
+        ]
+        assert risk_manager._last_positions["bybit"] == {}
+        # A failed poll keeps the previous snapshot for the next check
+        assert risk_manager._last_positions["binance"] is binance_last
+
+    @pytest.mark.asyncio
+    async def test_check_for_liquidations_bulk(self, risk_manager, mock_exchanges):
+        """Test that each exchange is queried once and missing legs are flagged."""
+        now = datetime.now(timezone.utc)
+
+        def exchange_position(exchange, symbol, side):
+            return ExchangePosition(
+                exchange=exchange,
+                symbol=symbol,
+                side=side,
+                size=Decimal("0.1"),
+                entry_price=Decimal("50000"),
+                mark_price=Decimal("50000"),
+                liquidation_price=None,
+                unrealized_pnl=Decimal("0"),
+                leverage=5,
+                margin_type="cross",
+                timestamp=now,
+            )
+
+        mock_exchanges["binance"].get_positions.return_value = [
+            exchange_position("binance", "BTC/USDT:USDT", PositionSide.LONG),
+            exchange_position("binance", "ETH/USDT:USDT", PositionSide.LONG),
+        ]
+        # ETH short leg is gone on bybit
+        mock_exchanges["bybit"].get_positions.return_value = [
+            exchange_position("bybit", "BTC/USDT:USDT", PositionSide.SHORT),
+        ]
+
+        positions = [
+            MagicMock(id="btc", pair="BTC/USDT:USDT", long_exchange="binance", short_exchange="bybit"),
+            MagicMock(id="eth", pair="ETH/USDT:USDT", long_exchange="binance", short_exchange="bybit"),
+        ]
+
+        result = await risk_manager.check_for_liquidations_bulk(positions)
+
+        assert result == {"btc": False, "eth": True}
+        mock_exchanges["binance"].get_positions.assert_awaited_once()
+        mock_exchanges["bybit"].get_positions.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_check_for_liquidations_bulk_skips_failed_exchange(self, risk_manager, mock_exchanges):
+        """Test that an exchange error is not reported as a liquidation."""
+        mock_exchanges["binance"].get_positions.side_effect = Exception("API error")
+        mock_exchanges["bybit"].get_positions.return_value = []
+
+        positions = [
+            MagicMock(id="btc", pair="BTC/USDT:USDT", long_exchange="binance", short_exchange="okx"),
+        ]
+
+        result = await risk_manager.check_for_liquidations_bulk(positions)
+
+        assert result == {"btc": False}
+        mock_exchanges["bybit"].get_positions.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_handle_liquidation(self, risk_manager, mock_exchanges):
         """Test handling a liquidation event."""
@@ -92,6 +92,22 @@ class TestFundingRateSchema:
         assert float(rate_1h.daily_rate) == pytest.approx(0.0024)
         assert float(rate_1h.daily_rate) == pytest.approx(float(rate_8h.daily_rate) * 8)
 
+    def test_funding_rate_float_views(self):
+        """Verify the cached float views mirror the Decimal fields."""
+        rate = FundingRate(
+            exchange="binance",
+            symbol="BTC/USDT:USDT",
+            rate=Decimal("0.0001"),
+            predicted_rate=None,
+            next_funding_time=datetime.now(timezone.utc),
+            timestamp=datetime.now(timezone.utc),
+        )
+
+        assert rate.rate_f == pytest.approx(0.0001)
+        assert rate.predicted_rate_f is None
+        # Converted once and kept on the instance
+        assert "rate_f" in rate.__dict__
+
     def test_funding_rate_has_interval_hours_field(self):
         """Verify FundingRate has interval_hours field."""
         from dataclasses import fields
@@ -0,0 +1,88 @@
+"""
+Unit tests for the WebSocket manager.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.api.websocket import WebSocketManager
+
+
+def make_websocket() -> MagicMock:
+    """Create a mock WebSocket whose sends complete immediately."""
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    websocket.close = AsyncMock()
+    return websocket
+
+
+class TestWebSocketManagerBroadcast:
+    """Tests for per-client outbound queues."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_delivers_in_order_to_each_client(self):
+        """Test that each client's writer sends queued frames in order."""
+        manager = WebSocketManager()
+        clients = [make_websocket(), make_websocket()]
+        for websocket in clients:
+            await manager.connect(websocket)
+
+        await manager.broadcast("FIRST", {"n": 1})
+        await manager.broadcast("SECOND", {"n": 2})
+        await asyncio.sleep(0)
+
+        for websocket in clients:
+            sent = [json.loads(call.args[0])["type"] for call in websocket.send_text.await_args_list]
+            assert sent == ["FIRST", "SECOND"]
+            manager.disconnect(websocket)
+
+        assert manager.connection_count == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_client_is_closed_without_blocking_others(self):
+        """Test that a client with a full queue is dropped and closed."""
+        manager = WebSocketManager()
+        fast = make_websocket()
+        slow = make_websocket()
+        blocked = asyncio.Event()
+
+        async def never_finishes(message):
+            await blocked.wait()
+
+        slow.send_text = AsyncMock(side_effect=never_finishes)
+        with patch("backend.api.websocket.CLIENT_QUEUE_SIZE", 2):
+            await manager.connect(fast)
+            await manager.connect(slow)
+
+        for n in range(5):
+            await manager.broadcast("TICK", {"n": n})
+            await asyncio.sleep(0)
+
+        assert manager.connection_count == 1
+        assert fast.send_text.await_count > 0
+
+        # Unblock the stuck send so the writer reaches the close frame
+        blocked.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        slow.close.assert_awaited_once()
+
+        manager.disconnect(fast)
+
+    @pytest.mark.asyncio
+    async def test_failed_send_removes_connection(self):
+        """Test that a send error unregisters the client."""
+        manager = WebSocketManager()
+        websocket = make_websocket()
+        websocket.send_text = AsyncMock(side_effect=RuntimeError("socket closed"))
+        await manager.connect(websocket)
+
+        await manager.broadcast("TICK", {})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert manager.connection_count == 0
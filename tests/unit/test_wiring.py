@@ -11,6 +11,7 @@ These tests verify that:
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone, timedelta
+from dataclasses import replace
 from decimal import Decimal
 
 from backend.engine.coordinator import TradingCoordinator, EngineState, get_ws_manager
@@ -61,6 +62,19 @@ def coordinator(trading_config, mock_exchanges):
 class TestWebSocketBroadcasts:
     """Tests for WebSocket broadcast wiring."""
 
+    @pytest.mark.asyncio
+    async def test_broadcast_failure_resolving_manager_is_contained(self, coordinator):
+        """Test that an error getting the WebSocket manager does not reach the caller."""
+        with patch(
+            'backend.engine.coordinator.get_ws_manager', side_effect=ImportError("no api")
+        ):
+            await coordinator._broadcast_position_update(
+                position_id="test-123",
+                status="OPEN",
+                unrealized_pnl=None,
+                funding_collected=0.0,
+            )
+
     @pytest.mark.asyncio
     async def test_broadcast_position_update(self, coordinator):
         """Test that position update is broadcast via WebSocket."""
@@ -221,6 +235,49 @@ class TestPositionCallbacks:
                     call_args = callback.call_args[0]
                     assert call_args[1] == "manual"
 
+    @pytest.mark.asyncio
+    async def test_execute_opportunity_broadcasts_opportunity(self, coordinator):
+        """Test that an executed opportunity is broadcast with its expected daily profit."""
+        now = datetime.now(timezone.utc)
+        opportunity = ArbitrageOpportunity(
+            symbol="BTC/USDT:USDT",
+            long_exchange="bybit",
+            short_exchange="binance",
+            long_interval_hours=8,
+            short_interval_hours=8,
+            long_rate=Decimal("-0.0001"),
+            short_rate=Decimal("0.0003"),
+            long_daily_rate=Decimal("-0.0003"),
+            short_daily_rate=Decimal("0.0009"),
+            daily_spread=Decimal("0.0012"),
+            spread=Decimal("0.0004"),
+            expected_daily_profit=Decimal("12.00"),
+            annualized_apr=Decimal("43.8"),
+            next_funding_time=now + timedelta(hours=4),
+            seconds_to_funding=14400.0,
+            detected_at=now,
+        )
+        coordinator.executor.execute_entry = AsyncMock(return_value=ExecutionResult(
+            success=True,
+            long_order=None,
+            short_order=None,
+        ))
+        mock_pm = MagicMock()
+        mock_pm.create_position = AsyncMock(return_value=MagicMock(id="pos-1"))
+
+        with patch('backend.engine.coordinator.get_ws_manager') as mock_get_ws:
+            mock_ws = MagicMock()
+            mock_ws.send_position_update = AsyncMock()
+            mock_ws.send_opportunity = AsyncMock()
+            mock_get_ws.return_value = mock_ws
+
+            await coordinator._execute_opportunity(mock_pm, opportunity)
+
+            mock_ws.send_opportunity.assert_awaited_once()
+            assert mock_ws.send_opportunity.call_args.kwargs["expected_profit"] == 12.0
+
+        await coordinator._stop_alert_sender()
+
     @pytest.mark.asyncio
     async def test_on_position_opened_callback_registered(self, coordinator):
         """Test that position opened callbacks can be registered."""
@@ -229,6 +286,33 @@ class TestPositionCallbacks:
 
         assert callback in coordinator._on_position_opened
 
+    @pytest.mark.asyncio
+    async def test_callbacks_run_concurrently_with_isolated_errors(self, coordinator):
+        """Test that callbacks run side by side and one failure does not stop others."""
+        import asyncio
+
+        second_started = asyncio.Event()
+        calls = []
+
+        async def waits_for_second(position, opportunity):
+            await asyncio.wait_for(second_started.wait(), timeout=1)
+            calls.append("first")
+
+        async def second(position, opportunity):
+            second_started.set()
+            calls.append("second")
+
+        async def failing(position, opportunity):
+            raise RuntimeError("boom")
+
+        await coordinator._dispatch_callbacks(
+            [waits_for_second, second, failing],
+            "position_opened_callback_error",
+            MagicMock(), MagicMock(),
+        )
+
+        assert sorted(calls) == ["first", "second"]
+
 
 class TestEngineStatusBroadcast:
     """Tests for engine status broadcasts on start/stop."""
@@ -289,12 +373,92 @@ class TestFundingRateBroadcast:
 
         with patch('backend.engine.coordinator.get_ws_manager') as mock_get_ws:
             mock_ws = MagicMock()
-            mock_ws.send_funding_rate_update = AsyncMock()
+            mock_ws.send_funding_rate_batch = AsyncMock()
             mock_get_ws.return_value = mock_ws
 
             await coordinator._broadcast_rates(rates)
 
-            mock_ws.send_funding_rate_update.assert_called_once()
+            mock_ws.send_funding_rate_batch.assert_called_once()
+            updates = mock_ws.send_funding_rate_batch.call_args[0][0]
+            assert [(u["exchange"], u["pair"], u["rate"]) for u in updates] == [
+                ("binance", "BTC/USDT:USDT", 0.0001)
+            ]
+
+
+class TestOpportunityQueue:
+    """Tests for handing rate snapshots to the opportunity consumer."""
+
+    @pytest.mark.asyncio
+    async def test_rates_update_keeps_only_latest_snapshot(self, coordinator):
+        """Test that an unconsumed snapshot is replaced by a newer one."""
+        stale = {"binance": {}}
+        latest = {"bybit": {}}
+
+        with patch('backend.engine.coordinator.get_ws_manager'):
+            await coordinator._on_rates_update(stale)
+            await coordinator._on_rates_update(latest)
+
+        assert coordinator._rates_queue.qsize() == 1
+        assert coordinator._rates_queue.get_nowait() is latest
+
+    @pytest.mark.asyncio
+    async def test_consumer_processes_until_shutdown(self, coordinator):
+        """Test that the consumer processes queued rates and exits on shutdown."""
+        import asyncio
+
+        rates = {"binance": {}}
+        coordinator._process_opportunities = AsyncMock()
+        task = asyncio.create_task(coordinator._opportunity_consumer())
+
+        coordinator._offer_rates(rates)
+        await asyncio.sleep(0)
+        coordinator._offer_rates(None)
+        await asyncio.wait_for(task, timeout=1)
+
+        coordinator._process_opportunities.assert_awaited_once_with(rates)
+
+
+class TestProcessOpportunities:
+    """Tests for session handling while processing opportunities."""
+
+    @pytest.mark.asyncio
+    async def test_read_session_closed_before_execution(self, coordinator):
+        """Test that open pairs are read in a session closed before execution."""
+        events = []
+
+        def make_session():
+            ctx = MagicMock()
+            ctx.__aenter__ = AsyncMock(side_effect=lambda: events.append("enter") or MagicMock())
+            ctx.__aexit__ = AsyncMock(side_effect=lambda *a: events.append("exit") or False)
+            return ctx
+
+        opportunity = MagicMock()
+        opportunity.symbol = "BTC/USDT:USDT"
+        opportunity.seconds_to_funding = 3600
+        coordinator.detector.find_best_opportunity = MagicMock(return_value=opportunity)
+        coordinator._execute_opportunity = AsyncMock(
+            side_effect=lambda pm, opp: events.append("execute")
+        )
+
+        with patch('backend.engine.coordinator.get_session', side_effect=make_session), \
+                patch('backend.engine.coordinator.PositionManager') as mock_pm_cls:
+            mock_pm_cls.return_value.get_open_pairs = AsyncMock(return_value=set())
+            await coordinator._process_opportunities({})
+
+        assert events == ["enter", "exit", "enter", "execute", "exit"]
+
+    @pytest.mark.asyncio
+    async def test_known_open_pairs_skip_db_read(self, coordinator):
+        """Test that cached open pairs are used without querying the DB."""
+        coordinator._open_pairs = {"BTC/USDT:USDT"}
+        coordinator.detector.find_best_opportunity = MagicMock(return_value=None)
+
+        with patch('backend.engine.coordinator.get_session') as mock_get_session:
+            await coordinator._process_opportunities({})
+
+        mock_get_session.assert_not_called()
+        _, kwargs = coordinator.detector.find_best_opportunity.call_args
+        assert kwargs["excluded_pairs"] == {"BTC/USDT:USDT"}
 
 
 class TestCoordinatorGetStatus:
@@ -317,6 +481,323 @@ class TestCoordinatorGetStatus:
 
         assert status.kill_switch_active is True
 
+    @pytest.mark.asyncio
+    async def test_get_status_uses_cached_portfolio_snapshot(self, coordinator):
+        """Test that the snapshot is queried once per TTL and feeds get_status."""
+        from backend.database.repository import PortfolioSnapshot
+
+        snapshot = PortfolioSnapshot(
+            open_positions=2,
+            total_realized_pnl=Decimal("10"),
+            total_funding_collected=Decimal("3"),
+        )
+        mock_session = MagicMock()
+        mock_session.__aenter__ = AsyncMock(return_value=MagicMock())
+        mock_session.__aexit__ = AsyncMock(return_value=False)
+
+        with patch('backend.engine.coordinator.get_session', return_value=mock_session), \
+                patch('backend.engine.coordinator.PositionRepository') as mock_repo_cls:
+            mock_repo_cls.return_value.get_portfolio_snapshot = AsyncMock(return_value=snapshot)
+
+            assert await coordinator.get_portfolio_snapshot() is snapshot
+            assert await coordinator.get_portfolio_snapshot() is snapshot
+
+            mock_repo_cls.return_value.get_portfolio_snapshot.assert_awaited_once()
+
+        assert coordinator.get_status().open_positions == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_snapshot_requests_share_one_query(self, coordinator):
+        """Test that concurrent refreshes are coalesced into a single query."""
+        import asyncio
+        from backend.database.repository import PortfolioSnapshot
+
+        snapshot = PortfolioSnapshot(
+            open_positions=1,
+            total_realized_pnl=Decimal("0"),
+            total_funding_collected=Decimal("0"),
+        )
+        release = asyncio.Event()
+
+        async def slow_snapshot():
+            await release.wait()
+            return snapshot
+
+        mock_session = MagicMock()
+        mock_session.__aenter__ = AsyncMock(return_value=MagicMock())
+        mock_session.__aexit__ = AsyncMock(return_value=False)
+
+        with patch('backend.engine.coordinator.get_session', return_value=mock_session), \
+                patch('backend.engine.coordinator.PositionRepository') as mock_repo_cls:
+            mock_repo_cls.return_value.get_portfolio_snapshot = AsyncMock(side_effect=slow_snapshot)
+
+            callers = [asyncio.create_task(coordinator.get_portfolio_snapshot()) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*callers)
+
+            mock_repo_cls.return_value.get_portfolio_snapshot.assert_awaited_once()
+
+        assert all(result is snapshot for result in results)
+
+
+class TestFundingChecks:
+    """Tests for concurrent funding checks."""
+
+    @pytest.mark.asyncio
+    async def test_leg_rates_fetched_per_exchange(self, coordinator, mock_exchanges):
+        """Test that each exchange gets one multi-symbol request and failures are isolated."""
+        now = datetime.now(timezone.utc)
+
+        def make_rate(exchange, symbol):
+            return FundingRate(
+                exchange=exchange,
+                symbol=symbol,
+                rate=Decimal("0.0001"),
+                predicted_rate=None,
+                next_funding_time=now + timedelta(hours=4),
+                timestamp=now,
+                interval_hours=8,
+            )
+
+        async def binance_rates(symbols):
+            return {s: make_rate("binance", s) for s in symbols}
+
+        mock_exchanges["binance"].get_funding_rates = AsyncMock(side_effect=binance_rates)
+        mock_exchanges["bybit"].get_funding_rates = AsyncMock(side_effect=RuntimeError("exchange down"))
+
+        positions = [
+            MagicMock(pair="BTC/USDT:USDT", long_exchange="binance", short_exchange="bybit"),
+            MagicMock(pair="BTC/USDT:USDT", long_exchange="bybit", short_exchange="binance"),
+            MagicMock(pair="ETH/USDT:USDT", long_exchange="binance", short_exchange="bybit"),
+        ]
+
+        rates = await coordinator._fetch_leg_rates(positions)
+
+        assert set(rates) == {
+            ("binance", "BTC/USDT:USDT"),
+            ("binance", "ETH/USDT:USDT"),
+        }
+        mock_exchanges["binance"].get_funding_rates.assert_awaited_once_with(
+            ["BTC/USDT:USDT", "ETH/USDT:USDT"]
+        )
+        mock_exchanges["bybit"].get_funding_rates.assert_awaited_once()
+
+
+    def test_funding_payment_window_uses_sweep_time(self, coordinator):
+        """Test that a leg is paid only within five minutes after its funding time."""
+        now = datetime.now(timezone.utc)
+        # Funding was applied 2 minutes ago, so the next one is 8h after that
+        next_funding = now - timedelta(minutes=2) + timedelta(hours=8)
+
+        def make_rate(exchange):
+            return FundingRate(
+                exchange=exchange,
+                symbol="BTC/USDT:USDT",
+                rate=Decimal("0.001"),
+                predicted_rate=None,
+                next_funding_time=next_funding,
+                timestamp=now,
+                interval_hours=8,
+                mark_price=Decimal("50000"),
+            )
+
+        rates = {
+            ("binance", "BTC/USDT:USDT"): make_rate("binance"),
+            ("bybit", "BTC/USDT:USDT"): make_rate("bybit"),
+        }
+        position = MagicMock(
+            id="pos-1", pair="BTC/USDT:USDT",
+            long_exchange="binance", short_exchange="bybit",
+            long_size=Decimal("10"), short_size=Decimal("10"),
+        )
+
+        payments = coordinator._check_funding_payment(position, rates, now.timestamp())
+        assert len(payments) == 2
+
+        # A second sweep inside the window does not record the same event again
+        soon = (now + timedelta(seconds=30)).timestamp()
+        assert coordinator._check_funding_payment(position, rates, soon) == []
+
+        coordinator._funding_recorded.clear()
+        later = (now + timedelta(minutes=10)).timestamp()
+        assert coordinator._check_funding_payment(position, rates, later) == []
+
+    def test_funding_payment_sign_and_notional(self, coordinator):
+        """Test that funding is charged on notional and a positive rate debits the long."""
+        from backend.database.models import OrderSide as DbOrderSide
+
+        now = datetime.now(timezone.utc)
+        next_funding = now - timedelta(minutes=2) + timedelta(hours=8)
+
+        def make_rate(exchange, rate, mark_price):
+            return FundingRate(
+                exchange=exchange,
+                symbol="BTC/USDT:USDT",
+                rate=Decimal(rate),
+                predicted_rate=None,
+                next_funding_time=next_funding,
+                timestamp=now,
+                interval_hours=8,
+                mark_price=mark_price,
+            )
+
+        position = MagicMock(
+            id="pos-1", pair="BTC/USDT:USDT",
+            long_exchange="binance", short_exchange="bybit",
+            long_size=Decimal("0.2"), short_size=Decimal("0.2"),
+            long_entry_price=Decimal("49000"), short_entry_price=Decimal("51000"),
+        )
+        rates = {
+            # Long leg pays 0.01% of 0.2 x 50,000
+            ("binance", "BTC/USDT:USDT"): make_rate("binance", "0.0001", Decimal("50000")),
+            # Short leg pays on a negative rate; no mark, so the entry price is used
+            ("bybit", "BTC/USDT:USDT"): make_rate("bybit", "-0.0002", None),
+        }
+
+        payments = coordinator._check_funding_payment(position, rates, now.timestamp())
+
+        assert [(p.side, p.payment_usd) for p in payments] == [
+            (DbOrderSide.LONG, Decimal("-1.00")),
+            (DbOrderSide.SHORT, Decimal("-2.04")),
+        ]
+
+    def test_next_funding_wakeup_follows_open_pair_funding(self, coordinator):
+        """Test that the sweep is pulled forward to just after an open pair's funding time."""
+        from backend.engine.coordinator import FUNDING_CHECK_INTERVAL_SECONDS, FUNDING_SETTLE_SECONDS
+
+        now = datetime.now(timezone.utc)
+        rate = FundingRate(
+            exchange="binance",
+            symbol="BTC/USDT:USDT",
+            rate=Decimal("0.0001"),
+            predicted_rate=None,
+            next_funding_time=now + timedelta(seconds=60),
+            timestamp=now,
+        )
+        coordinator.scanner.get_rates = MagicMock(return_value={"binance": {"BTC/USDT:USDT": rate}})
+
+        coordinator._open_pairs = set()
+        assert coordinator._next_funding_wakeup(now.timestamp()) == FUNDING_CHECK_INTERVAL_SECONDS
+
+        coordinator._open_pairs = {"BTC/USDT:USDT"}
+        assert coordinator._next_funding_wakeup(now.timestamp()) == pytest.approx(60 + FUNDING_SETTLE_SECONDS)
+
+        # Funding time passed but the exchange has not rolled over yet: retry soon
+        after = (now + timedelta(seconds=90)).timestamp()
+        assert coordinator._next_funding_wakeup(after) == FUNDING_SETTLE_SECONDS
+
+
+class TestFundingLoopShutdown:
+    """Tests for stopping the funding payment loop."""
+
+    @pytest.mark.asyncio
+    async def test_stop_wakes_idle_funding_loop(self, coordinator):
+        """Test that stop() ends the funding loop without waiting out its interval."""
+        import asyncio
+
+        coordinator._state = EngineState.RUNNING
+        coordinator._funding_task = asyncio.create_task(coordinator._funding_loop())
+        funding_task = coordinator._funding_task
+        await asyncio.sleep(0)
+        coordinator.scanner.stop = AsyncMock()
+
+        with patch('backend.engine.coordinator.get_ws_manager') as mock_get_ws:
+            mock_get_ws.return_value.send_engine_status = AsyncMock()
+            await asyncio.wait_for(coordinator.stop(), timeout=1)
+
+        assert funding_task.done()
+        assert not funding_task.cancelled()
+        assert coordinator.state == EngineState.STOPPED
+
+
+    @pytest.mark.asyncio
+    async def test_sweep_skipped_without_open_positions(self, coordinator):
+        """Test that no session is opened while no position is open and a resync is recent."""
+        import asyncio
+        import time
+
+        coordinator._state = EngineState.RUNNING
+        coordinator._open_pairs = set()
+        coordinator._last_funding_sweep_at = time.monotonic()
+
+        with patch('backend.engine.coordinator.FUNDING_CHECK_INTERVAL_SECONDS', 0), \
+                patch('backend.engine.coordinator.get_session') as mock_get_session:
+            task = asyncio.create_task(coordinator._funding_loop())
+            for _ in range(5):
+                await asyncio.sleep(0)
+            coordinator._state = EngineState.STOPPED
+            coordinator._stop_event.set()
+            await asyncio.wait_for(task, timeout=1)
+
+        mock_get_session.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_sweep_keeps_pairs_opened_while_it_runs(self, coordinator):
+        """Test that a pair opened during a sweep is not dropped from the open pairs."""
+        import asyncio
+
+        position = MagicMock(id="pos-1", pair="BTC/USDT:USDT")
+
+        async def batches():
+            yield [position]
+
+        async def open_pair_meanwhile(positions, now_ts):
+            # The opportunity consumer opens ETH while the sweep awaits rates
+            coordinator._open_pairs.add("ETH/USDT:USDT")
+            coordinator._state = EngineState.STOPPED
+            return []
+
+        session_ctx = MagicMock()
+        session_ctx.__aenter__ = AsyncMock(return_value=MagicMock())
+        session_ctx.__aexit__ = AsyncMock(return_value=False)
+
+        coordinator._state = EngineState.RUNNING
+        coordinator._open_pairs = {"BTC/USDT:USDT"}
+        coordinator._check_funding_payments = AsyncMock(side_effect=open_pair_meanwhile)
+        coordinator._check_liquidations = AsyncMock()
+        coordinator._record_funding_payments = AsyncMock()
+
+        with patch('backend.engine.coordinator.FUNDING_CHECK_INTERVAL_SECONDS', 0), \
+                patch('backend.engine.coordinator.get_session', return_value=session_ctx), \
+                patch('backend.engine.coordinator.PositionManager') as mock_pm_cls:
+            mock_pm_cls.return_value.iter_open_position_batches = batches
+            await asyncio.wait_for(coordinator._funding_loop(), timeout=1)
+
+        assert coordinator._open_pairs == {"BTC/USDT:USDT", "ETH/USDT:USDT"}
+
+
+class TestAlertQueue:
+    """Tests for background alert delivery."""
+
+    @pytest.mark.asyncio
+    async def test_send_alert_does_not_wait_for_delivery(self, trading_config, mock_exchanges):
+        """Test that alerts are queued and delivered by the background sender."""
+        import asyncio
+
+        release = asyncio.Event()
+        delivered = []
+
+        async def slow_callback(severity, title, message):
+            await release.wait()
+            delivered.append(title)
+
+        coordinator = TradingCoordinator(
+            config=trading_config,
+            exchanges=mock_exchanges,
+            alert_callback=slow_callback,
+        )
+
+        await asyncio.wait_for(coordinator._send_alert("INFO", "Position Opened", "msg"), timeout=1)
+        assert delivered == []
+
+        release.set()
+        await coordinator._stop_alert_sender()
+
+        assert delivered == ["Position Opened"]
+        assert coordinator._alert_task is None
+
 
 class TestLiquidationCheck:
     """Tests for liquidation checking in funding loop."""
@@ -330,7 +811,7 @@ class TestLiquidationCheck:
         mock_position.long_exchange = "binance"
         mock_position.short_exchange = "bybit"
 
-        coordinator.risk_manager.check_for_liquidation = AsyncMock(return_value=False)
+        coordinator.risk_manager.check_for_liquidations_bulk = AsyncMock(return_value={"test-123": False})
 
         with patch('backend.engine.coordinator.get_ws_manager') as mock_get_ws:
             mock_ws = MagicMock()
@@ -339,11 +820,7 @@ class TestLiquidationCheck:
             mock_pm = MagicMock()
             await coordinator._check_liquidations(mock_pm, [mock_position])
 
-            coordinator.risk_manager.check_for_liquidation.assert_called_once_with(
-                "BTC/USDT:USDT",
-                "binance",
-                "bybit",
-            )
+            coordinator.risk_manager.check_for_liquidations_bulk.assert_awaited_once_with([mock_position])
 
     @pytest.mark.asyncio
     async def test_check_liquidations_alerts_on_detection(self, coordinator, mock_exchanges):
@@ -354,7 +831,7 @@ class TestLiquidationCheck:
         mock_position.long_exchange = "binance"
         mock_position.short_exchange = "bybit"
 
-        coordinator.risk_manager.check_for_liquidation = AsyncMock(return_value=True)
+        coordinator.risk_manager.check_for_liquidations_bulk = AsyncMock(return_value={"test-123": True})
         coordinator._send_alert = AsyncMock()
 
         with patch('backend.engine.coordinator.get_ws_manager') as mock_get_ws:
@@ -369,6 +846,107 @@ class TestLiquidationCheck:
             assert "Liquidation" in coordinator._send_alert.call_args[0][1]
 
 
+class TestFundingPayments:
+    """Tests for batched funding payment recording."""
+
+    @pytest.mark.asyncio
+    async def test_record_funding_payments_batches_and_broadcasts(self, coordinator):
+        """Test that a sweep's payments are written once and broadcast as one batch."""
+        from backend.database.models import OrderSide as DbOrderSide
+        from backend.engine.position_manager import FundingPayment
+
+        mock_position = MagicMock()
+        mock_position.id = "test-123"
+        mock_position.funding_collected = Decimal("1.0")
+
+        payments = [
+            (mock_position, FundingPayment(
+                position_id="test-123",
+                pair="BTC/USDT:USDT",
+                exchange=exchange,
+                side=side,
+                funding_rate=Decimal("0.0001"),
+                payment_usd=Decimal("2.0"),
+                position_size=Decimal("0.2"),
+            ))
+            for exchange, side in [("binance", DbOrderSide.LONG), ("bybit", DbOrderSide.SHORT)]
+        ]
+
+        def record(batch):
+            # The write refreshes positions loaded in the session
+            mock_position.funding_collected += sum(p.payment_usd for p in batch)
+
+        mock_pm = MagicMock()
+        mock_pm.record_funding_payments = AsyncMock(side_effect=record)
+        callback = AsyncMock()
+        coordinator._on_funding_received.append(callback)
+
+        with patch('backend.engine.coordinator.get_ws_manager') as mock_get_ws:
+            mock_ws = MagicMock()
+            mock_ws.send_position_update_batch = AsyncMock()
+            mock_get_ws.return_value = mock_ws
+
+            await coordinator._record_funding_payments(mock_pm, payments)
+
+            mock_pm.record_funding_payments.assert_called_once_with(
+                [payment for _, payment in payments]
+            )
+            assert callback.call_count == 2
+            # One update per position, carrying its new funding total
+            mock_ws.send_position_update_batch.assert_called_once_with([{
+                "position_id": "test-123",
+                "status": "OPEN",
+                "unrealized_pnl": None,
+                "funding_collected": 5.0,
+            }])
+
+    @pytest.mark.asyncio
+    async def test_failed_funding_write_is_retried(self, coordinator):
+        """Test that payments whose write failed are found again by the next sweep."""
+        now = datetime.now(timezone.utc)
+        rate = FundingRate(
+            exchange="binance",
+            symbol="BTC/USDT:USDT",
+            rate=Decimal("0.0001"),
+            predicted_rate=None,
+            next_funding_time=now - timedelta(minutes=2) + timedelta(hours=8),
+            timestamp=now,
+            mark_price=Decimal("50000"),
+        )
+        rates = {
+            ("binance", "BTC/USDT:USDT"): rate,
+            ("bybit", "BTC/USDT:USDT"): replace(rate, exchange="bybit"),
+        }
+        position = MagicMock(
+            id="pos-1", pair="BTC/USDT:USDT",
+            long_exchange="binance", short_exchange="bybit",
+            long_size=Decimal("0.2"), short_size=Decimal("0.2"),
+        )
+        payments = [
+            (position, payment)
+            for payment in coordinator._check_funding_payment(position, rates, now.timestamp())
+        ]
+        assert len(payments) == 2
+
+        mock_pm = MagicMock()
+        mock_pm.record_funding_payments = AsyncMock(side_effect=RuntimeError("db down"))
+        with pytest.raises(RuntimeError):
+            await coordinator._record_funding_payments(mock_pm, payments)
+
+        retry = coordinator._check_funding_payment(position, rates, now.timestamp() + 30)
+        assert [p.payment_usd for p in retry] == [p.payment_usd for _, p in payments]
+
+    @pytest.mark.asyncio
+    async def test_record_funding_payments_empty(self, coordinator):
+        """Test that an empty sweep does not touch the database."""
+        mock_pm = MagicMock()
+        mock_pm.record_funding_payments = AsyncMock()
+
+        await coordinator._record_funding_payments(mock_pm, [])
+
+        mock_pm.record_funding_payments.assert_not_called()
+
+
 class TestWebSocketManagerLazyImport:
     """Tests for lazy WebSocket manager import."""
 